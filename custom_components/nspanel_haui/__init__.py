@@ -21,6 +21,15 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 PLATFORMS: list[str] = ["notify"]
 
+# hass.data[DOMAIN] keys of the services shared by all hubs
+_SHARED_SERVICES = (
+    "_state_mux",
+    "_event_demux",
+    "_timer_service",
+    "_clock_service",
+    "_endpoint_index",
+)
+
 # Config helpers - moved to haui/device_config.py for single source of truth
 from .haui.device_config import (  # noqa: E402
     apply_panel_store,
@@ -304,6 +313,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     name: str = entry.data["name"]
 
+    # Shared ESPHome endpoint index used by every device proxy (closed
+    # again when the last hub unloads)
+    from .endpoint_index import get_endpoint_index
+
+    get_endpoint_index(hass).async_start()
+
     options = dict(entry.options)
 
     panels: dict[str, Any] | None
@@ -393,7 +408,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         dapp._ha_device_id = resolved
                         proxy = dapp._plugin_proxies.get("ESPHome")
                         if proxy is not None:
-                            proxy._device_id = resolved
+                            # Route this device's events to the app from now on
+                            proxy.async_set_device_id(resolved)
                         await _link_esphome_device(hass, entry, resolved, dname)
                         _LOGGER.info("Resolved HA device_id for '%s': %s", dname, resolved)
             # Once all are resolved, cancel the listener
@@ -511,11 +527,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if cancel is not None:
         cancel()
 
-    if apps is None:
-        return True
-
     errors = False
-    for _device_name, app in apps.items():
+    for _device_name, app in (apps or {}).items():
         if not await _stop_app(hass, app):
             errors = True
         # Remove our config_entry_id from the ESPHome device so it no
@@ -535,9 +548,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     _device_name,
                     exc_info=True,
                 )
+
+    # Last hub gone: tear down the services shared by all hubs
+    if not any(not key.startswith("_") for key in hass.data[DOMAIN]):
+        _async_close_shared_services(hass)
     return not errors
 
 
+def _async_close_shared_services(hass: HomeAssistant) -> None:
+    """Close and drop the hub-wide services (see their ``get_*`` accessors).
+
+    Removes their HA listeners and timers; the next hub set up creates them
+    again.
+    """
+    data = hass.data.get(DOMAIN, {})
+    for key in _SHARED_SERVICES:
+        service = data.pop(key, None)
+        if service is not None:
+            service.async_close()
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old config entry to new version."""
     from .config_flow import NSPanelHAUIConfigFlow
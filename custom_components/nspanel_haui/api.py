@@ -152,6 +152,37 @@ class DeviceStatusView(HomeAssistantView):
 
         return self.json({"devices": result})
 
+    async def post(self, request, entry_id: str):
+        """Reset the transport telemetry of one or all running devices.
+
+        JSON body may carry an optional ``device`` field (device name, or ``*``
+        for all devices).  When omitted defaults to ``*``.
+        """
+        hass = request.app["hass"]
+        body = await request.json() or {}
+        device_name = (body.get("device") or "*").strip()
+
+        apps = hass.data.get("nspanel_haui", {}).get(entry_id)
+        if not isinstance(apps, dict):
+            return self.json(
+                {"status": "error", "message": "No running devices"},
+                status_code=400,
+            )
+
+        if device_name != "*":
+            app = apps.get(device_name)
+            if app is None:
+                return self.json(
+                    {"status": "error", "message": f'Device "{device_name}" not found'},
+                    status_code=404,
+                )
+            app.reset_telemetry()
+            return self.json({"status": "ok", "devices_reset": [device_name]})
+
+        for app in apps.values():
+            app.reset_telemetry()
+        return self.json({"status": "ok", "devices_reset": list(apps)})
+
     @staticmethod
     def _build_minimal_device_info(hass: Any, dev_name: str) -> dict | None:
         """Build minimal status from HA entities for a device without a running app."""
@@ -0,0 +1,151 @@
+"""Hub-wide clock ticks on the minute and hour boundaries.
+
+Clock, clock two and weather pages redraw their time every minute and their
+date every hour.  Each device used to run its own minute and hour timers,
+so ten panels meant ten timers, ten executor jobs and ten sets of identical
+time and date strings formatted per minute.
+
+:class:`ClockService` runs one timer per cadence on the HA event loop,
+aligned to the boundary in the HA timezone, and calls the subscribers of every
+device in a single executor job in the ``BACKGROUND`` lane.  The strings
+the pages format are memoized per minute (see ``haui/utils/datetime.py``),
+so each distinct (format, locale, timezone) string is formatted once per
+tick, by the first page that needs it, and the other pages reuse it.
+
+One service is shared by every device of every hub (see
+:func:`get_clock_service`).  :meth:`ClockService.subscribe` and
+:meth:`ClockService.unsubscribe` can be called from any thread.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .haui.utils.command import CommandPriority, command_priority
+from .haui.utils.datetime import get_now
+from .haui.utils.loop_batch import call_soon, loop_batch
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "nspanel_haui"
+_DATA_KEY = "_clock_service"
+
+# Tick period in seconds per cadence
+CADENCES = {"minute": 60, "hour": 3600}
+
+# Seconds a tick fires after the boundary, so the loop clock firing a
+# little early never formats the previous minute
+_MARGIN = 0.05
+
+
+class ClockService:
+    """Minute and hour ticks shared by the pages of all devices."""
+
+    def __init__(self, hass: Any) -> None:
+        self._hass = hass
+        self._loop = hass.loop
+        self._lock = threading.Lock()
+        # Ordered sets of callbacks per cadence
+        self._subscribers: dict[str, dict[Callable, None]] = {c: {} for c in CADENCES}
+        # Loop timer per running cadence (event loop only)
+        self._timers: dict[str, Any] = {}
+        # Ticks dispatched / subscriber calls made (diagnostics)
+        self.ticks = 0
+        self.calls = 0
+
+    def subscribe(self, cadence: str, callback: Callable[[dict], None]) -> None:
+        """Call *callback* on every *cadence* boundary ("minute" or "hour")."""
+        if cadence not in CADENCES:
+            raise ValueError(f"Unknown tick cadence: {cadence}")
+        with self._lock:
+            subscribers = self._subscribers[cadence]
+            first = not subscribers
+            subscribers[callback] = None
+        if first:
+            call_soon(self._loop, self._async_update, cadence)
+
+    def unsubscribe(self, cadence: str, callback: Callable[[dict], None]) -> None:
+        """Stop calling *callback*; the cadence timer stops with its last subscriber."""
+        with self._lock:
+            subscribers = self._subscribers.get(cadence)
+            if not subscribers or subscribers.pop(callback, 0) is not None:
+                return
+            last = not subscribers
+        if last:
+            call_soon(self._loop, self._async_update, cadence)
+
+    def async_close(self) -> None:
+        """Stop every cadence timer and drop the subscribers (integration unload)."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        with self._lock:
+            for subscribers in self._subscribers.values():
+                subscribers.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            subscribers = {c: len(s) for c, s in self._subscribers.items()}
+        return {"subscribers": subscribers, "ticks": self.ticks, "calls": self.calls}
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _async_update(self, cadence: str) -> None:
+        with self._lock:
+            active = bool(self._subscribers[cadence])
+        if active and cadence not in self._timers:
+            self._async_schedule(cadence)
+        elif not active and cadence in self._timers:
+            self._timers.pop(cadence).cancel()
+
+    def _async_schedule(self, cadence: str) -> None:
+        # Recomputed from the wall clock every tick, so ticks do not drift.
+        # Local time, not epoch time: in zones with a :30 or :45 offset the
+        # hour (and the date) changes in the middle of a UTC hour
+        timezone = getattr(getattr(self._hass, "config", None), "time_zone", None)
+        delay = seconds_to_boundary(get_now(timezone), CADENCES[cadence]) + _MARGIN
+        self._timers[cadence] = self._loop.call_later(delay, self._async_fire, cadence)
+
+    def _async_fire(self, cadence: str) -> None:
+        self._timers.pop(cadence, None)
+        with self._lock:
+            callbacks = tuple(self._subscribers[cadence])
+        if not callbacks:
+            return
+        self._async_schedule(cadence)
+        self.ticks += 1
+        self._hass.async_add_executor_job(self._dispatch, cadence, callbacks)
+
+    def _dispatch(self, cadence: str, callbacks: tuple[Callable[[dict], None], ...]) -> None:
+        subscribers = self._subscribers[cadence]
+        with command_priority(CommandPriority.BACKGROUND), loop_batch():
+            for callback in callbacks:
+                # Skip pages that stopped since the tick fired
+                if callback not in subscribers:
+                    continue
+                self.calls += 1
+                try:
+                    callback({})
+                except Exception:  # noqa: BLE001
+                    _LOGGER.exception("Clock tick callback %s failed", callback)
+
+
+def seconds_to_boundary(now: datetime.datetime, period: float) -> float:
+    """Seconds from *now* to its next multiple of *period* since local midnight."""
+    elapsed = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+    return period - elapsed % period
+
+
+def get_clock_service(hass: Any) -> ClockService:
+    """Return the clock service shared by all devices of *hass*."""
+    data = hass.data.setdefault(DOMAIN, {})
+    service = data.get(_DATA_KEY)
+    if service is None:
+        service = data[_DATA_KEY] = ClockService(hass)
+    return service
@@ -0,0 +1,47 @@
+"""Diagnostics download for NSPanel HAUI.
+
+Includes, per running device, the transport telemetry, the event handler
+statistics and the event trace (per-stage latency of the latest events,
+when the device setting ``event_trace`` is enabled), plus the counts of the
+shared entity state trackers, the display value cache, the timers and the
+clock ticks.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from . import DOMAIN
+from .clock_service import get_clock_service
+from .haui.utils.item import display_cache
+from .state_mux import get_state_mux
+from .timer_service import get_timer_service
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a hub config entry."""
+    apps = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not isinstance(apps, dict):
+        apps = {}
+    devices: dict[str, Any] = {}
+    for name, app in apps.items():
+        trace = app.event_trace
+        devices[name] = {
+            "connected": app.device.connected,
+            "telemetry": app.telemetry.as_dict(),
+            "event_handlers": app.event_router.as_dict(),
+            "event_trace": trace.as_list() if trace is not None else None,
+        }
+    return {
+        "devices": devices,
+        "state_subscriptions": get_state_mux(hass).as_dict(),
+        "display_cache": display_cache.as_dict(),
+        "timers": get_timer_service(hass).as_dict(),
+        "clock": get_clock_service(hass).as_dict(),
+    }
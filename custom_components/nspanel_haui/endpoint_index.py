@@ -0,0 +1,174 @@
+"""Shared index of ESPHome device endpoints.
+
+Resolving where a published command goes used to scan every ESPHome config
+entry (normalising each device name) and then every user service of the
+device, for every call.  :class:`EndpointIndex` keeps the result:
+
+    normalised device name → ESPHome config entry → ``{service name: UserService}``
+
+The name → entry map is built once and rebuilt lazily after an ESPHome
+config entry was added, removed, loaded or unloaded.  The service map of a
+device is rebuilt after its availability changed (the device shares its
+service definitions again on every reconnect), and after a lookup misses,
+so a service that appeared in between is never reported as missing.
+
+One index is shared by every device of every hub (see :func:`get_endpoint_index`).
+All methods run on the event loop.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from .esphome_helpers import normalize_device_name
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "nspanel_haui"
+_DATA_KEY = "_endpoint_index"
+
+
+class _Endpoint:
+    __slots__ = ("entry", "runtime_data", "services", "unsubscribe")
+
+    def __init__(self, entry: Any) -> None:
+        self.entry = entry
+        self.runtime_data: Any = None
+        self.services: dict[str, Any] | None = None
+        self.unsubscribe: Callable[[], None] | None = None
+
+
+class EndpointIndex:
+    """Device name → runtime entry data → service-name dictionary (event loop only)."""
+
+    def __init__(self, hass: Any) -> None:
+        self._hass = hass
+        self._endpoints: dict[str, _Endpoint] | None = None
+        self._unsub_entries: Callable[[], None] | None = None
+        self.rebuilds = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def async_start(self) -> None:
+        """Invalidate the index whenever an ESPHome config entry changes."""
+        if self._unsub_entries is not None:
+            return
+        from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
+        from homeassistant.core import callback
+        from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+        @callback
+        def _on_entry_changed(_change: Any, entry: Any) -> None:
+            if getattr(entry, "domain", None) == "esphome":
+                self.invalidate()
+
+        self._unsub_entries = async_dispatcher_connect(
+            self._hass, SIGNAL_CONFIG_ENTRY_CHANGED, _on_entry_changed
+        )
+
+    def async_close(self) -> None:
+        """Drop the index and stop watching config entries (integration unload)."""
+        self.invalidate()
+        if self._unsub_entries is not None:
+            self._unsub_entries()
+            self._unsub_entries = None
+
+    def invalidate(self) -> None:
+        """Drop the index; it is rebuilt on the next lookup."""
+        if self._endpoints is None:
+            return
+        for endpoint in self._endpoints.values():
+            self._unsubscribe(endpoint)
+        self._endpoints = None
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def runtime_data(self, device_name: str) -> Any | None:
+        """Return the ``RuntimeEntryData`` of *device_name*, or ``None``.
+
+        ``None`` when no ESPHome config entry matches the name or its
+        ``runtime_data`` has not been populated yet.
+        """
+        endpoint = self._endpoint(device_name)
+        if endpoint is None:
+            return None
+        return self._attach(endpoint)
+
+    def service(self, device_name: str, name: str) -> Any | None:
+        """Return the ``UserService`` *name* of *device_name*, or ``None``."""
+        endpoint = self._endpoint(device_name)
+        if endpoint is None:
+            return None
+        runtime_data = self._attach(endpoint)
+        if runtime_data is None:
+            return None
+        if endpoint.services is not None:
+            service = endpoint.services.get(name)
+            if service is not None:
+                return service
+        # Not indexed yet, or the device shared new definitions since
+        endpoint.services = {
+            service.name: service
+            for service in runtime_data.services.values()
+            if hasattr(service, "name")
+        }
+        return endpoint.services.get(name)
+
+    def _endpoint(self, device_name: str) -> _Endpoint | None:
+        if not device_name:
+            return None
+        if self._endpoints is None:
+            self._build()
+        return self._endpoints.get(normalize_device_name(device_name))  # type: ignore[union-attr]
+
+    def _build(self) -> None:
+        self.rebuilds += 1
+        endpoints: dict[str, _Endpoint] = {}
+        for entry in self._hass.config_entries.async_entries("esphome"):
+            dev_name = entry.data.get("device_name", "")
+            if dev_name:
+                # First entry wins, as in the former linear scan
+                endpoints.setdefault(normalize_device_name(dev_name), _Endpoint(entry))
+        _LOGGER.debug("ESPHome endpoint index built (%d devices)", len(endpoints))
+        self._endpoints = endpoints
+
+    def _attach(self, endpoint: _Endpoint) -> Any | None:
+        """Return the entry's runtime data, (re)subscribing when it was replaced."""
+        runtime_data = getattr(endpoint.entry, "runtime_data", None)
+        if runtime_data is not endpoint.runtime_data:
+            self._unsubscribe(endpoint)
+            endpoint.runtime_data = runtime_data
+            endpoint.services = None
+            subscribe = getattr(runtime_data, "async_subscribe_device_updated", None)
+            if subscribe is not None:
+
+                def _on_device_updated() -> None:
+                    # Availability changed: services are shared again on connect
+                    endpoint.services = None
+
+                endpoint.unsubscribe = subscribe(_on_device_updated)
+        return runtime_data
+
+    @staticmethod
+    def _unsubscribe(endpoint: _Endpoint) -> None:
+        if endpoint.unsubscribe is not None:
+            try:
+                endpoint.unsubscribe()
+            except Exception:  # noqa: BLE001
+                _LOGGER.debug("ESPHome endpoint index: unsubscribe failed", exc_info=True)
+            endpoint.unsubscribe = None
+
+
+def get_endpoint_index(hass: Any) -> EndpointIndex:
+    """Return the endpoint index shared by all devices of *hass*."""
+    data = hass.data.setdefault(DOMAIN, {})
+    index = data.get(_DATA_KEY)
+    if index is None:
+        index = data[_DATA_KEY] = EndpointIndex(hass)
+    return index
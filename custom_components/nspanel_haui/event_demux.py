@@ -0,0 +1,169 @@
+"""Integration-wide demultiplexer for device events.
+
+Every panel publishes its events as ``esphome.nspanel_event`` on the HA
+bus, tagged with the HA ``device_id`` of the panel.  Letting every app
+listen on the bus and discard the events of other panels wakes N callbacks
+per event for N panels.  :class:`EventDemux` registers a single bus
+listener per event type and hands each event only to the subscribers of
+its device:
+
+    ``device_id`` → subscribers (the ESPHome proxies of that device)
+
+Subscribers without a device id (not resolved yet) still receive every
+event, like the unfiltered per-app listener did.  When the id is resolved
+later (see ``_resolve_device_id`` in ``__init__.py``), the subscription is
+moved with :meth:`EventDemux.async_set_device_id`.
+
+One demultiplexer is shared by every device of every hub (see
+:func:`get_event_demux`).  All methods run on the event loop.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "nspanel_haui"
+_DATA_KEY = "_event_demux"
+
+
+class EventSubscription:
+    """A subscriber of the events of one device."""
+
+    __slots__ = ("callback", "device_id", "event_type")
+
+    def __init__(
+        self, event_type: str, device_id: str | None, callback: Callable[[Any], None]
+    ) -> None:
+        self.event_type = event_type
+        self.device_id = device_id
+        self.callback = callback
+
+
+class _Route:
+    """Bus listener and subscribers of one event type."""
+
+    __slots__ = ("by_device", "unresolved", "unsubscribe")
+
+    def __init__(self) -> None:
+        self.by_device: dict[str, tuple[EventSubscription, ...]] = {}
+        self.unresolved: tuple[EventSubscription, ...] = ()
+        self.unsubscribe: Callable[[], None] | None = None
+
+
+class EventDemux:
+    """One bus listener per event type, routing events by ``device_id`` (event loop only)."""
+
+    def __init__(self, hass: Any) -> None:
+        self._hass = hass
+        self._routes: dict[str, _Route] = {}
+        # Events routed / events no subscriber was interested in
+        self.routed = 0
+        self.unrouted = 0
+
+    def async_subscribe(
+        self, event_type: str, device_id: str | None, callback: Callable[[Any], None]
+    ) -> EventSubscription:
+        """Call *callback* with every *event_type* event of *device_id*.
+
+        With ``device_id=None`` the callback receives the events of every device.
+        """
+        route = self._routes.get(event_type)
+        if route is None:
+            route = self._routes[event_type] = _Route()
+        if route.unsubscribe is None:
+            route.unsubscribe = self._listen(event_type, route)
+        subscription = EventSubscription(event_type, device_id, callback)
+        self._add(route, subscription)
+        return subscription
+
+    def async_unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove *subscription*; the bus listener goes with the last subscriber."""
+        route = self._routes.get(subscription.event_type)
+        if route is None:
+            return
+        self._remove(route, subscription)
+        if not route.by_device and not route.unresolved:
+            if route.unsubscribe is not None:
+                route.unsubscribe()
+            del self._routes[subscription.event_type]
+
+    def async_set_device_id(self, subscription: EventSubscription, device_id: str | None) -> None:
+        """Move *subscription* to a (late resolved) device id."""
+        if device_id == subscription.device_id:
+            return
+        route = self._routes.get(subscription.event_type)
+        if route is None:
+            subscription.device_id = device_id
+            return
+        self._remove(route, subscription)
+        subscription.device_id = device_id
+        self._add(route, subscription)
+
+    def async_close(self) -> None:
+        """Remove every bus listener right away (integration unload)."""
+        for route in self._routes.values():
+            if route.unsubscribe is not None:
+                route.unsubscribe()
+        self._routes.clear()
+
+    def device_ids(self, event_type: str) -> list[str]:
+        """Device ids with at least one subscriber (diagnostics)."""
+        route = self._routes.get(event_type)
+        return sorted(route.by_device) if route is not None else []
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _listen(self, event_type: str, route: _Route) -> Callable[[], None]:
+        from homeassistant.core import callback as ha_callback  # noqa: PLC0415
+
+        @ha_callback
+        def _on_event(event: Any) -> None:
+            data = event.data or {}
+            subscribers = route.by_device.get(data.get("device_id"), ())
+            unresolved = route.unresolved
+            if not subscribers and not unresolved:
+                self.unrouted += 1
+                return
+            self.routed += 1
+            for subscription in subscribers:
+                subscription.callback(event)
+            for subscription in unresolved:
+                subscription.callback(event)
+
+        return self._hass.bus.async_listen(event_type, _on_event)
+
+    @staticmethod
+    def _add(route: _Route, subscription: EventSubscription) -> None:
+        device_id = subscription.device_id
+        if device_id:
+            route.by_device[device_id] = route.by_device.get(device_id, ()) + (subscription,)
+        else:
+            route.unresolved = route.unresolved + (subscription,)
+
+    @staticmethod
+    def _remove(route: _Route, subscription: EventSubscription) -> None:
+        device_id = subscription.device_id
+        if device_id:
+            subscriptions = route.by_device.get(device_id, ())
+            remaining = tuple(s for s in subscriptions if s is not subscription)
+            if remaining:
+                route.by_device[device_id] = remaining
+            else:
+                route.by_device.pop(device_id, None)
+        else:
+            route.unresolved = tuple(s for s in route.unresolved if s is not subscription)
+
+
+def get_event_demux(hass: Any) -> EventDemux:
+    """Return the event demultiplexer shared by all devices of *hass*."""
+    data = hass.data.setdefault(DOMAIN, {})
+    demux = data.get(_DATA_KEY)
+    if demux is None:
+        demux = data[_DATA_KEY] = EventDemux(hass)
+    return demux
@@ -0,0 +1,150 @@
+"""Per-device ordered event pipeline.
+
+Device events arrive on the HA event loop and are handled by the
+synchronous haui/ core on executor threads.  Submitting one executor job
+per event let bursts of touch, gesture and component events run
+concurrently on different threads and complete out of order.
+
+:class:`EventPipeline` queues the events of one device and drains them
+with a single consumer: the first event of a burst schedules one executor
+job, which handles every event queued until the pipeline is empty again.
+Events of a device are therefore handled strictly in arrival order, one at
+a time, with one thread hop per burst instead of one per event.
+
+While the consumer is busy, an event that supersedes the event queued right
+before it replaces that event instead of queueing behind it (see
+:func:`device_event_key`): repeated heartbeats, repeated ``touch_start`` and
+repeated presses of the same component collapse into one.  Only adjacent
+events arriving within :data:`COALESCE_WINDOW` are merged, so the order of
+the remaining events never changes.  Page acks, handshake steps,
+``read_response``, ``touch_end`` and gestures are never merged.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from .haui.mapping.const import ESPEvent, ServerRequest
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds within which a superseding event replaces the queued one
+COALESCE_WINDOW = 0.25
+
+# Events that only matter as their latest occurrence
+_LATEST_WINS = frozenset({ServerRequest.HEARTBEAT, ESPEvent.TOUCH_START, ESPEvent.TOUCH})
+
+
+def device_event_key(name: str, value: Any) -> Hashable | None:
+    """Coalescing key of a device event (``None``: never coalesced).
+
+    Two adjacent queued events with the same key are merged into the later one.
+    """
+    if name in _LATEST_WINS:
+        return name
+    if name == ESPEvent.COMPONENT:
+        # "page,component,touch_event": repeated presses (or releases) of one
+        # component; a press is never merged with its release
+        return (name, value)
+    return None
+
+
+class EventPipeline:
+    """Ordered single-consumer queue of device events.
+
+    Parameters
+    ----------
+    hass
+        Home Assistant instance, used to schedule the consumer on the
+        executor (``hass.async_add_executor_job``).
+    handler
+        Called on the consumer thread with every queued item, in order.
+    label
+        Name used in log messages (usually the device name).
+    coalesce_key
+        Optional; returns the coalescing key of an item (``None``: keep).
+        An item replaces the last queued item if both have the same key and
+        arrived within ``window`` seconds.
+    window
+        Coalescing window in seconds.
+    """
+
+    def __init__(
+        self,
+        hass: Any,
+        handler: Callable[[Any], None],
+        label: str = "",
+        coalesce_key: Callable[[Any], Hashable | None] | None = None,
+        window: float = COALESCE_WINDOW,
+    ) -> None:
+        self._hass = hass
+        self._handler = handler
+        self._label = label
+        self._coalesce_key = coalesce_key
+        self._window = window
+        self._lock = threading.Lock()
+        self._pending: deque[Any] = deque()
+        # Key and arrival time of the last queued item (valid while pending)
+        self._tail_key: Hashable | None = None
+        self._tail_time = 0.0
+        self._running = False
+        # Executor jobs started / items handled (one job per burst) / items
+        # replaced by a superseding item
+        self.bursts = 0
+        self.handled = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def async_put(self, item: Any) -> bool:
+        """Queue an item and start the consumer if idle (event loop only).
+
+        Returns ``False`` if the item replaced a superseded queued item.
+        """
+        key = self._coalesce_key(item) if self._coalesce_key is not None else None
+        now = time.monotonic() if key is not None else 0.0
+        with self._lock:
+            pending = self._pending
+            if (
+                key is not None
+                and pending
+                and key == self._tail_key
+                and now - self._tail_time <= self._window
+            ):
+                pending[-1] = item
+                self.coalesced += 1
+                return False
+            pending.append(item)
+            self._tail_key = key
+            self._tail_time = now
+            if self._running:
+                return True
+            self._running = True
+        self.bursts += 1
+        self._hass.async_add_executor_job(self._drain)
+        return True
+
+    def clear(self) -> None:
+        """Drop all items not handled yet (safe to call from any thread)."""
+        with self._lock:
+            self._pending.clear()
+
+    def _drain(self) -> None:
+        """Consumer: handle queued items in order until the queue is empty."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._running = False
+                    return
+                item = self._pending.popleft()
+            try:
+                self._handler(item)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Event pipeline '%s': handler failed", self._label)
+            self.handled += 1
@@ -6,12 +6,28 @@ Bridges Home Assistant's async API to the synchronous interface used by haui/ co
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
+from .endpoint_index import get_endpoint_index
+from .event_demux import EventSubscription, get_event_demux
+from .event_pipeline import EventPipeline, device_event_key
 from .haui.mapping.const import ESPAction, NotificationAction
+from .haui.utils.adaptive_chunker import DEFAULT_CHUNK_LEN, MAX_CHUNK_COMMANDS
+from .haui.utils.command import CommandPriority, command_priority, current_priority
+from .haui.utils.event_trace import EventTrace, current_trace
+from .haui.utils.loop_batch import call_soon, loop_batch
+from .haui.utils.state_snapshot import current_snapshot
+from .haui.utils.telemetry import TransportTelemetry
+from .outbound_queue import OutboundQueue
+from .state_mux import StateSubscription, get_state_mux
+from .timer_service import get_timer_service
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +36,21 @@ _LOGGER = logging.getLogger(__name__)
 _TARGET_KEYS = frozenset({"entity_id", "device_id", "area_id", "floor_id", "label_id"})
 
 
+_NO_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
+
+def _read_state(hass: Any, entity_id: str) -> Any:
+    """HA state of *entity_id*, from the render snapshot of the calling thread if any."""
+    snapshot = current_snapshot()
+    if snapshot is None:
+        return hass.states.get(entity_id)
+    try:
+        return snapshot[entity_id]
+    except KeyError:
+        state = snapshot[entity_id] = hass.states.get(entity_id)
+        return state
+
+
 class ItemProxy:
     """Wraps a HA state entry to provide a simple synchronous entity interface."""
 
@@ -38,13 +69,20 @@ class ItemProxy:
 
     @property
     def state(self) -> Any:
-        s = self._hass.states.get(self.entity_id)
+        s = _read_state(self._hass, self.entity_id)
         return s.state if s else None
 
     @property
-    def attributes(self) -> dict[str, Any]:
-        s = self._hass.states.get(self.entity_id)
-        return dict(s.attributes) if s else {}
+    def attributes(self) -> Mapping[str, Any]:
+        """Read-only view of the entity's attributes (not a copy)."""
+        s = _read_state(self._hass, self.entity_id)
+        return MappingProxyType(s.attributes) if s else _NO_ATTRIBUTES
+
+    @property
+    def last_updated(self) -> Any:
+        """Time of the last state or attribute change (identifies the state version)."""
+        s = _read_state(self._hass, self.entity_id)
+        return s.last_updated if s else None
 
     def get_state(self) -> Any:
         return self.state
@@ -129,7 +167,10 @@ class ESPHomeProxy:
     bus indirection.
 
     Device events are still received via the HA event bus (the ESPHome
-    firmware publishes them through ``homeassistant.event``).
+    firmware publishes them through ``homeassistant.event``), demultiplexed
+    by device id by the shared :class:`EventDemux` and handed to the
+    device's :class:`EventPipeline`, which processes them in arrival order
+    on one executor thread per burst.
     """
 
     def __init__(
@@ -143,7 +184,28 @@ class ESPHomeProxy:
         self._loop = loop
         self._device_name = device_name
         self._device_id: str | None = device_id
-        self._event_listeners: list[Callable] = []
+        self._event_subscriptions: list[EventSubscription] = []
+        self._demux = get_event_demux(hass)
+        self._events = EventPipeline(
+            hass, self._handle_event, label=device_name, coalesce_key=self._coalesce_key
+        )
+        self._outbound = OutboundQueue(
+            loop,
+            self._async_publish,
+            label=device_name,
+            on_lost=lambda item: self._command_lost(item.name),
+            limits=self._merge_limits,
+        )
+        # Called with the action name whenever a published command did not
+        # reach the device (set by the app to invalidate its display shadow).
+        self.on_command_lost: Callable[[str], None] | None = None
+        # Optional AdaptiveChunker: measures send_commands round trips and
+        # returns the pause to keep before the next chunk.
+        self.pacer: Any = None
+        self._telemetry: TransportTelemetry | None = None
+        # Optional per-device event trace (set by the app when enabled)
+        self.trace: EventTrace | None = None
+        self._endpoints = get_endpoint_index(hass)
 
     def listen_event(
         self,
@@ -161,32 +223,53 @@ class ESPHomeProxy:
         """
 
         def _event_cb(event: Any) -> None:
+            # The demultiplexer only passes events of this device (or every
+            # event while the device id is not resolved yet)
             data = event.data or {}
-
-            # Filter by HA device_id so each app only receives events for its device
-            if self._device_id and data.get("device_id") != self._device_id:
-                return
-
-            # Pass to sync callback on executor thread
+            # Pass to sync callback on the device's event consumer thread
             wrapped_data = {
                 "name": data.get("name", ""),
                 "value": data.get("value", ""),
             }
-            self._hass.async_add_executor_job(cb, event.event_type, wrapped_data, {})
+            trace = self.trace
+            if trace is not None:
+                record = trace.new(wrapped_data["name"], wrapped_data["value"])
+                fired = getattr(event, "time_fired_timestamp", None)
+                if isinstance(fired, float):
+                    record.add("bus", max(0.0, time.time() - fired))
+                wrapped_data["trace"] = record
+            if not self._events.async_put((cb, event.event_type, wrapped_data)):
+                self._count("events_coalesced")
 
         async def _subscribe() -> None:
-            from homeassistant.core import callback as ha_callback  # noqa: PLC0415
-
-            remove = self._hass.bus.async_listen(event_type, ha_callback(_event_cb))
-            self._event_listeners.append(remove)
+            self._event_subscriptions.append(
+                self._demux.async_subscribe(event_type, self._device_id, _event_cb)
+            )
 
         asyncio.run_coroutine_threadsafe(_subscribe(), self._loop).result(timeout=10)
 
+    def async_set_device_id(self, device_id: str | None) -> None:
+        """Receive the events of a late resolved HA device id (event loop only)."""
+        self._device_id = device_id
+        for subscription in self._event_subscriptions:
+            self._demux.async_set_device_id(subscription, device_id)
+
     def cancel_listen_events(self) -> None:
-        """Cancel all event bus listeners registered via listen_event."""
-        for remove in self._event_listeners:
-            self._loop.call_soon_threadsafe(remove)
-        self._event_listeners.clear()
+        """Cancel all event subscriptions registered via listen_event."""
+        for subscription in self._event_subscriptions:
+            self._loop.call_soon_threadsafe(self._demux.async_unsubscribe, subscription)
+        self._event_subscriptions.clear()
+        self._events.clear()
+
+    @staticmethod
+    def _handle_event(item: tuple[Callable, str, dict[str, Any]]) -> None:
+        cb, event_type, data = item
+        cb(event_type, data, {})
+
+    @staticmethod
+    def _coalesce_key(item: tuple[Callable, str, dict[str, Any]]) -> Hashable | None:
+        data = item[2]
+        return device_event_key(data["name"], data["value"])
 
     # Actions that take no parameters
     _PARAMETERLESS_ACTIONS: set[str] = {
@@ -203,36 +286,21 @@ class ESPHomeProxy:
     _NOTIFICATION_ACTIONS = set(member.value for member in NotificationAction)
 
     def _get_runtime_entry_data(self) -> Any | None:
-        """Find the ESPHome config entry for this device and return its RuntimeEntryData.
+        """Return the RuntimeEntryData of this device's ESPHome config entry.
 
         Returns ``None`` when the ESPHome config entry has not been found or
-        ``entry.runtime_data`` has not been populated yet.
+        ``entry.runtime_data`` has not been populated yet.  Resolved through
+        the shared :class:`~.endpoint_index.EndpointIndex` (event loop only).
         """
-        from .esphome_helpers import normalize_device_name
+        return self._endpoints.runtime_data(self._device_name)
 
-        if not self._device_name:
-            return None
-        normalized = normalize_device_name(self._device_name)
-        for entry in self._hass.config_entries.async_entries("esphome"):
-            dev_name = entry.data.get("device_name", "")
-            if dev_name and normalize_device_name(dev_name) == normalized:
-                try:
-                    return entry.runtime_data
-                except AttributeError:
-                    return None
-        return None
-
-    @staticmethod
-    def _find_service(services: dict[int, Any], name: str) -> Any | None:
-        """Find a UserService by name in the ESPHome services dict (keyed by int key).
+    def _find_service(self, name: str) -> Any | None:
+        """Find this device's UserService by name.
 
         Returns the service object, or ``None`` if not found (device has not
         yet shared its service definitions).
         """
-        for service in services.values():
-            if hasattr(service, "name") and service.name == name:
-                return service
-        return None
+        return self._endpoints.service(self._device_name, name)
 
     def _build_service_data(self, name: str, value: Any) -> dict[str, Any]:
         """Build ESPHome service data from action name and value.
@@ -283,82 +351,151 @@ class ESPHomeProxy:
 
         return service_data
 
-    def publish(self, name: str, value: str | dict | list = "") -> None:
-        """Execute a service on the ESPHome device via its native API client.
+    def publish(
+        self,
+        name: str,
+        value: str | dict | list = "",
+        priority: CommandPriority | None = None,
+    ) -> None:
+        """Queue a service call on the ESPHome device and return immediately.
 
-        Looks up the device's ``RuntimeEntryData`` (populated by the ESPHome
-        integration), finds the matching ``UserService`` by name, and calls
-        ``APIClient.execute_service()`` directly — bypassing the HA service
-        bus entirely.
+        The call is appended to this device's :class:`OutboundQueue` and
+        delivered by its writer task on the event loop (see
+        :meth:`_async_publish`).  Items are delivered one at a time, so the
+        chunks of a single ``send_cmds`` batch reach the ESP32 sequentially
+        without blocking the calling executor thread.
 
         Args:
             name: Service/action name (e.g. ``"send_command"``, ``"set_brightness"``).
             value: Parameter value matching the action's declared variable
                 type.  ``str`` for single-value actions, ``list`` for
                 ``send_commands``, ``dict`` for ``hub_connection_response``.
+            priority: Outbound lane; defaults to the priority of the calling
+                thread (see :func:`haui.utils.command.command_priority`).
         """
+        self._outbound.put(
+            name, value, current_priority() if priority is None else priority, current_trace()
+        )
 
-        async def _call_service() -> None:
-            try:
-                service_data = self._build_service_data(name, value)
-
-                entry_data = self._get_runtime_entry_data()
-                if entry_data is None:
-                    _LOGGER.warning(
-                        "ESPHome publish('%s'): no ESPHome entry found for device '%s'"
-                        " — command will be lost",
-                        name,
-                        self._device_name,
-                    )
-                    return
+    async def _async_publish(self, name: str, value: Any) -> bool:
+        """Execute a service on the ESPHome device via its native API client.
 
-                if not entry_data.available or entry_data.client is None:
-                    _LOGGER.warning(
-                        "ESPHome publish('%s'): device '%s' not available — command deferred",
-                        name,
-                        self._device_name,
-                    )
-                    return
+        Looks up the device's ``RuntimeEntryData`` (populated by the ESPHome
+        integration), finds the matching ``UserService`` by name, and calls
+        ``APIClient.execute_service()`` directly — bypassing the HA service
+        bus entirely.  Runs on the event loop as the outbound queue's writer.
+        Returns ``False`` if the command was lost before reaching the device.
+        """
+        service_data = self._build_service_data(name, value)
 
-                service = self._find_service(entry_data.services, name)
-                if service is None:
-                    _LOGGER.warning(
-                        "ESPHome publish('%s'): service not found on device '%s'"
-                        " — device may not have shared its definitions yet",
-                        name,
-                        self._device_name,
-                    )
-                    return
+        entry_data = self._get_runtime_entry_data()
+        if entry_data is None:
+            _LOGGER.warning(
+                "ESPHome publish('%s'): no ESPHome entry found for device '%s'"
+                " — command will be lost",
+                name,
+                self._device_name,
+            )
+            self._count("unavailable")
+            self._command_lost(name)
+            return False
 
-                _LOGGER.info(
-                    "→ ESPHome native: %s %s",
-                    name,
-                    service_data if service_data else "(no args)",
-                )
+        if not entry_data.available or entry_data.client is None:
+            _LOGGER.warning(
+                "ESPHome publish('%s'): device '%s' not available — command deferred",
+                name,
+                self._device_name,
+            )
+            self._count("unavailable")
+            self._command_lost(name)
+            return False
 
-                await entry_data.client.execute_service(service, service_data)
+        service = self._find_service(name)
+        if service is None:
+            _LOGGER.warning(
+                "ESPHome publish('%s'): service not found on device '%s'"
+                " — device may not have shared its definitions yet",
+                name,
+                self._device_name,
+            )
+            self._count("errors")
+            self._command_lost(name)
+            return False
+
+        _LOGGER.info(
+            "→ ESPHome native: %s %s",
+            name,
+            service_data if service_data else "(no args)",
+        )
+
+        if self.pacer is None or name != ESPAction.SEND_COMMANDS:
+            await entry_data.client.execute_service(service, service_data)
+            return True
+
+        start = time.monotonic()
+        await entry_data.client.execute_service(service, service_data)
+        gap = self.pacer.record_delivery(service_data["commands"], time.monotonic() - start)
+        if gap > 0:
+            # Give the ESP32 time to drain this chunk into the Nextion before
+            # the writer delivers the next one.
+            await asyncio.sleep(gap)
+        return True
+
+    def _merge_limits(self) -> tuple[int, int]:
+        """Largest batch (characters, commands) the outbound queue may merge into one call."""
+        if self.pacer is not None:
+            return self.pacer.max_len, self.pacer.max_cmds
+        return DEFAULT_CHUNK_LEN, MAX_CHUNK_COMMANDS
+
+    def set_frame_window(self, seconds: float) -> None:
+        """Hold normal/background render batches this long to merge them (0 = off)."""
+        self._outbound.frame_window = max(0.0, float(seconds))
+
+    def set_telemetry(self, telemetry: TransportTelemetry | None) -> None:
+        """Record queue and delivery statistics of this device in *telemetry*."""
+        self._telemetry = telemetry
+        self._outbound.telemetry = telemetry
+
+    def _count(self, counter: str) -> None:
+        if self._telemetry is not None:
+            self._telemetry.count(counter)
+
+    def _command_lost(self, name: str) -> None:
+        if self.on_command_lost is not None:
+            self.on_command_lost(name)
+
+    def close(self) -> None:
+        """Cancel event listeners and drop any commands still queued."""
+        self.cancel_listen_events()
+        self._outbound.close()
+
+
+def _call_all(callbacks: list[Callable[[], None]]) -> None:
+    for cb in callbacks:
+        cb()
+
+
+def _run_background(callbacks: tuple[Callable, ...]) -> None:
+    # Periodic refreshes (ticks, progress bars, polling) queue their display
+    # commands behind interaction feedback; a wake catch-up runs all
+    # suspended timers in one loop batch
+    with command_priority(CommandPriority.BACKGROUND), loop_batch():
+        for cb in callbacks:
+            try:
+                cb({})
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Timer callback %s failed", cb)
 
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.error(
-                    "ESPHome publish('%s') failed: %s",
-                    name,
-                    exc,
-                )
 
-        # Block until the service call completes so that multiple chunks
-        # from a single send_cmds batch are delivered to the ESP32
-        # sequentially, not concurrently.  Fire-and-forget scheduling caused
-        # all chunks to pile up in the Nextion's command queue at once,
-        # overflowing max_queue_size and losing commands.
-        future = asyncio.run_coroutine_threadsafe(_call_service(), self._loop)
-        try:
-            future.result(timeout=10)
-        except TimeoutError:
-            _LOGGER.warning("ESPHome publish('%s') timed out after 10s", name)
-        except Exception as exc:  # noqa: BLE001
-            # Exception already logged inside _call_service; swallow the
-            # propagated copy so the executor thread is not disrupted.
-            _LOGGER.debug("publish('%s') future raised: %s", name, exc)
+def _fields_changed(old_state: Any, new_state: Any, fields: frozenset[str]) -> bool:
+    """Whether a state change touches any of *fields* (``"state"`` or attribute names)."""
+    if old_state is None or new_state is None:
+        return True
+    if "state" in fields and old_state.state != new_state.state:
+        return True
+    old_attrs = old_state.attributes
+    new_attrs = new_state.attributes
+    return any(old_attrs.get(field) != new_attrs.get(field) for field in fields if field != "state")
 
 
 class HAAdapter:
@@ -374,8 +511,19 @@ class HAAdapter:
         self.name = name
         self._loop: asyncio.AbstractEventLoop = hass.loop
         self._state_handles: dict[str, Callable] = {}
-        self._timer_handles: dict[str, Callable] = {}
+        self._listener_ids = itertools.count(1)
+        self._state_mux = get_state_mux(hass)
+        # Debouncer / blinker delays on the event loop (no thread per call)
+        self.timers = get_timer_service(hass)
+        # Set by the app; counts state changes dropped by listener fields
+        self.telemetry: TransportTelemetry | None = None
+        self._timer_handles: dict[str, Callable] = {}  # registered on the loop
+        self._timer_ids = itertools.count(1)
         self._timer_meta: dict[str, dict] = {}  # handle_id -> {callback_name, type, interval}
+        # Sleep-aware interval timers (handle_id -> (cb, interval)) and
+        # whether they are suspended; event loop only
+        self._sleep_timers: dict[str, tuple[Callable, float]] = {}
+        self._timers_suspended = False
         self._status_logs: list[str] = []  # last 100 lines for status view
         self._plugin_proxies: dict[str, Any] = {}  # plugin_name -> proxy instance
 
@@ -412,31 +560,31 @@ class HAAdapter:
                 f"Cleaning up {len(self._state_handles)} orphaned state listener(s)",
                 level="DEBUG",
             )
-            for remove in list(self._state_handles.values()):
-                self._loop.call_soon_threadsafe(remove)
+            self._loop.call_soon_threadsafe(_call_all, list(self._state_handles.values()))
             self._state_handles.clear()
 
         # Cancel any remaining timers
-        if self._timer_handles:
+        if self._timer_meta:
             self.log(
-                f"Cleaning up {len(self._timer_handles)} orphaned timer(s)",
+                f"Cleaning up {len(self._timer_meta)} orphaned timer(s)",
                 level="DEBUG",
             )
-            for remove in list(self._timer_handles.values()):
-                self._loop.call_soon_threadsafe(remove)
-            self._timer_handles.clear()
+            cancels = [partial(self._async_cancel_timer, h) for h in self._timer_meta]
             self._timer_meta.clear()
+            call_soon(self._loop, _call_all, cancels)
 
-        # Cancel ESPHome event bus listeners on any cached proxies
+        # Cancel ESPHome event bus listeners and outbound queues on any cached proxies
         for _plugin_name, proxy in list(self._plugin_proxies.items()):
-            if hasattr(proxy, "cancel_listen_events"):
+            if hasattr(proxy, "close"):
+                proxy.close()
+            elif hasattr(proxy, "cancel_listen_events"):
                 proxy.cancel_listen_events()
         self._plugin_proxies.clear()
 
     # entities
 
     def item_exists(self, entity_id: str) -> bool:
-        return self.hass.states.get(entity_id) is not None
+        return _read_state(self.hass, entity_id) is not None
 
     def get_entity_state(self, entity_id: str) -> str | None:
         """Read the current state of a HA entity by entity_id.
@@ -444,7 +592,7 @@ class HAAdapter:
         Returns the state string (e.g. "-67") or None if the entity doesn't exist.
         Thread-safe — ``hass.states.get`` is safe to call from executor threads.
         """
-        s = self.hass.states.get(entity_id)
+        s = _read_state(self.hass, entity_id)
         return s.state if s else None
 
     def get_item(self, entity_id: str) -> ItemProxy:
@@ -539,37 +687,78 @@ class HAAdapter:
         cb: Callable,
         entity_id: str,
         attribute: str | None = None,
+        fields: Iterable[str] | None = None,
         **kwargs: Any,
     ) -> str:
+        return self.listen_states(cb, [entity_id], attribute=attribute, fields=fields)[0]
+
+    def listen_states(
+        self,
+        cb: Callable,
+        entity_ids: Iterable[str],
+        attribute: str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Listen for state changes of several entities; one handle per entity.
+
+        The entities are subscribed to the hub-wide :class:`StateMux` (one HA
+        tracker per entity, shared by every page of every device) in one
+        event loop hop, shared with the other loop calls of the current
+        batch (see ``loop_batch``).  Returns without waiting for the registration:
+        cancelling is queued on the loop behind it, so a handle can be
+        cancelled right away.
+
+        *fields* declares what the listener renders: attribute names, plus
+        ``"state"`` for the state itself.  Changes that leave all of them
+        unchanged are dropped on the event loop, without an executor job.
+        With ``fields=None`` every change is delivered.
+        """
+        entity_ids = list(dict.fromkeys(entity_ids))
+        if not entity_ids:
+            return []
         from homeassistant.core import callback as ha_callback  # noqa: PLC0415
 
-        handle_id = str(uuid.uuid4())
+        watched = frozenset(fields) if fields is not None else None
 
         @ha_callback
         def _ha_cb(event: Any) -> None:
             old_state = event.data.get("old_state")
             new_state = event.data.get("new_state")
+            if watched is not None and not _fields_changed(old_state, new_state, watched):
+                if self.telemetry is not None:
+                    self.telemetry.count("state_filtered")
+                return
             if attribute and attribute not in ("state", None):
                 old = old_state.attributes.get(attribute) if old_state else None
                 new = new_state.attributes.get(attribute) if new_state else None
             else:
                 old = old_state.state if old_state else None
                 new = new_state.state if new_state else None
-            self.hass.async_add_executor_job(cb, entity_id, attribute or "state", old, new, {})
-
-        async def _register() -> None:
-            from homeassistant.helpers.event import async_track_state_change_event  # noqa: PLC0415
-
-            remove = async_track_state_change_event(self.hass, entity_id, _ha_cb)
-            self._state_handles[handle_id] = remove
+            self.hass.async_add_executor_job(
+                cb, event.data.get("entity_id"), attribute or "state", old, new, {}
+            )
 
-        asyncio.run_coroutine_threadsafe(_register(), self._loop).result(timeout=10)
-        return handle_id
+        subscription = StateSubscription(entity_ids, _ha_cb)
+        handles = []
+        for entity_id in entity_ids:
+            handle_id = f"listener-{next(self._listener_ids)}"
+            self._state_handles[handle_id] = partial(
+                self._state_mux.async_discard, subscription, entity_id
+            )
+            handles.append(handle_id)
+        call_soon(self._loop, self._state_mux.async_add, subscription)
+        return handles
 
     def cancel_listen_state(self, handle: str) -> None:
         remove = self._state_handles.pop(handle, None)
         if remove:
-            self._loop.call_soon_threadsafe(remove)
+            call_soon(self._loop, remove)
+
+    def cancel_listen_states(self, handles: Iterable[str]) -> None:
+        """Cancel several state listeners in one event loop hop."""
+        removes = [remove for h in handles if (remove := self._state_handles.pop(h, None))]
+        if removes:
+            call_soon(self._loop, _call_all, removes)
 
     # timers
 
@@ -578,98 +767,68 @@ class HAAdapter:
         cb: Callable,
         start: Any,
         interval: int | float,
+        sleep_aware: bool = False,
         **kwargs: Any,
     ) -> str:
-        import re
-        from datetime import timedelta  # noqa: PLC0415
+        """Call *cb* every *interval* seconds on an executor thread.
 
-        from homeassistant.core import callback as ha_callback  # noqa: PLC0415
-
-        handle_id = str(uuid.uuid4())
+        ``start="now+N"`` fires the first call after N seconds, any other
+        start value after *interval*.  Returns the handle right away; the
+        timer is registered on the event loop asynchronously (batched with
+        the other loop calls of the current batch, see ``loop_batch``).
 
+        A *sleep_aware* timer is suspended while the display is off and
+        called once on wake (see :meth:`suspend_timers`).
+        """
+        handle_id = self._new_timer_handle()
         self._timer_meta[handle_id] = {
             "callback_name": getattr(cb, "__name__", str(cb)),
             "type": "interval",
             "interval": interval,
         }
-
-        @ha_callback
-        def _ha_cb(now: Any) -> None:
-            async def _task() -> None:
-                await self.hass.async_add_executor_job(cb, {})
-
-            self.hass.async_create_task(_task())
-
-        # Parse "now+N" pattern - if matched, fire the first callback after
-        # N seconds via async_call_later, then switch to recurring
-        # async_track_time_interval.  All other start values (None,
-        # timedelta, datetime, utcnow) use the existing
-        # async_track_time_interval path for backward compatibility.
-        _now_plus: int | None = None
-        if isinstance(start, str):
-            m = re.match(r"^now\+(\d+)$", start)
-            if m:
-                _now_plus = int(m.group(1))
-
-        async def _register() -> None:
-            from homeassistant.helpers.event import (  # noqa: PLC0415
-                async_call_later,
-                async_track_time_interval,
-            )
-
-            if _now_plus is not None:
-
-                @ha_callback
-                def _first_cb(now: Any) -> None:
-                    _ha_cb(now)
-                    remove = async_track_time_interval(
-                        self.hass, _ha_cb, timedelta(seconds=interval)
-                    )
-                    self._timer_handles[handle_id] = remove
-
-                remove = async_call_later(self.hass, _now_plus, _first_cb)
-            else:
-                remove = async_track_time_interval(self.hass, _ha_cb, timedelta(seconds=interval))
-
-            self._timer_handles[handle_id] = remove
-
-        asyncio.run_coroutine_threadsafe(_register(), self._loop).result(timeout=10)
+        # "now+N": first call after N seconds, then every interval
+        first: int | None = None
+        if isinstance(start, str) and start.startswith("now+") and start[4:].isdigit():
+            first = int(start[4:])
+        call_soon(self._loop, self._async_run_every, handle_id, cb, first, interval, sleep_aware)
         return handle_id
 
     def run_in(self, cb: Callable, delay: int | float, **kwargs: Any) -> str:
-        from homeassistant.core import callback as ha_callback  # noqa: PLC0415
-
-        handle_id = str(uuid.uuid4())
+        """Call *cb* once after *delay* seconds on an executor thread.
 
+        Returns the handle right away, see :meth:`run_every`.
+        """
+        handle_id = self._new_timer_handle()
         self._timer_meta[handle_id] = {
             "callback_name": getattr(cb, "__name__", str(cb)),
             "type": "one_shot",
             "interval": delay,
         }
+        call_soon(self._loop, self._async_run_in, handle_id, cb, delay)
+        return handle_id
 
-        @ha_callback
-        def _ha_cb(now: Any) -> None:
-            self._timer_handles.pop(handle_id, None)
-
-            async def _task() -> None:
-                await self.hass.async_add_executor_job(cb, {})
-
-            self.hass.async_create_task(_task())
+    def cancel_timer(self, handle: str) -> None:
+        """Cancel a timer; may be called before its registration completed."""
+        if self._timer_meta.pop(handle, None) is not None:
+            call_soon(self._loop, self._async_cancel_timer, handle)
 
-        async def _register() -> None:
-            from homeassistant.helpers.event import async_call_later  # noqa: PLC0415
+    def suspend_timers(self) -> None:
+        """Suspend the sleep-aware interval timers (the display went off).
 
-            remove = async_call_later(self.hass, delay, _ha_cb)
-            self._timer_handles[handle_id] = remove
+        Their HA trackers are removed, so a sleeping panel spends no executor
+        time and sends no display commands for page animations and clocks.
+        """
+        call_soon(self._loop, self._async_suspend_timers)
 
-        asyncio.run_coroutine_threadsafe(_register(), self._loop).result(timeout=10)
-        return handle_id
+    def resume_timers(self, catch_up: Iterable[Callable] = ()) -> None:
+        """Restart the suspended timers (the display woke up).
 
-    def cancel_timer(self, handle: str) -> None:
-        remove = self._timer_handles.pop(handle, None)
-        self._timer_meta.pop(handle, None)
-        if remove:
-            self._loop.call_soon_threadsafe(remove)
+        Every suspended timer callback, followed by the *catch_up* callbacks,
+        runs once right away in a single executor job, so the panel is
+        brought up to date with one render; the timers then continue at
+        their interval.  Nothing happens if the timers are not suspended.
+        """
+        call_soon(self._loop, self._async_resume_timers, tuple(catch_up))
 
     def run_minutely(self, cb: Callable, start: Any = None, **kwargs: Any) -> str:
         return self.run_every(cb, start, 60, **kwargs)
@@ -680,6 +839,98 @@ class HAAdapter:
     def run_daily(self, cb: Callable, start: Any = None, **kwargs: Any) -> str:
         return self.run_every(cb, start, 86400, **kwargs)
 
+    def _new_timer_handle(self) -> str:
+        return f"timer-{next(self._timer_ids)}"
+
+    def _async_run_every(
+        self,
+        handle_id: str,
+        cb: Callable,
+        first: int | None,
+        interval: float,
+        sleep_aware: bool = False,
+    ) -> None:
+        if handle_id not in self._timer_meta:
+            return  # cancelled before it was registered
+        if sleep_aware:
+            self._sleep_timers[handle_id] = (cb, interval)
+            if self._timers_suspended:
+                return  # tracked on wake
+        self._async_track_interval(handle_id, cb, first, interval)
+
+    def _async_track_interval(
+        self, handle_id: str, cb: Callable, first: int | None, interval: float
+    ) -> None:
+        from datetime import timedelta  # noqa: PLC0415
+
+        from homeassistant.core import callback as ha_callback  # noqa: PLC0415
+        from homeassistant.helpers.event import (  # noqa: PLC0415
+            async_call_later,
+            async_track_time_interval,
+        )
+
+        @ha_callback
+        def _ha_cb(now: Any) -> None:
+            self.hass.async_add_executor_job(_run_background, (cb,))
+
+        if first is None:
+            remove = async_track_time_interval(self.hass, _ha_cb, timedelta(seconds=interval))
+        else:
+
+            @ha_callback
+            def _first_cb(now: Any) -> None:
+                if handle_id not in self._timer_handles:
+                    return
+                _ha_cb(now)
+                self._timer_handles[handle_id] = async_track_time_interval(
+                    self.hass, _ha_cb, timedelta(seconds=interval)
+                )
+
+            remove = async_call_later(self.hass, first, _first_cb)
+        self._timer_handles[handle_id] = remove
+
+    def _async_suspend_timers(self) -> None:
+        if self._timers_suspended:
+            return
+        self._timers_suspended = True
+        for handle_id in self._sleep_timers:
+            remove = self._timer_handles.pop(handle_id, None)
+            if remove is not None:
+                remove()
+
+    def _async_resume_timers(self, catch_up: tuple[Callable, ...]) -> None:
+        if not self._timers_suspended:
+            return
+        self._timers_suspended = False
+        callbacks = []
+        for handle_id, (cb, interval) in self._sleep_timers.items():
+            callbacks.append(cb)
+            self._async_track_interval(handle_id, cb, None, interval)
+        callbacks.extend(catch_up)
+        if callbacks:
+            self.hass.async_add_executor_job(_run_background, tuple(callbacks))
+
+    def _async_run_in(self, handle_id: str, cb: Callable, delay: float) -> None:
+        from homeassistant.core import callback as ha_callback  # noqa: PLC0415
+        from homeassistant.helpers.event import async_call_later  # noqa: PLC0415
+
+        if handle_id not in self._timer_meta:
+            return  # cancelled before it was registered
+
+        @ha_callback
+        def _ha_cb(now: Any) -> None:
+            self._timer_handles.pop(handle_id, None)
+            self._timer_meta.pop(handle_id, None)
+            self.hass.async_add_executor_job(cb, {})
+
+        self._timer_handles[handle_id] = async_call_later(self.hass, delay, _ha_cb)
+
+    def _async_cancel_timer(self, handle_id: str) -> None:
+        self._sleep_timers.pop(handle_id, None)
+        remove = self._timer_handles.pop(handle_id, None)
+        if remove is not None:
+            remove()
+
     # ESPHome
 
     def get_plugin_api(
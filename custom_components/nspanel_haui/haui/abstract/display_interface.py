@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from ..abstract.component import Component
 from ..mapping.const import ESPCommand
+from ..utils.adaptive_chunker import DEFAULT_CHUNK_LEN, AdaptiveChunker, split_commands
+from ..utils.telemetry import TransportTelemetry
 
 if TYPE_CHECKING:
     from ...nspanel_haui import NSPanelHAUI
@@ -26,6 +29,7 @@ class ESPHomeTransport:
         self.app = app
 
     def send(self, command: str, value: str | list[str]) -> None:
+        telemetry = getattr(self.app, "telemetry", None)
         if "esphome" not in self.app.controller:
             _LOGGER.warning(
                 "ESPHome controller not available — dropping command %s (value: %s)",
@@ -35,6 +39,85 @@ class ESPHomeTransport:
             return
         _LOGGER.debug("ESPHomeTransport.send: %s", command)
         self.app.controller["esphome"].send_cmd(command, value)
+        if telemetry is not None:
+            telemetry.record_send(value if isinstance(value, list) else [value])
+
+
+class DisplayShadow:
+    """Last attribute values sent to the components of the current Nextion page.
+
+    One shadow is shared by everything that renders to a device.  Writes whose
+    value matches the shadow are dropped before they reach the transport, which
+    removes the bulk of the traffic produced by ``refresh_panel`` and state
+    callbacks that re-render rows that did not change.
+
+    Only plain ``component.attribute=value`` assignments and ``vis component,n``
+    are tracked.  ``.val`` is never shadowed because the user changes it on the
+    display (sliders, dual-state buttons), and qualified targets such as
+    ``system.resVal.val`` belong to global pages the firmware writes to.
+
+    The Nextion resets all components when a page is loaded, so the shadow must
+    be invalidated whenever the page changes, the connection is re-established
+    or commands may have been lost (buffer overflow, failed delivery).
+    """
+
+    # Attributes the display changes by itself on user interaction
+    UNSHADOWED_ATTRS = frozenset({"val"})
+    # Commands after which the shadow no longer reflects the display
+    _RESET_COMMANDS = ("page ", "rest")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, str] = {}
+        self.suppressed = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @classmethod
+    def _key(cls, cmd: str) -> tuple[str | None, str]:
+        """Return ``(key, value)`` for a shadowable command, ``(None, "")`` otherwise."""
+        if cmd.startswith("vis "):
+            comma = cmd.rfind(",")
+            if comma > 0 and not cmd.startswith("vis 255,"):
+                return cmd[:comma], cmd[comma + 1 :]
+            return None, ""
+        eq = cmd.find("=")
+        if eq <= 0:
+            return None, ""
+        target = cmd[:eq]
+        if " " in target or target.count(".") != 1:
+            return None, ""
+        if target[target.index(".") + 1 :] in cls.UNSHADOWED_ATTRS:
+            return None, ""
+        return target, cmd[eq + 1 :]
+
+    def filter(self, cmds: list[str]) -> list[str]:
+        """Drop commands the display already reflects and record the remaining ones."""
+        result: list[str] = []
+        with self._lock:
+            values = self._values
+            for cmd in cmds:
+                key, value = self._key(cmd)
+                if key is None:
+                    if cmd == "cls" or cmd.startswith(self._RESET_COMMANDS):
+                        values.clear()
+                    elif cmd.startswith("vis 255,"):
+                        for k in [k for k in values if k.startswith("vis ")]:
+                            del values[k]
+                    result.append(cmd)
+                    continue
+                if values.get(key) == value:
+                    self.suppressed += 1
+                    continue
+                values[key] = value
+                result.append(cmd)
+        return result
+
+    def invalidate(self) -> None:
+        """Forget all shadowed values (page change, reconnect, lost commands)."""
+        with self._lock:
+            self._values.clear()
 
 
 @dataclass
@@ -43,40 +126,52 @@ class DisplayInterface:
 
     The interface mirrors the public methods that existed on :class:`haui.base.HAUIBase`
     (``set_component_text``/``set_component_value``/``send_cmd``/``send_cmds``).  It delegates to a
-    transport object that implements :class:`DisplayTransport`.
+    transport object that implements :class:`DisplayTransport`.  When a :class:`DisplayShadow` is
+    given, writes the display already reflects are dropped before they reach the transport.  Batches
+    are split into chunks sized by the device's :class:`AdaptiveChunker` when one is given.
     """
 
     transport: DisplayTransport
+    shadow: DisplayShadow | None = None
+    chunker: AdaptiveChunker | None = None
+    telemetry: TransportTelemetry | None = None
 
     # ---------------------------------------------------------------------
     # Command helpers
     # ---------------------------------------------------------------------
     def send_cmd(self, cmd: str) -> None:
-        self.transport.send(ESPCommand.SEND_COMMAND, cmd)
-
-    def send_cmds(self, cmds: list[str], max_len: int = 2048) -> None:
-        total_len = 0
-        batch: list[str] = []
-        chunks: list[tuple[int, list[str]]] = []
-        for cmd in cmds:
-            if batch and total_len + len(cmd) > max_len:
-                chunks.append((len(chunks), batch))
-                batch = []
-                total_len = 0
-            batch.append(cmd)
-            total_len += len(cmd)
-        if batch:
-            chunks.append((len(chunks), batch))
+        if self.shadow is not None and not self.shadow.filter([cmd]):
+            if self.telemetry is not None:
+                self.telemetry.count("shadow_drops")
+            return
+        try:
+            self.transport.send(ESPCommand.SEND_COMMAND, cmd)
+        except Exception:
+            self.invalidate_shadow()
+            raise
+
+    def send_cmds(self, cmds: list[str], max_len: int | None = None) -> None:
+        if self.shadow is not None:
+            n_cmds = len(cmds)
+            cmds = self.shadow.filter(cmds)
+            if self.telemetry is not None:
+                self.telemetry.count("shadow_drops", n_cmds - len(cmds))
+            if not cmds:
+                return
+        if self.chunker is not None:
+            chunks = self.chunker.split(cmds, max_len)
+        else:
+            chunks = split_commands(cmds, max_len or DEFAULT_CHUNK_LEN)
 
         if len(chunks) > 1:
             _LOGGER.debug(
                 "send_cmds: %d commands split into %d chunks (max_len=%d)",
                 len(cmds),
                 len(chunks),
-                max_len,
+                max_len or (self.chunker.max_len if self.chunker else DEFAULT_CHUNK_LEN),
             )
 
-        for idx, chunk in chunks:
+        for idx, chunk in enumerate(chunks):
             try:
                 self.transport.send(ESPCommand.SEND_COMMANDS, chunk)
             except Exception:
@@ -87,8 +182,19 @@ class DisplayInterface:
                     len(chunk),
                     exc_info=True,
                 )
+                self.invalidate_shadow()
                 raise
 
+    def report_overflow(self) -> None:
+        """The display lost commands to a buffer overflow: send smaller, slower chunks."""
+        if self.chunker is not None:
+            self.chunker.record_overflow()
+
+    def invalidate_shadow(self) -> None:
+        """Forget the shadowed display state so the next writes are always sent."""
+        if self.shadow is not None:
+            self.shadow.invalidate()
+
     def set_component_text(self, component: Component, text: str) -> None:
         if not component:
             return
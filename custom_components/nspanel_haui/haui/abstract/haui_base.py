@@ -7,7 +7,7 @@ from collections.abc import Callable, Generator
 from contextlib import AbstractContextManager, contextmanager
 from copy import deepcopy
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from ..mapping.color import COLORS, ColorTheme
 from .component import Component
@@ -15,8 +15,13 @@ from .component import Component
 if TYPE_CHECKING:
     from ...nspanel_haui import NSPanelHAUI
 
+from ..utils.command import CommandPriority, command_priority, dedup_commands
 from ..utils.debounce import Debouncer
+from ..utils.event_router import EventRoute, EventRouter
+from ..utils.event_trace import current_trace
 from ..utils.icon import parse_icon
+from ..utils.loop_batch import begin_loop_batch, end_loop_batch
+from ..utils.state_snapshot import begin_snapshot, end_snapshot
 from ..utils.text import get_state_translation, get_translation
 from .display_interface import DisplayInterface, ESPHomeTransport
 from .haui_event import HAUIEvent
@@ -27,6 +32,9 @@ _MISSING = object()
 class HAUIBase:
     """Base class for all Home Assistant UI (HAUI) classes."""
 
+    # Event names process_event handles (None: every event), see EventRouter
+    EVENTS: ClassVar[frozenset[str] | None] = None
+
     def __init__(self, app: NSPanelHAUI, config: dict[str, Any] | None = None) -> None:
         """Initializes a new instance of the HAUIBase class.
 
@@ -36,24 +44,36 @@ class HAUIBase:
         """
         self.id: uuid.UUID = uuid.uuid4()
         self.app: NSPanelHAUI = app
-        self.display = DisplayInterface(ESPHomeTransport(self.app))
+        self.display = DisplayInterface(
+            ESPHomeTransport(self.app),
+            shadow=getattr(self.app, "display_shadow", None),
+            chunker=getattr(self.app, "display_chunker", None),
+            telemetry=getattr(self.app, "telemetry", None),
+        )
         # Debouncer with executor dispatch: timer callbacks run on the
         # HA executor thread so page code (send_cmd, state access) is
-        # always on the correct thread.
+        # always on the correct thread.  The app's timer service schedules
+        # them on the event loop; the executor wrapper is the fallback.
+        timers = getattr(self.app, "timers", None)
         executor: Callable[[Callable[[], None]], None] | None = None
         loop = getattr(getattr(self.app, "hass", None), "loop", None)
-        if loop is not None:
+        if timers is None and loop is not None:
             hass = self.app.hass
             if getattr(hass, "async_add_executor_job", None) is not None:
 
                 def _executor_wrapper(func: Callable[[], None]) -> None:
+                    # Debounced refreshes are background work
+                    def _background() -> None:
+                        with command_priority(CommandPriority.BACKGROUND):
+                            func()
+
                     try:
-                        loop.call_soon_threadsafe(hass.async_add_executor_job, func)
+                        loop.call_soon_threadsafe(hass.async_add_executor_job, _background)
                     except RuntimeError:
                         pass  # Event loop is closed during HA shutdown
 
                 executor = _executor_wrapper
-        self.debouncer = Debouncer(executor=executor)
+        self.debouncer = Debouncer(executor=executor, timers=timers)
         self.config: dict[str, Any] = config or {}
         self.state: dict[str, Any] = {}
         self.started: bool = False
@@ -61,6 +81,8 @@ class HAUIBase:
         self._rec_cmd_depth: int = 0
         self._rec_cmd: list[str] = []
         self._rec_cmd_lock = threading.RLock()
+        self._event_route: EventRoute | None = None
+        self._event_router: EventRouter | None = None
 
     def get_id(self) -> uuid.UUID:
         """Returns the id of the config.
@@ -313,6 +335,20 @@ class HAUIBase:
             event: The event.
         """
 
+    def event_names(self) -> frozenset[str] | None:
+        """Event names process_event currently handles (None: every event)."""
+        return self.EVENTS
+
+    def subscribe_events(self, router: EventRouter, owner: str) -> None:
+        """Subscribe process_event to the events it handles."""
+        self._event_router = router
+        self._event_route = router.subscribe(owner, self.process_event, self.event_names())
+
+    def refresh_event_subscription(self) -> None:
+        """Resubscribe after event_names() changed."""
+        if self._event_router is not None and self._event_route is not None:
+            self._event_router.resubscribe(self._event_route, self.event_names())
+
     # lifecycle
 
     def is_started(self) -> bool:
@@ -379,10 +415,15 @@ class HAUIBase:
 
         Re-entrant: nested calls increment a depth counter without resetting
         the buffer.  Only the outermost ``stop_rec_cmd`` sends the batch.
+        Entity states read while recording come from one snapshot per
+        render pass (see ``haui/utils/state_snapshot.py``), and timer /
+        listener changes reach the event loop in one hop (``loop_batch``).
         """
         with self._rec_cmd_lock:
             self._rec_cmd_depth += 1
             self._recording = True
+            begin_snapshot()
+            begin_loop_batch()
 
     def stop_rec_cmd(self, send_commands: bool = True) -> list[str]:
         """Stops the recording of commands.
@@ -406,12 +447,20 @@ class HAUIBase:
         with self._rec_cmd_lock:
             if self._rec_cmd_depth > 0:
                 self._rec_cmd_depth -= 1
+                end_snapshot()
+                end_loop_batch()
             if self._rec_cmd_depth > 0:
                 return []
             self._recording = False
             commands = self._dedup_commands(self._rec_cmd)
+            if send_commands and self.display.telemetry is not None:
+                self.display.telemetry.count("dedup_drops", len(self._rec_cmd) - len(commands))
             self._rec_cmd = []
             if send_commands and len(commands) > 0:
+                record = current_trace()
+                if record is not None:
+                    record.commands += len(commands)
+                    record.mark("render")
                 ctx = self._cmd_context()
                 prefix = f"[{ctx}] " if ctx else ""
                 # Level 1: one-line summary for diagnosing partial updates
@@ -433,34 +482,8 @@ class HAUIBase:
     @staticmethod
     def _dedup_commands(commands: list[str]) -> list[str]:
         # Collapse multiple writes to the same target within a batch so the
-        # last write wins. Non-assignment commands (vis, ref, click, cirs, ...)
-        # are preserved in place to keep their ordering relative to the writes.
-        # ``vis`` commands are also deduplicated by component name so that
-        # hide-then-show of the same component collapses to just the show.
-        last_seen: dict[str, int] = {}
-        for i, cmd in enumerate(commands):
-            eq = cmd.find("=")
-            if eq <= 0:
-                if cmd.startswith("vis "):
-                    comma = cmd.rfind(",")
-                    if comma > 0:
-                        last_seen[cmd[:comma]] = i
-                continue
-            last_seen[cmd[:eq]] = i
-        result: list[str] = []
-        for i, cmd in enumerate(commands):
-            eq = cmd.find("=")
-            if eq <= 0:
-                if cmd.startswith("vis "):
-                    comma = cmd.rfind(",")
-                    if comma > 0 and last_seen.get(cmd[:comma]) == i:
-                        result.append(cmd)
-                else:
-                    result.append(cmd)
-                continue
-            if last_seen.get(cmd[:eq]) == i:
-                result.append(cmd)
-        return result
+        # last write wins (see haui.utils.command.dedup_commands).
+        return dedup_commands(commands)
 
     def send_esphome(self, name: str, value: Any = "", force: bool = False) -> None:
         """Publishes a command via the ESPHome controller.
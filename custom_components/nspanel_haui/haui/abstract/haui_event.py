@@ -1,11 +1,22 @@
 import json
 import logging
+from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marks a payload that was not decoded yet
+_UNSET = object()
+
 
 class HAUIEvent:
-    """Event class for HAUI. All events use this class."""
+    """Event class for HAUI. All events use this class.
+
+    The decoded payload (:meth:`as_json`, :meth:`as_int`) is computed on first
+    access and cached, so every controller and page handling the same event
+    shares one parse.
+    """
+
+    __slots__ = ("_int", "_json", "name", "processed", "trace", "value")
 
     def __init__(self, name: str, value: int | str | dict | tuple | None):
         """Initializes the event.
@@ -24,6 +35,10 @@ class HAUIEvent:
         self.name = name
         self.value = value
         self.processed = False
+        # TraceRecord of the event when the device's event trace is enabled
+        self.trace: Any = None
+        self._json: Any = _UNSET
+        self._int: Any = _UNSET
 
     def as_int(self, default: int = 0) -> int:
         """Returns the value as an int, or default if conversion fails.
@@ -31,11 +46,13 @@ class HAUIEvent:
         Returns:
             int: Value as int
         """
-        try:
-            return int(self.value)  # type: ignore[arg-type]
-        except (TypeError, ValueError) as exc:
-            _LOGGER.warning("Event value parse error (as_int): %s, value=%r", exc, self.value)
-            return default
+        if self._int is _UNSET:
+            try:
+                self._int = int(self.value)  # type: ignore[arg-type]
+            except (TypeError, ValueError) as exc:
+                _LOGGER.warning("Event value parse error (as_int): %s, value=%r", exc, self.value)
+                self._int = None
+        return default if self._int is None else self._int
 
     def as_str(self) -> str:
         """Returns the value as str.
@@ -48,13 +65,18 @@ class HAUIEvent:
     def as_json(self) -> dict:
         """Returns the value as a json dict, or {} if conversion fails.
 
+        The dict is shared by every caller; copy it before modifying it.
+
         Returns:
             dict: Value as json
         """
-        if not self.value:
-            return {}
-        try:
-            return json.loads(self.value)  # type: ignore[arg-type]
-        except (json.JSONDecodeError, TypeError) as exc:
-            _LOGGER.warning("Event value parse error (as_json): %s, value=%r", exc, self.value)
-            return {}
+        if self._json is _UNSET:
+            self._json = {}
+            if self.value:
+                try:
+                    self._json = json.loads(self.value)  # type: ignore[arg-type]
+                except (json.JSONDecodeError, TypeError) as exc:
+                    _LOGGER.warning(
+                        "Event value parse error (as_json): %s, value=%r", exc, self.value
+                    )
+        return self._json
@@ -7,7 +7,14 @@ from typing import TYPE_CHECKING, Any
 from ..mapping.const import InternalItemType
 from ..mapping.item_options import ItemOptions
 from ..utils.color import parse_color_value
-from ..utils.item import execute_item, get_item_color, get_item_icon, get_item_name, get_item_value
+from ..utils.item import (
+    execute_item,
+    get_item_color,
+    get_item_fields,
+    get_item_icon,
+    get_item_name,
+    get_item_value,
+)
 from ..utils.text import get_state_translation
 from ..utils.value import merge_dicts
 from .haui_base import HAUIBase
@@ -43,6 +50,7 @@ class HAUIItem(HAUIBase):
         self._item_type: str | None = None  # item type
         self._item_id: str | None = None  # item id
         self._entity: HAUIEntity | None = None  # entity representation (external items only)
+        self._config_key: str | None = None  # config identity for cached display values
         # prepare the item
         self._prepare_item(self.get("item", None))
 
@@ -82,6 +90,18 @@ class HAUIItem(HAUIBase):
             self._entity = HAUIEntity(self.app, item_id, config=self.config)
             self._dbg(f"Item: {item_id} -> external type={self._item_type}")
 
+    def get_config_key(self) -> str:
+        """Returns a key identifying the item config.
+
+        Items with equal config share cached display values.
+
+        Returns:
+            str: Config key
+        """
+        if self._config_key is None:
+            self._config_key = json.dumps(self.config, sort_keys=True, default=str)
+        return self._config_key
+
     def execute(self) -> None:
         """Executes the item."""
         # internal item
@@ -329,6 +349,16 @@ class HAUIItem(HAUIBase):
         icon = self._resolve_state_field("icon")
         return icon or get_item_icon(self, "alert-circle-outline")
 
+    def get_fields(self) -> frozenset[str] | None:
+        """Returns the state fields name, value, icon and color depend on.
+
+        Returns:
+            frozenset | None: Fields (``"state"`` or attribute names), None if unknown
+        """
+        if self._entity is None:
+            return None
+        return get_item_fields(self)
+
     def translate_item_state(self) -> str:
         """Returns the translation of this entity's current state.
 
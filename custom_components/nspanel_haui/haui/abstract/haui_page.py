@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -52,6 +52,19 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
         fnc_right_sec=Component(6, "bFncRSec"),
     )
 
+    EVENTS = frozenset(
+        {
+            ESPEvent.COMPONENT,
+            ESPEvent.GESTURE,
+            ESPEvent.TOUCH_START,
+            ESPEvent.TOUCH_END,
+            ESPResponse.READ_RESPONSE,
+            NotifEvent.NOTIF_ADD,
+            NotifEvent.NOTIF_REMOVE,
+            NotifEvent.NOTIF_CLEAR,
+        }
+    )
+
     # Pages that use pre-rendered picture backgrounds (clock, clocktwo, weather)
     # should set this to ``True`` so the base class skips the ``fill`` background
     # command (picture-background pages handle their own background).
@@ -84,6 +97,27 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
 
     def __init__(self, app: NSPanelHAUI, config: dict[str, Any] | None = None) -> None:
         super().__init__(app, config)
+        self._init_page_state()
+        # subclass init hook
+        self.prepare()
+
+    def reset(self, config: dict[str, Any] | None = None) -> None:
+        """Return a stopped page to the state of a new instance.
+
+        The navigation controller keeps one instance per page class and
+        calls this before reusing it for another panel open.  The display
+        interface, debouncer, lock and id made by the constructor are kept;
+        the page state and the attributes set by :meth:`prepare` start over.
+
+        Args:
+            config: Configuration for the next open (``page_id``).
+        """
+        self.config = config or {}
+        self.state = {}
+        self._init_page_state()
+        self.prepare()
+
+    def _init_page_state(self) -> None:
         self.page_id = int(self.get("page_id"))
         self.page_id_recv: int | None = None  # set when a page event is received
         # current panel
@@ -131,16 +165,15 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
         # reach them via a direct code path (e.g. an old add_component_callback
         # that leaks through the drag-component early return).
         self._in_read_callback: bool = False
-        # subclass init hook
-        self.prepare()
 
     def prepare(self) -> None:
         """Initialize page instance attributes.
 
         Override this instead of ``__init__`` to set default attribute
         values.  Called automatically after the base class constructor
-        runs.  No need to call ``super().prepare()`` — the base
-        implementation is a no-op.
+        runs, and again by :meth:`reset` when a pooled instance is reused.
+        No need to call ``super().prepare()`` — the base implementation is
+        a no-op.
         """
 
     def on_release(
@@ -404,8 +437,7 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
         # notify about page stop
         self.stop_page()
         # clean up item handles
-        for handle in self._handles.copy():
-            self.remove_item_listener(handle)
+        self.remove_item_listeners(self._handles.copy())
 
     # page
 
@@ -610,8 +642,7 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
         Args:
             panel (HAUIPanel): Current panel
         """
-        for handle in list(self._handles):
-            self.app.cancel_listen_state(handle)
+        self.app.cancel_listen_states(self._handles)
         self._handles.clear()
         self._listener_meta.clear()
         self._callback_map.clear()
@@ -890,7 +921,11 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
             item.call_item_service("turn_off")
 
     def add_item_listener(
-        self, item_id: str, callback: Callable, attribute: str | None = None
+        self,
+        item_id: str,
+        callback: Callable,
+        attribute: str | None = None,
+        fields: Iterable[str] | None = None,
     ) -> str:
         """Adds a item state listener.
 
@@ -898,11 +933,13 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
             item_id (str): Item ID
             callback (function): Callback
             attribute (str): Attribute
+            fields (Iterable[str], optional): Rendered fields ("state" or attribute
+                names); changes not touching any of them are skipped
 
         Returns:
             handle (str): Handle
         """
-        handle = self.app.listen_state(callback, item_id, attribute=attribute)
+        handle = self.app.listen_state(callback, item_id, attribute=attribute, fields=fields)
         self.debug_log(
             f"Adding listener for {item_id},"
             f" attribute={attribute},"
@@ -918,6 +955,75 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
         }
         return handle
 
+    def add_item_listeners(
+        self,
+        item_ids: Iterable[str],
+        callback: Callable,
+        attribute: str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Adds state listeners for several items, registered in one go.
+
+        Args:
+            item_ids (Iterable[str]): Item IDs
+            callback (function): Callback
+            attribute (str): Attribute
+            fields (Iterable[str], optional): Rendered fields ("state" or attribute
+                names); changes not touching any of them are skipped
+
+        Returns:
+            list[str]: One handle per item
+        """
+        item_ids = list(dict.fromkeys(item_ids))
+        handles = self.app.listen_states(callback, item_ids, attribute=attribute, fields=fields)
+        callback_name = getattr(callback, "__name__", str(callback))
+        for item_id, handle in zip(item_ids, handles, strict=True):
+            self._handles.append(handle)
+            self._listener_meta[handle] = {
+                "item_id": item_id,
+                "attribute": attribute,
+                "callback_name": callback_name,
+            }
+        self.debug_log(
+            f"Adding {len(handles)} listener(s) for {item_ids},"
+            f" attribute={attribute},"
+            f" callback={callback_name}",
+            min_level=2,
+        )
+        return handles
+
+    def get_items_fields(self, items: Iterable[HAUIItem]) -> frozenset[str] | None:
+        """Returns the state fields rendered for all given items.
+
+        Args:
+            items (Iterable[HAUIItem]): Items
+
+        Returns:
+            frozenset | None: Union of the item fields, None if any item's are unknown
+        """
+        fields: set[str] = set()
+        for item in items:
+            item_fields = item.get_fields()
+            if item_fields is None:
+                return None
+            fields |= item_fields
+        return frozenset(fields)
+
+    def remove_item_listeners(self, handles: Iterable[str]) -> None:
+        """Removes several item state listeners in one go.
+
+        Args:
+            handles (Iterable[str]): Handles
+        """
+        handles = [handle for handle in handles if handle in self._handles]
+        if not handles:
+            return
+        self.app.cancel_listen_states(handles)
+        removed = set(handles)
+        self._handles = [handle for handle in self._handles if handle not in removed]
+        for handle in handles:
+            self._listener_meta.pop(handle, None)
+
     def remove_item_listener(self, handle: str) -> None:
         """Removes a item state listener.
 
@@ -944,10 +1050,11 @@ class HAUIPage(FunctionButtonMixin, ButtonStateMixin, ComponentMixin, HAUIBase):
         Args:
             event (HAUIEvent): Event
         """
-        self.debug_log(
-            f"Page process_event: {event.name} value={str(event.value)[:100]}",
-            min_level=2,
-        )
+        if self.app.device.get("debug_level") >= 2:
+            self.debug_log(
+                f"Page process_event: {event.name} value={str(event.value)[:100]}",
+                min_level=2,
+            )
         # component event
         if event.name == ESPEvent.COMPONENT:
             self.process_component_event(event)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import time
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
@@ -110,6 +109,8 @@ class HAUIConnectionController(HAUIBase):
             self._on_entering_disconnected(old)
         elif new_state == ConnectionState.HANDSHAKING:
             self._on_entering_handshaking()
+        # While disconnected every event is a livesign
+        self.refresh_event_subscription()
 
     # ------------------------------------------------------------------
     # State-transition side-effects
@@ -121,6 +122,8 @@ class HAUIConnectionController(HAUIBase):
         self._last_connection_time = time.time()
 
         self._stop_handshake_timer()
+        # The device showed its own pages while disconnected
+        self.display.invalidate_shadow()
         self.send_esphome(ServerResponse.HUB_CONNECTION_INITIALIZED, "", True)
         # Explicitly reset the device's inactivity timer so that display
         # timeouts (dim/sleep/page) start fresh after every connection
@@ -316,6 +319,16 @@ class HAUIConnectionController(HAUIBase):
     # Event handling - 3-step handshake + heartbeat
     # ------------------------------------------------------------------
 
+    # Events routed here while connected (every event while disconnected)
+    EVENTS = frozenset(
+        {
+            ServerRequest.HEARTBEAT,
+            ServerRequest.REQ_CONNECTION,
+            ServerRequest.RES_CONNECTION,
+            ESPResponse.RES_DEVICE_STATE,
+        }
+    )
+
     # Events that are excluded from livesign detection (they are part of
     # the handshake protocol itself, not external signs of life).
     _LIVESIGN_EXCLUDED: frozenset = frozenset(
@@ -326,6 +339,12 @@ class HAUIConnectionController(HAUIBase):
         }
     )
 
+    def event_names(self) -> frozenset[str] | None:
+        """Every event is a livesign while disconnected."""
+        if self._state == ConnectionState.DISCONNECTED:
+            return None
+        return self.EVENTS
+
     def process_event(self, event: HAUIEvent) -> None:
         """Process a single event.
 
@@ -389,8 +408,9 @@ class HAUIConnectionController(HAUIBase):
             # our response is already in-flight, so just ignore.
             return
         if isinstance(event.value, str):
-            connection_request = json.loads(event.value)
-            device.set_device_info(connection_request, append=False)
+            connection_request = event.as_json()
+            # The parsed payload is shared with other handlers of the event
+            device.set_device_info(dict(connection_request), append=False)
             self.debug_log(f"Connection request from device: {connection_request}")
         self._initiate_handshake("req_connection")
 
@@ -410,7 +430,7 @@ class HAUIConnectionController(HAUIBase):
                 )
             return
         if isinstance(event.value, str):
-            connection_response = json.loads(event.value)
+            connection_response = event.as_json()
             # Adopt the device's heartbeat_interval if declared
             try:
                 dev_interval = float(connection_response.get("heartbeat_interval", 5.0))
@@ -430,11 +450,7 @@ class HAUIConnectionController(HAUIBase):
         """Handle handshake step 3 or reconnect replay: device state."""
         device = self.app.device
         if isinstance(event.value, str):
-            try:
-                device_state = json.loads(event.value)
-                device.set_device_info(device_state, append=True)
-            except json.JSONDecodeError:
-                self.log("Invalid device state JSON", level="WARNING")
+            device.set_device_info(event.as_json(), append=True)
         if self._state == ConnectionState.HANDSHAKING:
             self.debug_log(f"Device state received {event.value}")
             self._set_state(ConnectionState.CONNECTED)
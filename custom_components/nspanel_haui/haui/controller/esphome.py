@@ -8,7 +8,7 @@ if TYPE_CHECKING:
 
 from ..abstract.haui_base import HAUIBase
 from ..abstract.haui_event import HAUIEvent
-from ..mapping.const import ALL_CMD, ALL_RECV, ESP_NS_EVENT
+from ..mapping.const import ALL_CMD, ESP_NS_EVENT, RECV_BY_NAME
 
 
 class HAUIESPHomeController(HAUIBase):
@@ -17,6 +17,9 @@ class HAUIESPHomeController(HAUIBase):
     Provides access to ESPHome native API functionality for device communication.
     """
 
+    # Receives events through callback_event, not the event router
+    EVENTS = frozenset()
+
     def __init__(
         self,
         app: NSPanelHAUI,
@@ -101,6 +104,8 @@ class HAUIESPHomeController(HAUIBase):
         # an entire chunk of a multi-chunk send, causing partial updates.
         dedup_key = (bare_cmd, value if isinstance(value, str) else str(value))
         if bare_cmd != "send_commands" and not force and self.prev_cmd == dedup_key:
+            if self.display.telemetry is not None:
+                self.display.telemetry.count("dedup_drops")
             self.log(
                 f"Dropping identical consecutive message: {bare_cmd}/{value}",
                 level="WARNING",
@@ -133,12 +138,19 @@ class HAUIESPHomeController(HAUIBase):
         name = data.get("name", event_name)
         value = data.get("value", "")
 
-        self.debug_log(
-            f"ESPHome event received - name: {name}, value: {str(value)[:100]}",
-        )
+        if self.app.device.get("debug_level") >= 1:
+            self.debug_log(f"ESPHome event received - name: {name}, value: {str(value)[:100]}")
 
-        if name not in ALL_RECV:
+        # Intern the name to its enum member so handlers compare by identity
+        known = RECV_BY_NAME.get(name)
+        if known is None:
             self.log(f"Unknown message {name} received. content: {value}")
+        else:
+            name = known
 
         event = HAUIEvent(name, value)
+        record = data.get("trace")
+        if record is not None:
+            record.mark("queued")
+            event.trace = record
         self._event_callback(event)
@@ -18,6 +18,8 @@ class HAUIGestureController(HAUIBase):
     Supports gesture sequences.
     """
 
+    EVENTS = frozenset({ESPEvent.GESTURE})
+
     def __init__(self, app: NSPanelHAUI, config: dict[str, Any]) -> None:
         """Initialize for gesture controller.
 
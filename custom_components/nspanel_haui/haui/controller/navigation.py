@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import contextlib
 import time
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
 from uuid import UUID
 
 from ..device_config import resolve_snapshot_max_age as _resolve_snapshot
@@ -16,6 +17,7 @@ from ..abstract.haui_page import HAUIPage
 from ..abstract.haui_panel import HAUIPanel
 from ..mapping.const import ESPCommand, ESPEvent, SysPanelKey
 from ..mapping.page import PAGE_MAPPING
+from ..utils.loop_batch import loop_batch
 from ..utils.page import get_page_class_for_panel, get_page_id_for_panel
 
 # Buffer-overflow recovery tuning: the first recovery is debounced by the
@@ -34,6 +36,22 @@ class HAUINavigationController(HAUIBase):
     so full app access is possible when navigating.
     """
 
+    EVENTS = frozenset(
+        {
+            ESPEvent.PAGE,
+            ESPEvent.TIMEOUT,
+            ESPEvent.DISPLAY_STATE,
+            ESPEvent.WAKEUP,
+            ESPEvent.SLEEP,
+            ESPEvent.BUFFER_OVERFLOW,
+            # interaction resets the hub-side idle / nav-home timers
+            ESPEvent.TOUCH_START,
+            ESPEvent.BUTTON_LEFT,
+            ESPEvent.BUTTON_RIGHT,
+            ESPEvent.GESTURE,
+        }
+    )
+
     def __init__(self, app: NSPanelHAUI, config: dict[str, Any]):
         """Initialize for navigation controlller.
 
@@ -77,6 +95,7 @@ class HAUINavigationController(HAUIBase):
         self._snapshot_time: float | None = None  # monotonic time when snapshot was created
         self._navigating = False  # re-entrance guard for navigation operations
         self._pending_reload = False  # reload was queued while navigating
+        self._page_pool: dict[type[HAUIPage], HAUIPage] = {}  # one instance per page class
 
     # part
 
@@ -126,6 +145,7 @@ class HAUINavigationController(HAUIBase):
         self.cancel_timeouts()
         self.unset_page()
         self._stack.clear()
+        self._page_pool.clear()
 
     # public methods
 
@@ -206,6 +226,8 @@ class HAUINavigationController(HAUIBase):
             force (bool): Force re-send, bypass ESPHome dedup
         """
         self.log(f"Goto page: {PAGE_MAPPING.get(page_id)}")
+        # Loading a page resets all of its components on the Nextion
+        self.display.invalidate_shadow()
         self.send_esphome(ESPCommand.GOTO_PAGE, str(page_id), force=force)
 
     def unset_page(self) -> None:
@@ -214,6 +236,7 @@ class HAUINavigationController(HAUIBase):
             if self.page.is_started():
                 self.page.stop()
             self.page = None
+            self.refresh_event_subscription()
 
     def get_current_panel(self) -> HAUIPanel | None:
         """Returns the current panel.
@@ -310,7 +333,7 @@ class HAUINavigationController(HAUIBase):
             panel_id (str): Id of panel
             kwargs (dict): Additional arguments for panel
         """
-        with self._guard(f"open_panel({panel_id})") as acquired:
+        with self._guard(f"open_panel({panel_id})") as acquired, loop_batch():
             if acquired:
                 self._open_panel_impl(panel_id, **kwargs)
 
@@ -407,7 +430,10 @@ class HAUINavigationController(HAUIBase):
             f"Switching to page {PAGE_MAPPING.get(page_id)}"
             f" from {PAGE_MAPPING.get(curr_page_id) if curr_page_id is not None else None}"
         )
-        self.page = page_class(self.app, {"page_id": page_id})
+        self.page = self._get_pooled_page(page_class, page_id)
+        self.refresh_event_subscription()
+        if self.display.telemetry is not None:
+            self.display.telemetry.set_page_type(panel.get_type())
 
         # notify about panel creation early in process
         self.page.create_panel(panel)
@@ -438,6 +464,21 @@ class HAUINavigationController(HAUIBase):
                 self.app.cancel_timer(self._close_timeout)
             self._close_timeout = self.app.run_in(self._close_timeout_callback, timeout)
 
+    def _get_pooled_page(self, page_class: type[HAUIPage], page_id: int) -> HAUIPage:
+        """Return the page instance for *page_class*, ready for a new open.
+
+        One instance per page class is kept for the device and reset on
+        reuse instead of constructing a new page (display interface,
+        debouncer, lock) for every panel open.
+        """
+        config = {"page_id": page_id}
+        page = self._page_pool.get(page_class)
+        if page is None or page.is_started():
+            page = self._page_pool[page_class] = page_class(self.app, config)
+        else:
+            page.reset(config)
+        return page
+
     def _page_timeout_callback(self, _kwargs: dict[str, Any]) -> None:
         """Last-resort fallback: page event never arrived within timeout."""
         self._page_timeout = None
@@ -567,7 +608,7 @@ class HAUINavigationController(HAUIBase):
 
     def close_panel(self) -> None:
         """Closes the current panel."""
-        with self._guard("close_panel") as acquired:
+        with self._guard("close_panel") as acquired, loop_batch():
             if acquired:
                 self._close_panel_impl()
 
@@ -828,24 +869,32 @@ class HAUINavigationController(HAUIBase):
         interaction-timer reset runs first because it applies across several
         event types (touch/button/gesture).
         """
-        self.debug_log(f"Navigation process_event: {event.name} value={str(event.value)[:100]}")
+        if self.app.device.get("debug_level") >= 1:
+            self.debug_log(
+                f"Navigation process_event: {event.name} value={str(event.value)[:100]}"
+            )
         self._reset_hub_timers_on_interaction(event)
 
-        handlers: dict[str, Any] = {
-            ESPEvent.PAGE: self._handle_page_event,
-            ESPEvent.TIMEOUT: self._handle_timeout_event,
-            ESPEvent.DISPLAY_STATE: self._handle_display_state_event,
-            ESPEvent.WAKEUP: self._handle_wakeup_event,
-            ESPEvent.SLEEP: self._handle_sleep_event,
-            ESPEvent.BUFFER_OVERFLOW: self._handle_buffer_overflow_event,
-        }
-        handler = handlers.get(event.name)
+        handler = self._event_handlers.get(event.name)
         if handler is not None:
-            handler(event)
+            handler(self, event)
 
         # allow page to process events (the SLEEP handler may have cleared it)
-        if self.page is not None:
-            self.page.process_event(event)
+        page = self.page
+        if page is not None and (page.EVENTS is None or event.name in page.EVENTS):
+            if event.trace is None:
+                page.process_event(event)
+            else:
+                start = time.perf_counter()
+                page.process_event(event)
+                event.trace.add("page", time.perf_counter() - start)
+
+    def event_names(self) -> frozenset[str] | None:
+        """Navigation events plus the events of the active page."""
+        page_events = self.EVENTS if self.page is None else self.page.event_names()
+        if page_events is None:
+            return None
+        return self.EVENTS | page_events
 
     def _reset_hub_timers_on_interaction(self, event: HAUIEvent) -> None:
         """Reset the hub-side idle / nav-home timers on user interaction.
@@ -869,6 +918,9 @@ class HAUINavigationController(HAUIBase):
 
     def _handle_page_event(self, event: HAUIEvent) -> None:
         """A page-change ack arrived from the device."""
+        # The device loaded a page (possibly on its own, e.g. the system page
+        # on disconnect), so the shadowed component state is gone.
+        self.display.invalidate_shadow()
         # cancel page timeout if any
         if self._page_timeout is not None:
             self.app.cancel_timer(self._page_timeout)
@@ -970,6 +1022,10 @@ class HAUINavigationController(HAUIBase):
         pauses entirely after OVERFLOW_RECOVERY_MAX_ATTEMPTS, until the
         display has been overflow-free for OVERFLOW_RECOVERY_RESET seconds.
         """
+        # Lost commands leave the display out of sync with the shadow; the
+        # recovery re-render (and anything before it) must not be suppressed.
+        self.display.invalidate_shadow()
+        self.display.report_overflow()
         now = time.monotonic()
         if now - self._last_overflow_ts > OVERFLOW_RECOVERY_RESET:
             self._overflow_recoveries = 0
@@ -1012,3 +1068,13 @@ class HAUINavigationController(HAUIBase):
                 level="ERROR",
             )
         self.refresh_panel()
+
+    # event name -> handler, built once instead of per event
+    _event_handlers: ClassVar[dict[str, Callable[[HAUINavigationController, HAUIEvent], None]]] = {
+        ESPEvent.PAGE: _handle_page_event,
+        ESPEvent.TIMEOUT: _handle_timeout_event,
+        ESPEvent.DISPLAY_STATE: _handle_display_state_event,
+        ESPEvent.WAKEUP: _handle_wakeup_event,
+        ESPEvent.SLEEP: _handle_sleep_event,
+        ESPEvent.BUFFER_OVERFLOW: _handle_buffer_overflow_event,
+    }
@@ -25,6 +25,8 @@ class HAUINotificationController(HAUIBase):
 
     MAX_QUEUE_SIZE = 50
 
+    EVENTS = frozenset({ESPResponse.SEND_NOTIFICATION, *NotifEvent})
+
     def __init__(self, app: NSPanelHAUI, config: dict[str, Any]):
         """Initialize for notification controlller.
 
@@ -35,7 +37,7 @@ class HAUINotificationController(HAUIBase):
         super().__init__(app, config)
         self.debug_log(f"Creating Notification Controller with config: {config}")
         self._notifications: list[tuple] = []  # list for notifications
-        self._blinker = NotificationBlinker()
+        self._blinker = NotificationBlinker(timers=getattr(app, "timers", None))
         self._blinker_refresh_fn: Callable[[], None] | None = None
         # id(notification) -> timer handle for expiry
         self._expiry_timers: dict[int, str] = {}
@@ -37,6 +37,14 @@ class HAUIUpdateController(HAUIBase):
     # hard-coded url for haui relases on github
     RELEASES_URL = "https://api.github.com/repos/happydasch/nspanel_haui/releases"
 
+    EVENTS = frozenset(
+        {
+            ESPEvent.CONNECTED,
+            ESPResponse.RES_DEVICE_INFO,
+            ESPResponse.RES_DEVICE_STATE,
+        }
+    )
+
     def __init__(self, app: NSPanelHAUI, config: dict[str, Any]):
         """Initialize for update controller.
 
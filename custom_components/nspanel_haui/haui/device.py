@@ -263,11 +263,10 @@ class HAUIDevice(HAUIBase):
                 # If the current panel is a popup (non-nav), skip it - popups
                 # don't survive disconnects. Fall back to the current nav panel.
                 # Use run_in to schedule the panel opening asynchronously.
-                # open_panel involves blocking ESPHome native API service calls
-                # (publish → async_call(blocking=True) → .result(timeout=10)).
-                # Running it synchronously would prevent heartbeat events from
-                # being processed on this executor thread, causing the connection
-                # timeout to fire.
+                # open_panel renders the whole panel (state lookups, template
+                # rendering, command batching).  Running it synchronously would
+                # delay heartbeat processing on this executor thread, causing
+                # the connection timeout to fire.
                 panel = navigation.get_current_panel()
                 nav_panel = navigation.get_current_nav_panel()
                 if panel is not None and nav_panel is not None and panel.id == nav_panel.id:
@@ -43,6 +43,15 @@ DEVICE_CONFIG: dict[str, Any] = {
     # "Invalid variable name" errors when render commands arrive before the page
     # is ready.
     "page_settle_delay": 0.1,
+    # render frame window (seconds)
+    # Normal and background render batches produced within this window are
+    # merged into a single send_commands call (interaction feedback is never
+    # delayed).  0 disables frame coalescing.
+    "frame_window": 0.04,
+    # event trace (number of events kept, 0 = disabled)
+    # Records per-stage latency of the latest device events for the status
+    # API and the diagnostics download.
+    "event_trace": 0,
     # logging
     "log_items": False,
     "debug_level": 0,
@@ -148,10 +148,12 @@ class InternalItemType(StrEnum):
     ACTION = "action"
 
 
-# all messages on recv
-ALL_RECV: frozenset[str] = frozenset(
-    member.value for member in (*ESPEvent, *ESPResponse, *ServerRequest)
-)
+# all messages on recv, mapped to their enum member (events are interned
+# to these members at ingress)
+RECV_BY_NAME: dict[str, StrEnum] = {
+    member.value: member for member in (*ESPEvent, *ESPResponse, *ServerRequest)
+}
+ALL_RECV: frozenset[str] = frozenset(RECV_BY_NAME)
 
 # all messages on cmd
 ALL_CMD: frozenset[str] = frozenset(
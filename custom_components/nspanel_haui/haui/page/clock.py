@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import zoneinfo
 from datetime import datetime
 from typing import Any
 
@@ -13,7 +12,7 @@ from ..mapping.background import BACKGROUNDS
 from ..mapping.const import SysPanelKey
 from ..mapping.descriptor import PageDescriptor, PageOption, _
 from ..mapping.icons import ICO_MESSAGE
-from ..utils.datetime import format_datetime, get_date_localized, get_time_localized
+from ..utils.datetime import format_datetime, get_date_localized, get_now, get_time_localized
 from ..utils.icon import parse_icon
 
 
@@ -240,7 +239,7 @@ class ClockPage(HAUIPage):
         self._cycle_state = "cycling"
         # Start cycle timer if multiple cards enabled
         if self._tick_handle is None and len(self._cycle_cards) > 1:
-            self._tick_handle = self.app.run_every(self._tick, 0, 1.0)
+            self._tick_handle = self.app.run_every(self._tick, 0, 1.0, sleep_aware=True)
         # Tap-to-advance on the big time area
         self.on_release(
             {self.COMPONENTS.t_time: self._advance_card},
@@ -286,7 +285,7 @@ class ClockPage(HAUIPage):
 
     def _get_short_date_text(self, timezone: str) -> str:
         """Short date that fits in tTime (max 10 chars)."""
-        now = datetime.now(zoneinfo.ZoneInfo(timezone))
+        now = get_now(timezone)
         # "Mon 16" style — ~7 chars, localized weekday abbreviation
         dow = format_datetime(now, "%a", "E", self.get_locale())
         return f"{dow} {now.day}"
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import datetime
 import re
-import zoneinfo
 from typing import Any
 
 from ..abstract.component import Component
@@ -13,6 +12,7 @@ from ..mapping.background import BACKGROUNDS
 from ..mapping.const import SysPanelKey
 from ..mapping.descriptor import PageDescriptor, PageOption, _
 from ..mapping.icons import ICO_MESSAGE, ICO_SPECIAL
+from ..utils.datetime import get_now
 
 MATRIX = {
     "en": (
@@ -429,7 +429,7 @@ class ClockTwoPage(HAUIPage):
 
     def update_interface(self) -> None:
         timezone = self.app.hass.config.time_zone
-        current_time = datetime.datetime.now(tz=zoneinfo.ZoneInfo(timezone))
+        current_time = get_now(timezone)
         letters_active, specials_active, time_words = self.get_matrix_from_time(current_time)
 
         matrix_text = ""
@@ -146,9 +146,8 @@ class GridPage(HAUIPage):
         # cancel any pending debounced item-state updates
         self.debouncer.cancel("grid_item_state")
         self._pending_item_updates.clear()
-        while self._active_handles:
-            handle = self._active_handles.pop()
-            self.remove_item_listener(handle)
+        self.remove_item_listeners(self._active_handles)
+        self._active_handles.clear()
 
     def render_panel(self, panel: HAUIPanel) -> None:
         self.set_component_text(self.COMPONENTS.title, panel.get_title())
@@ -169,9 +168,8 @@ class GridPage(HAUIPage):
 
     def set_grid_entries(self) -> None:
         # check if there are any listener active and cancel them
-        while self._active_handles:
-            handle = self._active_handles.pop()
-            self.remove_item_listener(handle)
+        self.remove_item_listeners(self._active_handles)
+        self._active_handles.clear()
         # get current entities to display
         start = 0 + (int(self._current_page) * self.NUM_GRIDS)
         end = min(len(self._items), start + self.NUM_GRIDS)
@@ -181,6 +179,7 @@ class GridPage(HAUIPage):
             items = []
         # set buttons
         item_ids = set()
+        listened = []
         mapping = []
         for i in range(self.NUM_GRIDS):
             item = None
@@ -204,14 +203,18 @@ class GridPage(HAUIPage):
                 else:
                     visible = True
                     item_ids.add(item.get_item_id())
+                    listened.append(item)
                 # add mapping to
                 mapping.append({"item": item, "ovl": ovl, "power": power})
             self.set_grid_entry(idx, visible=visible)
         self._item_mapping = mapping
         # create listener for active entities
-        for item_id in item_ids:
-            handle = self.add_item_listener(item_id, self.callback_item_state, attribute="all")
-            self._active_handles.append(handle)
+        self._active_handles = self.add_item_listeners(
+            item_ids,
+            self.callback_item_state,
+            attribute="all",
+            fields=self.get_items_fields(listened),
+        )
 
     def get_grid_colors(self, item: HAUIItem | None) -> tuple:
         # Default theme colors — no panel-level overrides.
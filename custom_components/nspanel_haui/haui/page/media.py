@@ -452,7 +452,7 @@ class MediaPage(HAUIPage):
         if self._handle_scrolling is None:
             # Start repeating scrolling timer (replaces threading.Timer)
             self._handle_scrolling = self.app.run_every(
-                self._scrolling_text, 0, self.SCROLLING_INTERVAL
+                self._scrolling_text, 0, self.SCROLLING_INTERVAL, sleep_aware=True
             )
 
     def update_media_controls(self) -> None:
@@ -628,7 +628,7 @@ class MediaPage(HAUIPage):
         # there is an active media panel.
         if self.is_started() and self._handle_progress is None:
             self._handle_progress = self.app.run_every(
-                self.update_progress, 0, self.PROGRESS_INTERVAL
+                self.update_progress, 0, self.PROGRESS_INTERVAL, sleep_aware=True
             )
 
     def update_power_button(self) -> None:
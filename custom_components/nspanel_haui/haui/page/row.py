@@ -200,9 +200,8 @@ class RowPage(HAUIPage):
         # cancel any pending debounced item-state updates
         self.debouncer.cancel("row_item_state")
         self._pending_item_updates.clear()
-        while self._active_handles:
-            handle = self._active_handles.pop()
-            self.remove_item_listener(handle)
+        self.remove_item_listeners(self._active_handles)
+        self._active_handles.clear()
 
     def render_panel(self, panel: HAUIPanel) -> None:
         self.set_component_text(self.COMPONENTS.title, panel.get_title())
@@ -212,9 +211,8 @@ class RowPage(HAUIPage):
 
     def set_row_entries(self) -> None:
         # check if there are any listener active and cancel them
-        while self._active_handles:
-            handle = self._active_handles.pop()
-            self.remove_item_listener(handle)
+        self.remove_item_listeners(self._active_handles)
+        self._active_handles.clear()
         # get current entities to display
         start = 0 + (self._current_page * self.NUM_ROWS)
         end = min(len(self._items), start + self.NUM_ROWS)
@@ -224,6 +222,7 @@ class RowPage(HAUIPage):
             items = []
         # set buttons
         item_ids = set()
+        listened = []
         for i in range(self.NUM_ROWS):
             item = None
             idx = i + 1
@@ -245,11 +244,15 @@ class RowPage(HAUIPage):
                 else:
                     visible = True
                     item_ids.add(item.get_item_id())
+                    listened.append(item)
             self.set_row_entry(idx, visible=visible)
         # create listener for active entities
-        for item_id in item_ids:
-            handle = self.add_item_listener(item_id, self.callback_item_state, attribute="all")
-            self._active_handles.append(handle)
+        self._active_handles = self.add_item_listeners(
+            item_ids,
+            self.callback_item_state,
+            attribute="all",
+            fields=self.get_items_fields(listened),
+        )
 
     def set_row_entry(self, idx: int, visible: bool = True) -> None:
         # visibility of row entry components
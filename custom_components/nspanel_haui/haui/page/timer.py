@@ -206,7 +206,7 @@ class TimerPage(HAUIPage):
         # Start the repeating display update timer (replaces threading.Timer)
         if self._handle_update_display is None:
             self._handle_update_display = self.app.run_every(
-                self.update_timer, 0, self.DISPLAY_UPDATE_INTERVAL
+                self.update_timer, 0, self.DISPLAY_UPDATE_INTERVAL, sleep_aware=True
             )
         # update display
         with self.rec_cmd:
@@ -0,0 +1,152 @@
+"""Adaptive chunk sizing and pacing for ``send_commands`` batches.
+
+The ESP32 forwards every command of a ``send_commands`` chunk to the Nextion
+at 115200 baud and buffers the rest in a queue of ``max_queue_size`` (800)
+entries.  Chunks that arrive faster than the UART drains them overflow that
+queue (the Nextion then reports ``esphome.buffer_overflow``), while chunks
+that are needlessly small cost extra native API round trips.
+
+:class:`AdaptiveChunker` keeps per-device tuning state:
+
+* ``max_len`` — characters per chunk.  Halved on every overflow, grown
+  additively again after a run of healthy deliveries.
+* ``pace`` — multiplier on the estimated UART drain time of a chunk.  The
+  outbound writer waits ``drain * pace - rtt`` after each chunk before
+  sending the next one.  Raised on overflow, decayed while healthy.
+
+Delivery round trips are measured on the event loop, overflows are reported
+from executor threads; all state is guarded by a lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+# Nextion UART: 10 bits per byte at 115200 baud, each command is followed
+# by a three byte 0xFF terminator.
+UART_BAUD = 115200
+CMD_TERMINATOR_LEN = 3
+
+# Firmware command queue (max_queue_size in esphome/nspanel_haui/display.yaml).
+# A single chunk never uses more than half of it.
+NEXTION_QUEUE_SIZE = 800
+MAX_CHUNK_COMMANDS = NEXTION_QUEUE_SIZE // 2
+
+MIN_CHUNK_LEN = 256
+MAX_CHUNK_LEN = 4096
+DEFAULT_CHUNK_LEN = 2048
+CHUNK_LEN_STEP = 256
+
+MIN_PACE = 0.5
+MAX_PACE = 2.0
+PACE_STEP = 0.5
+PACE_DECAY = 0.9
+
+# Consecutive healthy deliveries before the chunk size grows one step
+GROW_AFTER = 8
+# Seconds after an overflow during which the chunk size does not grow
+OVERFLOW_QUIET = 30.0
+# Overflows reported within this many seconds of the previous one belong to
+# the same burst and shrink the chunks only once
+OVERFLOW_HOLDOFF = 1.0
+# A delivery slower than this counts as unhealthy (ESP32 busy / congested)
+SLOW_RTT = 0.5
+# Weight of a new sample in the round-trip time moving average
+RTT_ALPHA = 0.2
+
+
+def split_commands(cmds: list[str], max_len: int, max_cmds: int | None = None) -> list[list[str]]:
+    """Split *cmds* into chunks of at most *max_len* characters and *max_cmds* commands.
+
+    A single command longer than *max_len* still forms its own chunk.
+    """
+    chunks: list[list[str]] = []
+    batch: list[str] = []
+    total_len = 0
+    for cmd in cmds:
+        if batch and (
+            total_len + len(cmd) > max_len or (max_cmds is not None and len(batch) >= max_cmds)
+        ):
+            chunks.append(batch)
+            batch = []
+            total_len = 0
+        batch.append(cmd)
+        total_len += len(cmd)
+    if batch:
+        chunks.append(batch)
+    return chunks
+
+
+def drain_time(n_chars: int, n_cmds: int) -> float:
+    """Seconds the Nextion UART needs to receive *n_cmds* commands of *n_chars* total."""
+    return (n_chars + CMD_TERMINATOR_LEN * n_cmds) * 10 / UART_BAUD
+
+
+class AdaptiveChunker:
+    """Per-device chunk size and pacing controller (AIMD on overflow events)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.max_len = DEFAULT_CHUNK_LEN
+        self.max_cmds = MAX_CHUNK_COMMANDS
+        self.pace = MIN_PACE
+        self.rtt: float | None = None
+        self.deliveries = 0
+        self.overflows = 0
+        self._healthy = 0
+        self._last_overflow: float | None = None
+
+    def split(self, cmds: list[str], max_len: int | None = None) -> list[list[str]]:
+        """Split *cmds* into chunks of at most ``max_len`` characters / ``max_cmds`` commands."""
+        return split_commands(cmds, max_len or self.max_len, self.max_cmds)
+
+    def record_delivery(self, cmds: list[str], rtt: float) -> float:
+        """Record a delivered chunk and return the pause before the next one (seconds)."""
+        with self._lock:
+            self.deliveries += 1
+            self.rtt = rtt if self.rtt is None else self.rtt + RTT_ALPHA * (rtt - self.rtt)
+            now = time.monotonic()
+            quiet = self._last_overflow is None or now - self._last_overflow > OVERFLOW_QUIET
+            if rtt > SLOW_RTT:
+                self._healthy = 0
+            else:
+                self._healthy += 1
+                if quiet:
+                    self.pace = max(MIN_PACE, self.pace * PACE_DECAY)
+                if quiet and self._healthy >= GROW_AFTER:
+                    self._healthy = 0
+                    self.max_len = min(MAX_CHUNK_LEN, self.max_len + CHUNK_LEN_STEP)
+            n_chars = sum(len(cmd) for cmd in cmds)
+            return max(0.0, drain_time(n_chars, len(cmds)) * self.pace - rtt)
+
+    def record_overflow(self) -> None:
+        """The display reported a buffer overflow: shrink chunks and slow down."""
+        with self._lock:
+            now = time.monotonic()
+            self.overflows += 1
+            self._healthy = 0
+            burst = self._last_overflow is not None and now - self._last_overflow < OVERFLOW_HOLDOFF
+            self._last_overflow = now
+            if burst:
+                return
+            self.max_len = max(MIN_CHUNK_LEN, self.max_len // 2)
+            self.pace = min(MAX_PACE, self.pace + PACE_STEP)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tuning state for the status API."""
+        with self._lock:
+            return {
+                "max_len": self.max_len,
+                "max_cmds": self.max_cmds,
+                "pace": round(self.pace, 2),
+                "rtt_ms": round(self.rtt * 1000, 1) if self.rtt is not None else None,
+                "deliveries": self.deliveries,
+                "overflows": self.overflows,
+                "last_overflow_ago": (
+                    round(time.monotonic() - self._last_overflow, 1)
+                    if self._last_overflow is not None
+                    else None
+                ),
+            }
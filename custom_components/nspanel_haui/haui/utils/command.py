@@ -0,0 +1,86 @@
+"""Nextion command helpers shared by the render and transport paths.
+
+* :func:`command_key` / :func:`dedup_commands` — identify the target written
+  by a command and collapse repeated writes (last write wins).
+* :class:`CommandPriority` / :func:`command_priority` — the priority lane the
+  commands produced on the current thread are queued in.  Interaction
+  handlers run at ``INTERACTIVE`` so their feedback overtakes queued periodic
+  (``BACKGROUND``) refreshes in the outbound queue.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from enum import IntEnum
+
+
+class CommandPriority(IntEnum):
+    """Outbound lanes, lower values are delivered first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_local = threading.local()
+
+
+def current_priority() -> CommandPriority:
+    """Return the priority of commands produced on the calling thread."""
+    priority = getattr(_local, "priority", None)
+    return CommandPriority.NORMAL if priority is None else priority
+
+
+@contextmanager
+def command_priority(priority: CommandPriority) -> Generator[None, None, None]:
+    """Queue all commands produced inside the block in the *priority* lane.
+
+    Nested blocks keep the most urgent priority, so a background helper called
+    from an interaction handler does not demote the interaction's feedback.
+    The outermost block sets the priority as given.
+    """
+    previous = getattr(_local, "priority", None)
+    _local.priority = priority if previous is None else min(previous, priority)
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def command_key(cmd: str) -> str | None:
+    """Return the target a command writes (``comp.attr`` / ``vis comp``), or ``None``.
+
+    Non-assignment commands (ref, click, cls, page, ...) have no key; their
+    position relative to the writes matters and they are never collapsed.
+    """
+    eq = cmd.find("=")
+    if eq > 0:
+        return cmd[:eq]
+    if cmd.startswith("vis "):
+        comma = cmd.rfind(",")
+        if comma > 0:
+            return cmd[:comma]
+    return None
+
+
+def dedup_commands(commands: list[str]) -> list[str]:
+    """Collapse multiple writes to the same target so the last write wins.
+
+    Non-assignment commands (vis, ref, click, cirs, ...) are preserved in place
+    to keep their ordering relative to the writes.  ``vis`` commands are also
+    deduplicated by component name so that hide-then-show of the same component
+    collapses to just the show.
+    """
+    keys = [command_key(cmd) for cmd in commands]
+    last_seen: dict[str, int] = {}
+    for i, key in enumerate(keys):
+        if key is not None:
+            last_seen[key] = i
+    result: list[str] = []
+    for i, cmd in enumerate(commands):
+        key = keys[i]
+        if key is None or last_seen[key] == i:
+            result.append(cmd)
+    return result
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import threading
+import time
 import zoneinfo
+from collections.abc import Callable
 
 from .locale_data import (
     get_day_name,
@@ -9,20 +13,69 @@ from .locale_data import (
     get_pattern,
 )
 
+# strftime directives that change faster than once a minute; strings using
+# them are never memoized
+_SUBMINUTE_DIRECTIVES = ("%S", "%s", "%f", "%X", "%T", "%c", "%r")
 
-def _get_now(timezone: str | None = None) -> datetime.datetime:
+
+@functools.lru_cache(maxsize=32)
+def _get_zone(timezone: str) -> zoneinfo.ZoneInfo:
+    return zoneinfo.ZoneInfo(timezone)
+
+
+class _MinuteMemo:
+    """Formatted strings of the current minute, shared by all callers.
+
+    Every clock page of every panel formats the same few strings when the
+    minute ticks.  The first caller of a minute formats each distinct
+    (format, locale, timezone) string, the others reuse it.  Entries of
+    earlier minutes are dropped as soon as the minute changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._minute = -1
+        self._values: dict[tuple, str] = {}
+
+    def get(self, key: tuple, compute: Callable[[float], str]) -> str:
+        """Return the memoized string of *key*, computing it with ``compute(now)``."""
+        now = time.time()
+        minute = int(now // 60)
+        with self._lock:
+            if minute != self._minute:
+                self._minute = minute
+                self._values = {}
+            value = self._values.get(key)
+        if value is None:
+            value = compute(now)
+            with self._lock:
+                if minute == self._minute:
+                    self._values[key] = value
+        return value
+
+
+_minute_memo = _MinuteMemo()
+
+
+def _is_minute_stable(fmt: str | None) -> bool:
+    return fmt is None or not any(d in fmt for d in _SUBMINUTE_DIRECTIVES)
+
+
+def get_now(timezone: str | None = None, now: float | None = None) -> datetime.datetime:
     """Return the current datetime, optionally in the given timezone.
 
     Args:
         timezone: IANA timezone string (e.g. "America/New_York") or None
                   to use the host machine's local time.
+        now: Optional POSIX timestamp to use instead of the current time.
 
     Returns:
         datetime.datetime: Current datetime in the requested timezone.
     """
-    if timezone:
-        return datetime.datetime.now(tz=zoneinfo.ZoneInfo(timezone))
-    return datetime.datetime.now()
+    tz = _get_zone(timezone) if timezone else None
+    if now is None:
+        return datetime.datetime.now(tz=tz)
+    return datetime.datetime.fromtimestamp(now, tz=tz)
 
 
 def get_time_localized(timeformat: str, timezone: str | None = None) -> str:
@@ -36,8 +89,12 @@ def get_time_localized(timeformat: str, timezone: str | None = None) -> str:
     Returns:
         str: Localized time string
     """
-    time = _get_now(timezone).strftime(timeformat)
-    return time
+    if not _is_minute_stable(timeformat):
+        return get_now(timezone).strftime(timeformat)
+    return _minute_memo.get(
+        ("time", timeformat, timezone),
+        lambda now: get_now(timezone, now).strftime(timeformat),
+    )
 
 
 def get_date_localized(
@@ -54,8 +111,13 @@ def get_date_localized(
     Returns:
         str: Localized date string
     """
-    dt = _get_now(timezone)
-    return format_datetime(dt, strftime_format, babel_format, locale)
+
+    def _format(now: float | None = None) -> str:
+        return format_datetime(get_now(timezone, now), strftime_format, babel_format, locale)
+
+    if not _is_minute_stable(strftime_format):
+        return _format()
+    return _minute_memo.get(("date", strftime_format, babel_format, locale, timezone), _format)
 
 
 def format_datetime(
@@ -1,7 +1,9 @@
 """Debouncer for suppressing noisy state-change events (state flapping).
 
-Uses :class:`threading.Timer` internally. When *executor* is provided,
-timer callbacks are dispatched to the HA executor thread so page code
+With *timers* (the hub-wide timer service of the app), delays are
+scheduled on the HA event loop and the callbacks run as executor jobs.
+Without it, :class:`threading.Timer` is used; when *executor* is provided,
+timer callbacks are then dispatched to the HA executor thread so page code
 always runs on the correct thread.
 """
 
@@ -9,6 +11,7 @@ from __future__ import annotations
 
 import threading
 from collections.abc import Callable
+from typing import Any
 
 
 class Debouncer:
@@ -22,16 +25,22 @@ class Debouncer:
         Optional callable that takes a no-arg function and schedules it
         on the HA executor thread. If ``None`` the callback runs on the
         timer thread directly (legacy behaviour).
+    timers
+        Optional timer service (``call_later(delay, func)`` returning a
+        handle with ``cancel()``) running *func* on the executor.  Takes
+        precedence over *executor*; no thread is started per call.
     """
 
     def __init__(
         self,
         delay: float = 0.3,
         executor: Callable[[Callable[[], None]], None] | None = None,
+        timers: Any = None,
     ):
         self.delay = delay
-        self._timers: dict[str, threading.Timer] = {}
+        self._timers: dict[str, Any] = {}
         self._executor = executor
+        self._timer_service = timers
 
     def call(self, key: str, func: Callable[[], None]) -> None:
         """Schedule *func* to be called after :attr:`delay` seconds.
@@ -42,6 +51,10 @@ class Debouncer:
         if key in self._timers:
             self._timers[key].cancel()
 
+        if self._timer_service is not None:
+            self._timers[key] = self._timer_service.call_later(self.delay, func)
+            return
+
         # Wrap in executor dispatch when available
         executor = self._executor
         if executor is not None:
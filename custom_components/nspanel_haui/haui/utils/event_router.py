@@ -0,0 +1,139 @@
+"""Subscription-based event dispatch.
+
+Controllers, the device and the active page subscribe to the event names
+their ``process_event`` handles (see ``HAUIBase.EVENTS``).  Dispatching an
+event is one dictionary lookup returning the subscribed handlers in
+subscription order; an event nobody subscribed to costs nothing more.
+
+Handlers subscribed with ``names=None`` receive every event (e.g. the
+connection controller while disconnected, where any event is a livesign).
+The time spent in each handler is recorded for diagnostics.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import traceback
+from collections.abc import Callable, Iterable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EventRoute:
+    """One subscription: a handler and the event names it receives."""
+
+    __slots__ = ("owner", "handler", "names", "calls", "errors", "total", "max")
+
+    def __init__(
+        self, owner: str, handler: Callable[[Any], None], names: frozenset[str] | None
+    ) -> None:
+        self.owner = owner
+        self.handler = handler
+        self.names = names
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "owner": self.owner,
+            "events": "*" if self.names is None else sorted(self.names),
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 1),
+            "avg_ms": round(self.total * 1000 / self.calls, 2) if self.calls else None,
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class EventRouter:
+    """Routes events by name to the handlers subscribed to them.
+
+    Parameters
+    ----------
+    on_error
+        Called with the route, the event and the formatted traceback when a
+        handler raises; the remaining handlers still run.
+    """
+
+    def __init__(self, on_error: Callable[[EventRoute, Any, str], None] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._routes: list[EventRoute] = []
+        # (name -> routes, wildcard routes); replaced as a whole on every
+        # change so dispatch never needs the lock
+        self._routing: tuple[dict[str, tuple[EventRoute, ...]], tuple[EventRoute, ...]] = ({}, ())
+        self._on_error = on_error
+
+    def subscribe(
+        self, owner: str, handler: Callable[[Any], None], names: Iterable[str] | None = None
+    ) -> EventRoute:
+        """Subscribe *handler* to *names* (``None``: every event)."""
+        with self._lock:
+            route = EventRoute(owner, handler, _freeze(names))
+            self._routes.append(route)
+            self._rebuild()
+        return route
+
+    def resubscribe(self, route: EventRoute, names: Iterable[str] | None) -> None:
+        """Change the event names of *route*, keeping its position."""
+        frozen = _freeze(names)
+        with self._lock:
+            if frozen == route.names:
+                return
+            route.names = frozen
+            self._rebuild()
+
+    def unsubscribe(self, route: EventRoute) -> None:
+        with self._lock:
+            if route in self._routes:
+                self._routes.remove(route)
+                self._rebuild()
+
+    def dispatch(self, event: Any) -> int:
+        """Pass *event* to every subscribed handler; returns the number of handlers run."""
+        table, wildcard = self._routing
+        # Only wildcard subscribers receive names nobody subscribed to
+        routes = table.get(event.name, wildcard)
+        for route in routes:
+            start = time.perf_counter()
+            try:
+                route.handler(event)
+            except Exception:  # noqa: BLE001
+                route.errors += 1
+                if self._on_error is not None:
+                    self._on_error(route, event, traceback.format_exc())
+                else:
+                    _LOGGER.exception("Error processing event %s in %s", event.name, route.owner)
+            elapsed = time.perf_counter() - start
+            route.calls += 1
+            route.total += elapsed
+            if elapsed > route.max:
+                route.max = elapsed
+        return len(routes)
+
+    def as_dict(self) -> list[dict[str, Any]]:
+        """Per-handler statistics for the status API."""
+        return [route.as_dict() for route in self._routes]
+
+    def reset_stats(self) -> None:
+        """Clear the per-handler statistics."""
+        for route in self._routes:
+            route.calls = route.errors = 0
+            route.total = route.max = 0.0
+
+    def _rebuild(self) -> None:
+        wildcard = tuple(route for route in self._routes if route.names is None)
+        table: dict[str, tuple[EventRoute, ...]] = {}
+        for name in {name for route in self._routes if route.names for name in route.names}:
+            table[name] = tuple(
+                route for route in self._routes if route.names is None or name in route.names
+            )
+        self._routing = (table, wildcard)
+
+
+def _freeze(names: Iterable[str] | None) -> frozenset[str] | None:
+    return None if names is None else frozenset(names)
@@ -0,0 +1,125 @@
+"""Per-device event trace for latency diagnostics.
+
+When enabled (device setting ``event_trace`` > 0), every device event gets a
+:class:`TraceRecord` at ingress that follows it through the stages of its
+handling:
+
+``bus``
+    HA bus delivery: from the event being fired to the ESPHome proxy
+    receiving it (only when the event carries its fire time).
+``queued``
+    Time until the device's event consumer picked the event up (executor
+    hop plus events queued before it).
+``dispatch``
+    Time spent in the controllers / device handling the event.
+``page``
+    Part of ``dispatch`` spent in the active page's ``process_event``.
+``render``
+    When the last ``rec_cmd`` batch produced by the event was flushed
+    (``commands`` counts the commands of all its batches).
+``published``
+    When the last publish produced by the event was delivered to the device.
+
+``queued``, ``render`` and ``published`` are offsets in milliseconds from
+ingress; ``bus``, ``dispatch`` and ``page`` are durations.  The latest
+records are kept in a fixed-size ring buffer.  With tracing disabled, no
+record is created and every stage check is a single ``None`` test.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+# Characters of the event value kept in a record
+VALUE_PREVIEW = 80
+
+
+class TraceRecord:
+    """Arrival time and per-stage latency of one device event."""
+
+    __slots__ = ("commands", "name", "received", "seq", "stages", "t0", "value")
+
+    def __init__(self, seq: int, name: str, value: Any) -> None:
+        self.seq = seq
+        self.name = name
+        self.value = str(value)[:VALUE_PREVIEW]
+        self.received = time.time()
+        self.t0 = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.commands = 0
+
+    def mark(self, stage: str) -> None:
+        """Record that *stage* was reached now (offset from ingress)."""
+        self.stages[stage] = (time.perf_counter() - self.t0) * 1000
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add *seconds* to the duration of *stage*."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds * 1000
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "name": str(self.name),
+            "value": self.value,
+            "received": datetime.fromtimestamp(self.received, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "commands": self.commands,
+            **{f"{stage}_ms": round(ms, 2) for stage, ms in self.stages.items()},
+        }
+
+
+class EventTrace:
+    """Ring buffer of the latest :class:`TraceRecord` of one device."""
+
+    def __init__(self, size: int) -> None:
+        self._lock = threading.Lock()
+        self._records: deque[TraceRecord] = deque(maxlen=max(1, size))
+        self._seq = 0
+
+    @property
+    def size(self) -> int:
+        return self._records.maxlen or 0
+
+    def new(self, name: str, value: Any) -> TraceRecord:
+        """Create the record of an event arriving now and add it to the buffer."""
+        with self._lock:
+            self._seq += 1
+            record = TraceRecord(self._seq, name, value)
+            self._records.append(record)
+        return record
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Records for the status API / diagnostics, oldest first."""
+        with self._lock:
+            records = list(self._records)
+        return [record.as_dict() for record in records]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+_local = threading.local()
+
+
+def current_trace() -> TraceRecord | None:
+    """Return the record of the event handled on the calling thread, if traced."""
+    return getattr(_local, "record", None)
+
+
+@contextmanager
+def tracing(record: TraceRecord) -> Generator[None, None, None]:
+    """Attribute renders and publishes inside the block to *record*."""
+    previous = current_trace()
+    _local.record = record
+    try:
+        yield
+    finally:
+        _local.record = previous
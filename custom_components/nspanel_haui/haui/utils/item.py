@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from ..mapping.color import ALARM_COLORS, CLIMATE_COLORS, COLORS, WEATHER_COLORS
 from ..mapping.icon_mapping import (
@@ -21,6 +24,108 @@ _DEFAULT_COLOR_GETTER: _ColorGetter = COLORS.__getitem__
 if TYPE_CHECKING:
     from ..abstract.haui_item import HAUIItem
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# --- memoization of derived display values ---
+
+# Derived values kept (shared by every item of every device)
+DISPLAY_CACHE_SIZE = 2048
+
+
+class DisplayCache:
+    """LRU cache of icons, colors, values and names derived from entity states.
+
+    Entries are keyed by the entity's state version (``last_updated``), so a
+    state change makes the entries of the entity unreachable; they age out.
+    Filled and read from executor threads of every device.
+    """
+
+    def __init__(self, size: int = DISPLAY_CACHE_SIZE) -> None:
+        self._lock = threading.Lock()
+        self._size = size
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the value cached under *key*, computing and storing it if missing."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+display_cache = DisplayCache()
+
+
+def _memoized(variant: Callable[..., Hashable]) -> Callable[[_F], _F]:
+    """Cache a ``get_item_*`` function in :data:`display_cache`.
+
+    The key is the function, the entity id, the version of its state, the
+    item config, the locale and ``variant(*args, **kwargs)`` of the remaining
+    arguments.  Items without an entity in HA are not cached.
+    """
+
+    def decorator(fn: _F) -> _F:
+        @functools.wraps(fn)
+        def wrapper(haui_item: HAUIItem, *args: Any, **kwargs: Any) -> Any:
+            entity = haui_item.get_item()
+            version = getattr(entity, "last_updated", None)
+            if version is None:
+                return fn(haui_item, *args, **kwargs)
+            key = (
+                fn.__name__,
+                haui_item.get_item_id(),
+                version,
+                haui_item.get_config_key(),
+                haui_item.get_locale(),
+                variant(*args, **kwargs),
+            )
+            return display_cache.get(key, lambda: fn(haui_item, *args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _default_variant(default: Any) -> Hashable:
+    return default
+
+
+def _color_variant(
+    default_color: int, color_getter: _ColorGetter = _DEFAULT_COLOR_GETTER
+) -> Hashable:
+    # The theme colors the result may fall back to, not the getter itself:
+    # items sharing a theme share entries
+    return (
+        default_color,
+        color_getter("entity_on"),
+        color_getter("entity_off"),
+        color_getter("entity_unavailable"),
+    )
+
+
 # --- execute_item dispatch ---
 
 _TOGGLE_TYPES = frozenset(
@@ -169,6 +274,7 @@ _COLOR_DISPATCH = {
 _ON_STATES = frozenset(["on", "unlocked", "above_horizon", "home", "active"])
 
 
+@_memoized(_color_variant)
 def get_item_color(
     haui_item: HAUIItem, default_color: int, color_getter: _ColorGetter = _DEFAULT_COLOR_GETTER
 ) -> int:
@@ -208,6 +314,7 @@ def get_item_color(
     return result_color
 
 
+@_memoized(_default_variant)
 def get_item_icon(haui_item: HAUIItem, default_icon: str) -> str:
     """Returns a icon for the given entity.
 
@@ -324,6 +431,7 @@ _VALUE_DISPATCH = {
 }
 
 
+@_memoized(_default_variant)
 def get_item_value(haui_item: HAUIItem, default_value: str) -> str:
     """Returns a value for the given entity.
 
@@ -347,6 +455,7 @@ def get_item_value(haui_item: HAUIItem, default_value: str) -> str:
     return haui_item.translate_item_state()
 
 
+@_memoized(_default_variant)
 def get_item_name(haui_item: HAUIItem, default_name: str) -> str:
     """Returns the name for the given entity.
 
@@ -365,3 +474,55 @@ def get_item_name(haui_item: HAUIItem, default_name: str) -> str:
     name = entity.attributes.get("friendly_name", name)
 
     return name
+
+
+# --- get_item_fields ---
+
+# State fields every item getter may read
+_BASE_FIELDS = ("state", "friendly_name", "device_class")
+
+# Attributes read per item type by the item getters and the row detail controls
+_TYPE_FIELDS = {
+    "light": ("rgb_color", "brightness"),
+    "media_player": ("media_content_type", "media_channel", "icon"),
+    "weather": ("temperature", "temperature_unit"),
+    "cover": ("current_position", "supported_features"),
+    "number": ("min", "max", "step"),
+    "input_number": ("min", "max", "step"),
+}
+
+# Item config keys that may hold templates
+_TEMPLATE_KEYS = ("name", "value", "icon", "color")
+
+
+def _is_template(value: Any) -> bool:
+    if isinstance(value, dict):
+        return any(_is_template(v) for v in value.values())
+    return isinstance(value, str) and ("{{" in value or "{%" in value)
+
+
+def get_item_fields(haui_item: HAUIItem) -> frozenset[str] | None:
+    """Returns the state fields the item's name, value, icon and color are built from.
+
+    ``"state"`` stands for the entity state, everything else is an attribute
+    name.  Used to skip state changes that do not affect what is shown.
+
+    Args:
+        haui_item (HAUIItem): The item to get the fields for
+
+    Returns:
+        frozenset | None: Field names, None if a template may read any of them
+    """
+    if any(_is_template(haui_item.get(key, None)) for key in _TEMPLATE_KEYS):
+        return None
+    fields = set(_BASE_FIELDS)
+    fields.update(_TYPE_FIELDS.get(haui_item.get_item_type(), ()))
+    # state overridden by an attribute (or a path into one)
+    state = haui_item.get("state", "")
+    if isinstance(state, str) and state.startswith("["):
+        return None
+    if isinstance(state, (list, tuple)) and state:
+        state = state[0]
+    if isinstance(state, str) and state:
+        fields.add(state)
+    return frozenset(fields)
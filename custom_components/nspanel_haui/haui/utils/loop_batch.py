@@ -0,0 +1,83 @@
+"""Grouping of the event loop calls made by one thread.
+
+Registering and cancelling timers and state listeners is done on the HA
+event loop; each ``call_soon_threadsafe`` wakes the loop once.  Handling one
+device event or opening a panel cancels and restarts several timers (page,
+close, idle, nav-home) and swaps the page's state listeners.
+
+Inside a :func:`loop_batch` block, :func:`call_soon` queues the calls of the
+calling thread instead, and the outermost block submits them in one loop
+hop, in the order they were made.  Outside a block, :func:`call_soon` hops
+to the loop right away.  Blocks nest; ``rec_cmd`` batches, the dispatch of a
+device event and panel transitions are batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+def call_soon(loop: asyncio.AbstractEventLoop, fn: Callable[..., Any], *args: Any) -> None:
+    """Call ``fn(*args)`` on *loop*, at the end of the thread's batch if inside one."""
+    calls = getattr(_local, "calls", None)
+    if calls is not None:
+        calls.append((loop, fn, args))
+        return
+    try:
+        loop.call_soon_threadsafe(fn, *args)
+    except RuntimeError:
+        pass  # Event loop is closed during HA shutdown
+
+
+def begin_loop_batch() -> None:
+    """Start grouping the loop calls of the calling thread (re-entrant)."""
+    depth = getattr(_local, "depth", 0)
+    if depth == 0:
+        _local.calls = []
+    _local.depth = depth + 1
+
+
+def end_loop_batch() -> None:
+    """Leave a batch; the outermost exit submits the queued calls."""
+    depth = getattr(_local, "depth", 0)
+    if depth > 1:
+        _local.depth = depth - 1
+        return
+    calls = getattr(_local, "calls", None) or []
+    _local.depth = 0
+    _local.calls = None
+    by_loop: dict[asyncio.AbstractEventLoop, list[tuple[Callable[..., Any], tuple]]] = {}
+    for loop, fn, args in calls:
+        by_loop.setdefault(loop, []).append((fn, args))
+    for loop, loop_calls in by_loop.items():
+        try:
+            loop.call_soon_threadsafe(_run_calls, loop_calls)
+        except RuntimeError:
+            pass  # Event loop is closed during HA shutdown
+
+
+@contextmanager
+def loop_batch() -> Generator[None, None, None]:
+    """Submit the loop calls made inside the block in one hop per loop."""
+    begin_loop_batch()
+    try:
+        yield
+    finally:
+        end_loop_batch()
+
+
+def _run_calls(calls: list[tuple[Callable[..., Any], tuple]]) -> None:
+    for fn, args in calls:
+        try:
+            fn(*args)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Batched loop call %s failed", fn)
@@ -28,6 +28,8 @@ import threading
 from collections.abc import Callable
 from typing import Any
 
+from .command import CommandPriority, command_priority
+
 
 def _noop() -> None:
     """No-op sentinel for when no page has registered a callback."""
@@ -46,16 +48,22 @@ class NotificationBlinker:
         Defaults to a no-op.
     interval
         Blink interval in seconds (default 1.0).
+    timers
+        Optional timer service (``call_later(delay, func)`` returning a
+        handle with ``cancel()``) running the blink ticks on the executor.
+        Without it, each tick starts a :class:`threading.Timer`.
     """
 
     def __init__(
         self,
         refresh_fn: Callable[[], None] = _noop,
         interval: float = 1.0,
+        timers: Any = None,
     ) -> None:
         self._refresh_fn = refresh_fn
         self._interval = interval
-        self._timer: threading.Timer | None = None
+        self._timer_service = timers
+        self._timer: Any = None
         self._new_notifications = False
 
     # ------------------------------------------------------------------
@@ -130,10 +138,21 @@ class NotificationBlinker:
         """Call the refresh function and schedule the next blink."""
         self._refresh_fn()
 
-        if self._new_notifications:
-            self._timer = threading.Timer(self._interval, self._tick)
-            self._timer.daemon = True
-            self._timer.start()
+        if not self._new_notifications:
+            return
+        if self._timer_service is not None:
+            # Ticks run as background executor jobs
+            self._timer = self._timer_service.call_later(self._interval, self._tick)
+            return
+        timer = threading.Timer(self._interval, self._background_tick)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _background_tick(self) -> None:
+        """Timer entry point: blink updates yield to interaction feedback."""
+        with command_priority(CommandPriority.BACKGROUND):
+            self._tick()
 
 
 _NOTIFICATION_EVENTS: frozenset[str] = frozenset(
@@ -0,0 +1,44 @@
+"""Render-scoped snapshots of entity states.
+
+Rendering a tile reads the same entity many times: icon, color, value and
+name each look up the state and its attributes again.  While a ``rec_cmd``
+batch is recorded, the adapter serves these reads from a snapshot of the
+calling thread instead: the first read of an entity stores its HA ``State``
+object, and every later read in the same batch reuses it.  Attributes are
+handed out as read-only views of that state, never as copies.
+
+HA replaces ``State`` objects on every change instead of mutating them, so
+a snapshot is a consistent view of each entity as it was when the batch
+first looked at it.  Snapshots nest with ``rec_cmd``: only the outermost
+batch of a thread creates and drops one.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+_local = threading.local()
+
+
+def begin_snapshot() -> None:
+    """Enter a render pass on the calling thread (re-entrant)."""
+    depth = getattr(_local, "depth", 0)
+    if depth == 0:
+        _local.states = {}
+    _local.depth = depth + 1
+
+
+def end_snapshot() -> None:
+    """Leave a render pass; the outermost exit drops the snapshot."""
+    depth = getattr(_local, "depth", 0)
+    if depth <= 1:
+        _local.depth = 0
+        _local.states = None
+    else:
+        _local.depth = depth - 1
+
+
+def current_snapshot() -> dict[str, Any] | None:
+    """Entity states read in the render pass of the calling thread, if any."""
+    return getattr(_local, "states", None)
@@ -0,0 +1,150 @@
+"""Per-device telemetry for the display command path.
+
+Counts what each device sends (commands, bytes, chunks), what the
+optimisations in front of the transport save (dedup / shadow drops,
+superseded and coalesced queue items), what gets lost (timeouts, device not
+available) and how long a publish takes from ``publish()`` until the native
+API call completed.
+
+Counters are kept per device and per page type; the page type is the one
+shown on the device when a counter is bumped.  Recording happens both on
+executor threads (render path) and on the event loop (outbound queue), so
+all state is guarded by a lock.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any
+
+COUNTERS = (
+    "commands",  # Nextion commands handed to the transport
+    "bytes",  # UTF-8 size of those commands
+    "chunks",  # transport sends (send_command / send_commands calls)
+    "publishes",  # ESPHome service calls delivered
+    "dedup_drops",  # writes collapsed by rec_cmd dedup / identical consecutive sends
+    "shadow_drops",  # writes the display already showed (DisplayShadow)
+    "superseded",  # queued writes made obsolete by a newer batch
+    "coalesced",  # queued batches merged into a frame
+    "timeouts",  # publishes abandoned after the publish timeout
+    "errors",  # publishes that raised
+    "unavailable",  # publishes lost because the device was not available
+    "queue_dropped",  # publishes dropped from a full outbound queue
+    "events_coalesced",  # incoming device events merged into a superseding one
+    "state_filtered",  # entity state changes dropped as not touching any rendered field
+)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Latency samples kept for percentiles (per device and per page type)
+LATENCY_SAMPLES = 512
+
+NO_PAGE = "none"
+
+_BUCKET_LABELS = tuple(f"<={b}" for b in LATENCY_BUCKETS_MS) + (f">{LATENCY_BUCKETS_MS[-1]}",)
+
+
+class _Stats:
+    __slots__ = ("counters", "histogram", "samples")
+
+    def __init__(self, samples: int) -> None:
+        self.counters: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.histogram: list[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.samples: deque[float] = deque(maxlen=samples)
+
+    def record_latency(self, ms: float) -> None:
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.samples.append(ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = dict(self.counters)
+        result["latency_ms"] = _percentiles(self.samples)
+        result["latency_histogram"] = {
+            label: count for label, count in zip(_BUCKET_LABELS, self.histogram, strict=True)
+        }
+        return result
+
+
+def _percentiles(samples: deque[float]) -> dict[str, float | int | None]:
+    if not samples:
+        return {"count": 0, "p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+
+    def pct(p: float) -> float:
+        return round(ordered[min(last, int(p * len(ordered)))], 1)
+
+    return {
+        "count": len(ordered),
+        "p50": pct(0.50),
+        "p90": pct(0.90),
+        "p99": pct(0.99),
+        "max": round(ordered[last], 1),
+    }
+
+
+class TransportTelemetry:
+    """Counters and publish latencies of one device, in total and per page type."""
+
+    def __init__(self, samples: int = LATENCY_SAMPLES) -> None:
+        self._lock = threading.Lock()
+        self._samples = samples
+        self.page_type = NO_PAGE
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and latency samples."""
+        with self._lock:
+            self._total = _Stats(self._samples)
+            self._pages: dict[str, _Stats] = {}
+            self._since = datetime.now(UTC).isoformat()
+
+    def set_page_type(self, page_type: str | None) -> None:
+        """Attribute subsequent records to *page_type* (the page shown on the device)."""
+        self.page_type = page_type or NO_PAGE
+
+    def _page(self) -> _Stats:
+        stats = self._pages.get(self.page_type)
+        if stats is None:
+            stats = self._pages[self.page_type] = _Stats(self._samples)
+        return stats
+
+    def count(self, counter: str, n: int = 1) -> None:
+        """Add *n* to *counter* (one of :data:`COUNTERS`)."""
+        if n <= 0:
+            return
+        with self._lock:
+            self._total.counters[counter] += n
+            self._page().counters[counter] += n
+
+    def record_send(self, cmds: list[str]) -> None:
+        """Record one transport send carrying *cmds*."""
+        n_bytes = sum(len(cmd.encode()) for cmd in cmds)
+        with self._lock:
+            for stats in (self._total, self._page()):
+                counters = stats.counters
+                counters["chunks"] += 1
+                counters["commands"] += len(cmds)
+                counters["bytes"] += n_bytes
+
+    def record_publish(self, seconds: float) -> None:
+        """Record a delivered publish and its latency (queued until delivered)."""
+        ms = seconds * 1000
+        with self._lock:
+            for stats in (self._total, self._page()):
+                stats.counters["publishes"] += 1
+                stats.record_latency(ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot for the status API."""
+        with self._lock:
+            return {
+                "since": self._since,
+                "page_type": self.page_type,
+                "total": self._total.as_dict(),
+                "pages": {name: stats.as_dict() for name, stats in self._pages.items()},
+            }
@@ -0,0 +1,172 @@
+"""Display transports for benchmarking and offline analysis.
+
+Besides :class:`~..abstract.display_interface.ESPHomeTransport` any object
+with a ``send(command, value)`` method can back a
+:class:`~..abstract.display_interface.DisplayInterface`:
+
+* :class:`NullTransport` — discards everything, counts what was sent.
+* :class:`RecordingTransport` — writes a timestamped capture of the command
+  stream (JSON lines) and optionally forwards it to another transport, e.g.
+  the ESPHome transport of a live device.
+* :class:`ReplayTransport` — pushes a capture to another transport (a
+  device or a simulator) at the original or an accelerated speed.
+
+A capture has one JSON object per line::
+
+    {"t": 0.0123, "command": "esphome.send_commands", "value": ["t0.txt=\\"a\\"", "vis b0,1"]}
+
+``t`` is the time in seconds since the first recorded send.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+from ..abstract.display_interface import DisplayTransport
+
+
+@dataclass(frozen=True, slots=True)
+class CapturedSend:
+    """One recorded ``send`` call."""
+
+    t: float
+    command: str
+    value: str | list[str]
+
+
+def load_capture(path: str | Path) -> list[CapturedSend]:
+    """Read a capture written by :class:`RecordingTransport`."""
+    with open(path, encoding="utf-8") as fp:
+        return list(iter_capture(fp))
+
+
+def iter_capture(lines: Iterable[str]) -> Iterator[CapturedSend]:
+    """Parse capture lines, skipping blank ones."""
+    for line in lines:
+        line = line.strip()
+        if line:
+            record = json.loads(line)
+            yield CapturedSend(float(record["t"]), record["command"], record["value"])
+
+
+class NullTransport:
+    """Transport that discards every command and counts what was sent."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.sends = 0
+        self.commands = 0
+        self.chars = 0
+        self.by_command: Counter[str] = Counter()
+
+    def send(self, command: str, value: str | list[str]) -> None:
+        cmds = value if isinstance(value, list) else [value]
+        self.sends += 1
+        self.commands += len(cmds)
+        self.chars += sum(len(cmd) for cmd in cmds)
+        self.by_command[command] += 1
+
+
+class RecordingTransport:
+    """Transport that captures the timestamped command stream to a file.
+
+    Parameters
+    ----------
+    target
+        Path of the capture file (overwritten) or an open text file.
+    inner
+        Optional transport every command is forwarded to after recording.
+    clock
+        Monotonic clock used for the timestamps.
+    """
+
+    def __init__(
+        self,
+        target: str | Path | IO[str],
+        inner: DisplayTransport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(target, (str, Path)):
+            # Kept open for the transport's lifetime; closed in close()
+            self._fp: IO[str] = open(target, "w", encoding="utf-8")
+            self._owns_fp = True
+        else:
+            self._fp = target
+            self._owns_fp = False
+        self._inner = inner
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._start: float | None = None
+        self.recorded = 0
+
+    def send(self, command: str, value: str | list[str]) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._start is None:
+                self._start = now
+            record = {"t": round(now - self._start, 6), "command": command, "value": value}
+            self._fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._fp.flush()
+            self.recorded += 1
+        if self._inner is not None:
+            self._inner.send(command, value)
+
+    def close(self) -> None:
+        """Close the capture file if it was opened by this transport."""
+        with self._lock:
+            if self._owns_fp and not self._fp.closed:
+                self._fp.close()
+
+    def __enter__(self) -> RecordingTransport:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class ReplayTransport:
+    """Replays a capture into another transport.
+
+    ``speed`` scales the recorded gaps between sends: ``1.0`` keeps the
+    original timing, ``10.0`` replays ten times faster and ``0`` sends
+    everything back to back.  Commands passed to :meth:`send` directly are
+    forwarded unchanged, so the replay target can be shared with live code.
+    """
+
+    def __init__(
+        self,
+        target: DisplayTransport,
+        speed: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._target = target
+        self.speed = speed
+        self._sleep = sleep
+        self._clock = clock
+
+    def send(self, command: str, value: str | list[str]) -> None:
+        self._target.send(command, value)
+
+    def replay(self, capture: str | Path | Iterable[CapturedSend]) -> int:
+        """Send every recorded command to the target and return how many were sent."""
+        records = load_capture(capture) if isinstance(capture, (str, Path)) else capture
+        start = self._clock()
+        sent = 0
+        for record in records:
+            if self.speed > 0:
+                delay = start + record.t / self.speed - self._clock()
+                if delay > 0:
+                    self._sleep(delay)
+            self._target.send(record.command, record.value)
+            sent += 1
+        return sent
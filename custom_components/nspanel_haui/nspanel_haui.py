@@ -1,8 +1,11 @@
 import datetime
+import time
 from collections.abc import Callable
 from typing import Any, TypedDict
 
+from .clock_service import get_clock_service
 from .ha_adapter import HAAdapter
+from .haui.abstract.display_interface import DisplayShadow
 from .haui.abstract.haui_base import HAUIBase
 from .haui.abstract.haui_config import HAUIConfig
 from .haui.abstract.haui_panel import HAUIPanel
@@ -15,7 +18,14 @@ from .haui.controller.update import HAUIUpdateController
 from .haui.device import HAUIDevice
 from .haui.device_config import DEVICE_CONFIG_FIELDS
 from .haui.mapping.color import ColorTheme
+from .haui.mapping.const import ESPEvent, ESPResponse
 from .haui.mapping.page import PAGE_MAPPING
+from .haui.utils.adaptive_chunker import AdaptiveChunker
+from .haui.utils.command import CommandPriority, command_priority
+from .haui.utils.event_router import EventRoute, EventRouter
+from .haui.utils.event_trace import EventTrace, tracing
+from .haui.utils.loop_batch import loop_batch
+from .haui.utils.telemetry import TransportTelemetry
 
 
 class ControllerDict(TypedDict, total=True):
@@ -50,8 +60,22 @@ class NSPanelHAUI(HAAdapter):
         self._runtime_device_name: str = runtime_device_name
         self._ha_device_id: str | None = ha_device_id
         self._last_panel_update: str | None = None
+        # Minute / hour ticks are shared by all devices; the callbacks this
+        # device subscribed are kept to unsubscribe them on stop
+        self._clock = get_clock_service(hass)
         self._tick_subscribers: dict[str, set[Callable]] = {}
-        self._tick_timers: dict[str, str] = {}
+        # Last component values sent to the current Nextion page (shared by
+        # every DisplayInterface of this device)
+        self.display_shadow = DisplayShadow()
+        # Chunk size / pacing of send_commands batches, tuned from delivery
+        # round trips and buffer overflows
+        self.display_chunker = AdaptiveChunker()
+        # Transport counters and publish latencies (status API, resettable)
+        self.telemetry = TransportTelemetry()
+        # Device events are dispatched by name to the subscribed handlers
+        self.event_router = EventRouter(on_error=self._on_event_error)
+        # Per-stage latency of the latest events (device setting event_trace)
+        self.event_trace: EventTrace | None = None
 
     def initialize(self) -> None:
         self.device_config = HAUIConfig(self, self._config_args)
@@ -77,6 +101,14 @@ class NSPanelHAUI(HAAdapter):
         esp_api = self.get_plugin_api(
             "ESPHome", device_name=device_name, device_id=self._ha_device_id
         )
+        esp_api.on_command_lost = lambda _name: self.display_shadow.invalidate()
+        esp_api.pacer = self.display_chunker
+        esp_api.set_telemetry(self.telemetry)
+        esp_api.set_frame_window(self.device.get("frame_window", 0.04))
+        trace_size = int(self.device.get("event_trace", 0) or 0)
+        if trace_size > 0:
+            self.event_trace = EventTrace(trace_size)
+            esp_api.trace = self.event_trace
 
         esp_config: dict[str, Any] = {
             "devices": self.device_config.get("devices", []),
@@ -102,6 +134,16 @@ class NSPanelHAUI(HAAdapter):
             "esphome, connection, navigation, notification, update, gesture"
         )
 
+        # Controllers first, then the device (same order as before routing)
+        for key, controller in self.controller.items():
+            if isinstance(controller, HAUIBase):
+                controller.subscribe_events(self.event_router, key)
+        self.device.subscribe_events(self.event_router, "device")
+        # Last, so the device has recorded the new display state
+        self.event_router.subscribe(
+            "sleep_timers", self._on_display_state, (ESPEvent.DISPLAY_STATE,)
+        )
+
         self.start()
 
     # lifecycle
@@ -113,10 +155,10 @@ class NSPanelHAUI(HAAdapter):
         self.device.start()
 
     def stop(self) -> None:
-        # Cancel shared tick timers
-        for _cadence, timer_id in list(self._tick_timers.items()):
-            self.cancel_timer(timer_id)
-        self._tick_timers.clear()
+        # Leave the shared clock ticks
+        for cadence, callbacks in list(self._tick_subscribers.items()):
+            for callback in callbacks:
+                self._clock.unsubscribe(cadence, callback)
         self._tick_subscribers.clear()
 
         if self.device:
@@ -129,44 +171,41 @@ class NSPanelHAUI(HAAdapter):
         # missed in their own stop_part cleanup.
         HAAdapter.stop(self)
 
-    # shared tick timers (minute / hour / day cadences)
+    # sleep-aware page timers
+
+    def _on_display_state(self, event: Any) -> None:
+        """Suspend the page timers while the display is off.
+
+        On wake the suspended timers and this device's clock ticks run once,
+        so the page shows the current time and progress right away.
+        """
+        if event.value == "off":
+            self.suspend_timers()
+        else:
+            ticks = [cb for subs in self._tick_subscribers.values() for cb in subs]
+            self.resume_timers(catch_up=ticks)
+
+    # shared tick timers (minute / hour cadences)
 
     def subscribe_tick(self, cadence: str, callback: Callable) -> None:
-        """Register a callback for a device-wide tick cadence.
+        """Register a callback for a shared tick cadence.
 
-        Cadences: ``"minute"`` (60 s, fires on the minute), ``"hour"``
-        (3600 s, fires on the hour).
+        Cadences: ``"minute"`` (fires on the minute), ``"hour"`` (fires on
+        the hour).
 
-        The shared timer starts when the first subscriber registers and
-        stops when the last subscriber unregisters.
+        The ticks come from the hub-wide clock service
+        (``clock_service.ClockService``): one timer per cadence serves the
+        pages of every device.
         """
-        if cadence not in self._tick_subscribers:
-            self._tick_subscribers[cadence] = set()
-        self._tick_subscribers[cadence].add(callback)
-
-        if cadence not in self._tick_timers:
-
-            def _dispatch(cb_args: dict) -> None:
-                for cb in list(self._tick_subscribers.get(cadence, set())):
-                    cb(cb_args)
-
-            # Align the first fire to the next minute/hour boundary so the
-            # display updates on the clock tick, not 60s after registration.
-            now = datetime.datetime.now()
-            if cadence == "minute":
-                secs = 60 - now.second
-                self._tick_timers[cadence] = self.run_minutely(_dispatch, f"now+{secs}")
-            elif cadence == "hour":
-                secs = 3600 - (now.minute * 60 + now.second)
-                self._tick_timers[cadence] = self.run_hourly(_dispatch, f"now+{secs}")
+        self._tick_subscribers.setdefault(cadence, set()).add(callback)
+        self._clock.subscribe(cadence, callback)
 
     def unsubscribe_tick(self, cadence: str, callback: Callable) -> None:
         """Unregister a callback previously added via :meth:`subscribe_tick`."""
         subs = self._tick_subscribers.get(cadence)
-        if subs:
+        if subs and callback in subs:
             subs.discard(callback)
-            if not subs and cadence in self._tick_timers:
-                self.cancel_timer(self._tick_timers.pop(cadence))
+            self._clock.unsubscribe(cadence, callback)
 
     # panel reload (called by API when panels are saved)
 
@@ -286,6 +325,13 @@ class NSPanelHAUI(HAAdapter):
             return page_name
         return f"{page.panel.get('key', '')} ({page.panel.get_type()})"
 
+    def reset_telemetry(self) -> None:
+        """Clear the transport telemetry, event handler statistics and event trace."""
+        self.telemetry.reset()
+        self.event_router.reset_stats()
+        if self.event_trace is not None:
+            self.event_trace.clear()
+
     def get_device_status(self) -> dict:
         """Return live device status for the frontend info strip and dialogs."""
         conn = self.controller["connection"]
@@ -331,7 +377,12 @@ class NSPanelHAUI(HAAdapter):
             result["esphome"] = {
                 "device_names": esphome_ctrl._device_names,
                 "transport": "esphome",
+                "chunking": self.display_chunker.as_dict(),
             }
+        result["telemetry"] = self.telemetry.as_dict()
+        result["event_handlers"] = self.event_router.as_dict()
+        if self.event_trace is not None:
+            result["event_trace"] = self.event_trace.as_list()
 
         # Active state listeners on the current page
         nav = self.controller.get("navigation")
@@ -355,8 +406,7 @@ class NSPanelHAUI(HAAdapter):
 
         # Active timers (run_every / run_minutely / run_hourly / run_in)
         active_timers = []
-        for handle in list(self._timer_handles):
-            meta = self._timer_meta.get(handle, {})
+        for handle, meta in list(self._timer_meta.items()):
             active_timers.append(
                 {
                     "handle": handle,
@@ -372,32 +422,51 @@ class NSPanelHAUI(HAAdapter):
 
     # callbacks
 
-    def callback_event(self, event: Any) -> None:
-        import traceback
+    _INTERACTION_EVENTS = frozenset({ESPEvent.TOUCH_START, ESPEvent.TOUCH_END, ESPEvent.COMPONENT})
+    _INPUT_EVENTS = _INTERACTION_EVENTS | {
+        ESPEvent.TOUCH,
+        ESPEvent.GESTURE,
+        ESPEvent.BUTTON_LEFT,
+        ESPEvent.BUTTON_RIGHT,
+        ESPResponse.READ_RESPONSE,
+    }
 
-        self.log(
-            f"Event dispatch: name={event.name} value={str(event.value)[:120]}",
-            level="DEBUG",
-        )
-
-        for controller in self.controller.values():
-            if isinstance(controller, HAUIBase):
-                try:
-                    controller.process_event(event)
-                except Exception:
-                    self.log(
-                        f"Error processing event {event.name} in {type(controller).__name__}:\n"
-                        f"{traceback.format_exc()}",
-                        level="ERROR",
-                    )
-        try:
-            self.device.process_event(event)
-        except Exception:
+    def callback_event(self, event: Any) -> None:
+        if self.device.get("debug_level") >= 1:
             self.log(
-                f"Error processing event {event.name} in device:\n{traceback.format_exc()}",
-                level="ERROR",
+                f"Event dispatch: name={event.name} value={str(event.value)[:120]}",
+                level="DEBUG",
             )
 
+        # Touching the display can change component state behind our back
+        # (slider positions, pressed states, HMI event code).
+        if event.name in self._INTERACTION_EVENTS:
+            self.display_shadow.invalidate()
+
+        # Feedback for user input overtakes queued background refreshes
+        priority = (
+            CommandPriority.INTERACTIVE
+            if event.name in self._INPUT_EVENTS
+            else CommandPriority.NORMAL
+        )
+        # Timer and listener changes made while handling the event reach
+        # the event loop in one hop
+        with command_priority(priority), loop_batch():
+            record = event.trace
+            if record is None:
+                self._dispatch_event(event)
+            else:
+                start = time.perf_counter()
+                with tracing(record):
+                    self._dispatch_event(event)
+                record.add("dispatch", time.perf_counter() - start)
+
+    def _dispatch_event(self, event: Any) -> None:
+        self.event_router.dispatch(event)
+
+    def _on_event_error(self, route: EventRoute, event: Any, trace: str) -> None:
+        self.log(f"Error processing event {event.name} in {route.owner}:\n{trace}", level="ERROR")
+
     def callback_connection(self, connected: bool) -> None:
         self.log(f"Device connection status: {connected}")
         self.device.on_connection_changed(connected)
@@ -0,0 +1,381 @@
+"""Per-device outbound command queue.
+
+Commands published to an ESPHome device are queued on the HA event loop and
+delivered by a single writer task, one native API call at a time.  Callers
+(executor threads running page/controller code) only enqueue and return, so
+no executor thread is parked for the duration of a device round trip.
+
+The single writer delivers the chunks of a ``send_commands`` batch
+sequentially instead of letting them pile up in the Nextion's command queue
+all at once.
+
+Display commands (``send_command`` / ``send_commands``) are queued in
+priority lanes (see :class:`~.haui.utils.command.CommandPriority`):
+interaction feedback is delivered ahead of already queued normal and
+background refreshes.  When a batch is queued, writes to the same targets
+still waiting in lower lanes are obsolete and removed, so a delayed
+background refresh can never repaint a component with an older value.
+
+Every other action (``goto_page``, heartbeats, sounds, ...) is a barrier:
+nothing queued after it is delivered before it, so render commands for a
+new page can never overtake the page change.  A ``goto_page`` also drops all
+pending background render commands, which would only paint the old page.
+
+Render batches are delivered in frames: a normal or background batch waits
+until ``frame_window`` seconds after it was queued, and every batch of the
+same lane queued by then is merged into one ``send_commands`` call (last
+write to a target wins, as in ``rec_cmd``).  Independent sources rendering
+within a few milliseconds of each other therefore cost one service call.
+Interactive batches are never held back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .haui.mapping.const import ESPAction
+from .haui.utils.adaptive_chunker import DEFAULT_CHUNK_LEN, MAX_CHUNK_COMMANDS
+from .haui.utils.command import CommandPriority, command_key, dedup_commands
+from .haui.utils.telemetry import TransportTelemetry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a single delivery may take before it is abandoned.
+PUBLISH_TIMEOUT = 10.0
+
+# Pending items kept per device.  A device that stopped accepting commands
+# must not let the queue grow without bound; the oldest items are dropped.
+MAX_PENDING = 1000
+
+# Actions carrying Nextion commands; all other actions are ordering barriers.
+RENDER_ACTIONS = frozenset({ESPAction.SEND_COMMAND, ESPAction.SEND_COMMANDS})
+
+
+@dataclass(slots=True)
+class OutboundItem:
+    """A single queued publish (ESPHome action name, value and priority lane)."""
+
+    name: str
+    value: Any
+    priority: CommandPriority = CommandPriority.NORMAL
+    queued_at: float = 0.0
+    # Event trace records (see haui.utils.event_trace) waiting for this delivery
+    traces: tuple[Any, ...] = ()
+
+    @property
+    def commands(self) -> list[str]:
+        """The Nextion commands of a render item as a list."""
+        return self.value if isinstance(self.value, list) else [self.value]
+
+    def keys(self) -> set[str]:
+        """Targets written by this item's Nextion commands."""
+        return {key for cmd in self.commands if isinstance(cmd, str) and (key := command_key(cmd))}
+
+
+class _Epoch:
+    """Render items queued between two barriers, one deque per priority lane."""
+
+    __slots__ = ("barrier", "lanes")
+
+    def __init__(self) -> None:
+        self.lanes: tuple[deque[OutboundItem], ...] = tuple(deque() for _ in CommandPriority)
+        self.barrier: OutboundItem | None = None
+
+
+class OutboundQueue:
+    """Prioritised queue of outbound commands drained by one writer task on the event loop.
+
+    Parameters
+    ----------
+    loop
+        The HA event loop the writer task runs on.
+    send
+        Coroutine function delivering one item to the device.  It may return
+        ``False`` when the item was not delivered (device not available);
+        such items are not recorded as publishes in the telemetry.
+    label
+        Name used in log messages (usually the device name).
+    on_lost
+        Optional callback invoked (on the event loop) with every item that
+        could not be delivered: timed out, failed or dropped from a full queue.
+    limits
+        Optional callable returning ``(max_len, max_cmds)``, the largest
+        merged batch (characters / commands) a frame may produce.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        send: Callable[[str, Any], Awaitable[bool | None]],
+        label: str = "",
+        timeout: float = PUBLISH_TIMEOUT,
+        max_pending: int = MAX_PENDING,
+        on_lost: Callable[[OutboundItem], None] | None = None,
+        limits: Callable[[], tuple[int, int]] | None = None,
+    ) -> None:
+        self._loop = loop
+        self._send = send
+        self._label = label
+        self._timeout = timeout
+        self._max_pending = max_pending
+        self._on_lost = on_lost
+        self._limits = limits
+        self._epochs: deque[_Epoch] = deque([_Epoch()])
+        self._count = 0
+        self._wakeup = asyncio.Event()
+        # Seconds normal/background render batches are held to merge with
+        # batches queued shortly after them (0 = deliver immediately).
+        self.frame_window = 0.0
+        self.superseded = 0
+        self.coalesced = 0
+        # Optional per-device transport telemetry (see TransportTelemetry)
+        self.telemetry: TransportTelemetry | None = None
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def busy(self) -> bool:
+        """Whether the writer task is currently running."""
+        return self._task is not None and not self._task.done()
+
+    # ------------------------------------------------------------------
+    # Producer side (any thread)
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        name: str,
+        value: Any,
+        priority: CommandPriority = CommandPriority.NORMAL,
+        trace: Any = None,
+    ) -> None:
+        """Queue a command for delivery.  Safe to call from any thread.
+
+        *trace* is the record of the traced event that produced the command;
+        it is marked ``published`` when the command was delivered.
+        """
+        item = OutboundItem(name, value, priority, traces=() if trace is None else (trace,))
+        try:
+            self._loop.call_soon_threadsafe(self.async_put, item)
+        except RuntimeError:
+            # Event loop is closed during HA shutdown
+            _LOGGER.debug("Outbound queue %s: loop closed, dropping %s", self._label, name)
+
+    def close(self) -> None:
+        """Drop pending items and stop the writer.  Safe to call from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self.async_close)
+        except RuntimeError:
+            pass  # Event loop is closed during HA shutdown
+
+    # ------------------------------------------------------------------
+    # Event loop side
+    # ------------------------------------------------------------------
+
+    def async_put(self, item: OutboundItem) -> None:
+        """Queue an item and make sure the writer is running (event loop only)."""
+        if self._closed:
+            return
+        item.queued_at = self._loop.time()
+        if self._count >= self._max_pending:
+            dropped = self._pop_oldest()
+            _LOGGER.warning(
+                "Outbound queue for '%s' full (%d items), dropping oldest '%s'",
+                self._label,
+                self._max_pending,
+                dropped.name,
+            )
+            self._count_event("queue_dropped")
+            self._lost(dropped)
+        current = self._epochs[-1]
+        if item.name in RENDER_ACTIONS:
+            self._supersede(current, item)
+            current.lanes[item.priority].append(item)
+            if item.priority == CommandPriority.INTERACTIVE:
+                self._wakeup.set()
+        else:
+            if item.name == ESPAction.GOTO_PAGE:
+                self._drop_lane(CommandPriority.BACKGROUND)
+            current.barrier = item
+            self._epochs.append(_Epoch())
+            # Nothing can join the batches before the barrier any more
+            self._wakeup.set()
+        self._count += 1
+        if not self.busy:
+            self._task = self._loop.create_task(self._run())
+
+    def async_close(self) -> None:
+        """Drop pending items and cancel the writer (event loop only)."""
+        self._closed = True
+        self._epochs = deque([_Epoch()])
+        self._count = 0
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def _supersede(self, epoch: _Epoch, item: OutboundItem) -> None:
+        """Remove writes made obsolete by *item* from the lower-priority lanes of *epoch*."""
+        lower = epoch.lanes[item.priority + 1 :]
+        if not any(lower):
+            return
+        keys = item.keys()
+        if not keys:
+            return
+        for lane in lower:
+            for queued in list(lane):
+                cmds = queued.value if isinstance(queued.value, list) else [queued.value]
+                kept = [cmd for cmd in cmds if command_key(cmd) not in keys]
+                if len(kept) == len(cmds):
+                    continue
+                self.superseded += len(cmds) - len(kept)
+                self._count_event("superseded", len(cmds) - len(kept))
+                if kept:
+                    queued.value = kept if isinstance(queued.value, list) else kept[0]
+                else:
+                    lane.remove(queued)
+                    self._count -= 1
+
+    def _drop_lane(self, priority: CommandPriority) -> None:
+        """Drop every pending render item of one lane (stale after a page change)."""
+        for epoch in self._epochs:
+            lane = epoch.lanes[priority]
+            if lane:
+                _LOGGER.debug(
+                    "Outbound queue '%s': dropping %d stale %s item(s)",
+                    self._label,
+                    len(lane),
+                    priority.name.lower(),
+                )
+                self.superseded += len(lane)
+                self._count_event("superseded", len(lane))
+                self._count -= len(lane)
+                lane.clear()
+
+    def _pop_oldest(self) -> OutboundItem:
+        """Remove the least important item of the oldest epoch (queue full)."""
+        epoch = self._epochs[0]
+        self._count -= 1
+        for lane in reversed(epoch.lanes):
+            if lane:
+                return lane.popleft()
+        self._epochs.popleft()
+        return epoch.barrier  # type: ignore[return-value]
+
+    def _hold(self) -> float:
+        """Seconds until the next item's frame closes (0 = deliver it now, -1 = queue empty)."""
+        epoch = self._epochs[0]
+        for priority, lane in zip(CommandPriority, epoch.lanes, strict=True):
+            if lane:
+                if (
+                    priority == CommandPriority.INTERACTIVE
+                    or self.frame_window <= 0
+                    or len(self._epochs) > 1  # closed by a barrier
+                ):
+                    return 0.0
+                return max(0.0, lane[0].queued_at + self.frame_window - self._loop.time())
+        return 0.0 if epoch.barrier is not None else -1.0
+
+    def _next(self) -> OutboundItem | None:
+        """Pop the next item to deliver, merging the render batches of its frame."""
+        epoch = self._epochs[0]
+        for lane in epoch.lanes:
+            if lane:
+                self._count -= 1
+                return self._merge(lane.popleft(), lane)
+        if epoch.barrier is None:
+            return None
+        self._epochs.popleft()
+        self._count -= 1
+        return epoch.barrier
+
+    def _merge(self, item: OutboundItem, lane: deque[OutboundItem]) -> OutboundItem:
+        """Merge the following batches of *lane* into *item* while they fit one chunk."""
+        if not lane:
+            return item
+        if self._limits is not None:
+            max_len, max_cmds = self._limits()
+        else:
+            max_len, max_cmds = DEFAULT_CHUNK_LEN, MAX_CHUNK_COMMANDS
+        cmds = list(item.commands)
+        total_len = sum(len(cmd) for cmd in cmds)
+        traces = item.traces
+        merged = 1
+        while lane:
+            nxt = lane[0].commands
+            nxt_len = sum(len(cmd) for cmd in nxt)
+            if total_len + nxt_len > max_len or len(cmds) + len(nxt) > max_cmds:
+                break
+            traces += lane.popleft().traces
+            self._count -= 1
+            cmds.extend(nxt)
+            total_len += nxt_len
+            merged += 1
+        if merged == 1:
+            return item
+        self.coalesced += merged - 1
+        self._count_event("coalesced", merged - 1)
+        return OutboundItem(
+            ESPAction.SEND_COMMANDS, dedup_commands(cmds), item.priority, item.queued_at, traces
+        )
+
+    async def _run(self) -> None:
+        """Writer task: deliver queued items one frame at a time until the queue is empty."""
+        while (hold := self._hold()) >= 0:
+            if hold > 0:
+                # Wait for the frame to close; interactive items and barriers
+                # cut the wait short.
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), hold)
+                except TimeoutError:
+                    pass
+                continue
+            item = self._next()
+            if item is None:
+                break
+            try:
+                delivered = await asyncio.wait_for(
+                    self._send(item.name, item.value), self._timeout
+                )
+                if delivered is not False:
+                    if self.telemetry is not None:
+                        self.telemetry.record_publish(self._loop.time() - item.queued_at)
+                    for record in item.traces:
+                        record.mark("published")
+            except TimeoutError:
+                _LOGGER.warning(
+                    "ESPHome publish('%s') to '%s' timed out after %.0fs",
+                    item.name,
+                    self._label,
+                    self._timeout,
+                )
+                self._count_event("timeouts")
+                self._lost(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.error(
+                    "ESPHome publish('%s') to '%s' failed: %s", item.name, self._label, exc
+                )
+                self._count_event("errors")
+                self._lost(item)
+
+    def _count_event(self, counter: str, n: int = 1) -> None:
+        if self.telemetry is not None:
+            self.telemetry.count(counter, n)
+
+    def _lost(self, item: OutboundItem) -> None:
+        if self._on_lost is None:
+            return
+        try:
+            self._on_lost(item)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Outbound queue '%s': on_lost callback failed", self._label)
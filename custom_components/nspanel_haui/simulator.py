@@ -0,0 +1,345 @@
+"""Simulated NSPanel (ESP32 + Nextion) for latency tests and benchmarks.
+
+:class:`NextionSimulator` models the path a display command takes on the
+real device, in virtual time:
+
+1. The ``send_command`` / ``send_commands`` / ``goto_page`` actions of
+   ``esphome/nspanel_haui/api.yaml`` put commands into the ESP32's Nextion
+   command queue (``max_queue_size: 800``).  Commands arriving while the
+   queue is full are dropped.
+2. The queue drains over the UART at 115200 baud, 10 bits per byte, each
+   command followed by the three byte ``0xFF`` terminator.
+3. The Nextion buffers received bytes in its serial buffer (1 KiB) and
+   executes one command at a time.  Loading a page takes much longer than a
+   component write; bytes arriving meanwhile pile up in the buffer and a
+   command that does not fit any more is lost and reported as
+   ``esphome.buffer_overflow`` (``on_buffer_overflow`` in display.yaml).
+4. Every executed ``page`` command is acknowledged with an ``esphome.page``
+   event carrying the page id (``on_page`` → ``page`` sensor in sensor.yaml),
+   which :meth:`HAUINavigationController._handle_page_event` waits for.
+
+:class:`SimulatedESPHomeDevice` runs a simulator on the HA event loop in
+real time.  It exposes an ESPHome-like config entry (``data["device_name"]``,
+``runtime_data`` with ``available``, ``services`` and ``client``) for the
+:class:`~.endpoint_index.EndpointIndex`, and fires the simulator's events
+as ``esphome.nspanel_event`` on the HA bus, exactly like the firmware.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .haui.mapping.const import ESP_NS_EVENT, ESPAction, ESPEvent
+from .haui.utils.adaptive_chunker import CMD_TERMINATOR_LEN, NEXTION_QUEUE_SIZE, UART_BAUD
+
+_LOGGER = logging.getLogger(__name__)
+
+# Nextion serial receive buffer (bytes)
+NEXTION_RX_BUFFER = 1024
+# Seconds the Nextion needs to execute a component write / to load a page
+CMD_EXEC_TIME = 0.0005
+PAGE_LOAD_TIME = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class SimEvent:
+    """An event published by the simulated device."""
+
+    t: float
+    name: str
+    value: str
+
+
+class NextionSimulator:
+    """Discrete-event model of the ESP32 command queue, UART and Nextion.
+
+    Time is virtual: commands are accepted at :attr:`now`, and
+    :meth:`advance` moves the clock forward, executing commands and
+    publishing events (to ``on_event`` and :attr:`events`) as their time
+    comes.  Also usable as a display transport (``send(command, value)``).
+    """
+
+    def __init__(
+        self,
+        baud: int = UART_BAUD,
+        queue_size: int = NEXTION_QUEUE_SIZE,
+        rx_buffer: int = NEXTION_RX_BUFFER,
+        cmd_time: float = CMD_EXEC_TIME,
+        page_time: float = PAGE_LOAD_TIME,
+        page_ids: dict[str, int] | None = None,
+        on_event: Callable[[SimEvent], None] | None = None,
+    ) -> None:
+        self.baud = baud
+        self.queue_size = queue_size
+        self.rx_buffer = rx_buffer
+        self.cmd_time = cmd_time
+        self.page_time = page_time
+        self.on_event = on_event
+        if page_ids is None:
+            from .haui.mapping.page import PAGE_MAPPING
+
+            page_ids = {str(name): page_id for page_id, name in PAGE_MAPPING.items()}
+        self._page_ids = page_ids
+        self.now = 0.0
+        self.page = 0
+        # Executed component writes on the current page (comp.attr / vis comp)
+        self.components: dict[str, str] = {}
+        self.events: list[SimEvent] = []
+        self.stats: dict[str, int] = dict.fromkeys(
+            ("actions", "commands", "bytes", "queue_dropped", "overflows", "pages"), 0
+        )
+        self._uart_free = 0.0
+        self._nextion_free = 0.0
+        # UART completion times of commands still in the ESP32 queue
+        self._queued: deque[float] = deque()
+        # (execution start, size) of commands waiting in the Nextion buffer
+        self._buffered: deque[tuple[float, int]] = deque()
+        self._pending: list[tuple[float, int, Callable[[], None]]] = []
+        self._seq = 0
+
+    # ------------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------------
+
+    def execute(self, action: str, data: dict[str, Any]) -> None:
+        """Run an ESPHome API action (see api.yaml) at the current time."""
+        self.stats["actions"] += 1
+        if action == ESPAction.SEND_COMMAND:
+            self.command(data.get("cmd", ""))
+        elif action == ESPAction.SEND_COMMANDS:
+            for cmd in data.get("commands", []):
+                self.command(cmd)
+        elif action == ESPAction.GOTO_PAGE:
+            if data.get("page", ""):
+                self.command(f"page {data['page']}")
+        else:
+            _LOGGER.debug("Simulator: ignoring action %s", action)
+
+    def send(self, command: str, value: str | list[str]) -> None:
+        """Display transport interface (``esphome.send_command`` / ``esphome.send_commands``)."""
+        action = command.removeprefix("esphome.")
+        if action == ESPAction.SEND_COMMANDS:
+            self.execute(action, {"commands": value if isinstance(value, list) else [value]})
+        else:
+            self.execute(action, {"cmd": value})
+
+    def command(self, cmd: str) -> bool:
+        """Queue one Nextion command; returns ``False`` if the ESP32 queue was full."""
+        if not cmd:
+            return True
+        queued = self._queued
+        while queued and queued[0] <= self.now:
+            queued.popleft()
+        if len(queued) >= self.queue_size:
+            self.stats["queue_dropped"] += 1
+            return False
+        size = len(cmd.encode()) + CMD_TERMINATOR_LEN
+        self.stats["commands"] += 1
+        self.stats["bytes"] += size
+        rx_done = max(self.now, self._uart_free) + size * 10 / self.baud
+        self._uart_free = rx_done
+        queued.append(rx_done)
+
+        # Commands executed by the time this one arrives have left the buffer
+        buffered = self._buffered
+        while buffered and buffered[0][0] <= rx_done:
+            buffered.popleft()
+        if sum(n for _start, n in buffered) + size > self.rx_buffer:
+            self.stats["overflows"] += 1
+            self._schedule(rx_done, lambda: self._publish(ESPEvent.BUFFER_OVERFLOW, "1"))
+            return True
+
+        start = max(rx_done, self._nextion_free)
+        buffered.append((start, size))
+        is_page = cmd.startswith("page ") or cmd == "rest"
+        self._nextion_free = start + (self.page_time if is_page else self.cmd_time)
+        self._schedule(self._nextion_free, lambda: self._run(cmd))
+        return True
+
+    # ------------------------------------------------------------------
+    # Time
+    # ------------------------------------------------------------------
+
+    @property
+    def idle_at(self) -> float:
+        """Virtual time at which every accepted command has been executed."""
+        return max(self.now, self._nextion_free)
+
+    def advance(self, seconds: float) -> list[SimEvent]:
+        """Move the clock forward and return the events published meanwhile."""
+        return self.advance_to(self.now + seconds)
+
+    def advance_to(self, t: float) -> list[SimEvent]:
+        """Move the clock to *t* and return the events published meanwhile."""
+        published = len(self.events)
+        pending = self._pending
+        while pending and pending[0][0] <= t:
+            at, _seq, action = heapq.heappop(pending)
+            self.now = max(self.now, at)
+            action()
+        self.now = max(self.now, t)
+        return self.events[published:]
+
+    def run_until_idle(self) -> list[SimEvent]:
+        """Execute everything accepted so far and return the published events."""
+        return self.advance_to(self.idle_at)
+
+    @property
+    def next_due(self) -> float | None:
+        """Virtual time of the next scheduled execution or event."""
+        return self._pending[0][0] if self._pending else None
+
+    def _schedule(self, at: float, action: Callable[[], None]) -> None:
+        self._seq += 1
+        heapq.heappush(self._pending, (at, self._seq, action))
+
+    # ------------------------------------------------------------------
+    # Nextion
+    # ------------------------------------------------------------------
+
+    def _run(self, cmd: str) -> None:
+        if cmd.startswith("page "):
+            target = cmd[5:].strip()
+            page_id = int(target) if target.isdigit() else self._page_ids.get(target)
+            if page_id is not None:
+                self._load_page(page_id)
+        elif cmd == "rest":
+            self._load_page(0)
+        elif cmd.startswith("vis "):
+            comp, _, value = cmd[4:].rpartition(",")
+            if comp == "255":
+                self.components = {k: v for k, v in self.components.items() if k[:4] != "vis "}
+            self.components[f"vis {comp}"] = value
+        else:
+            target, eq, value = cmd.partition("=")
+            if eq:
+                self.components[target] = value
+
+    def _load_page(self, page_id: int) -> None:
+        self.page = page_id
+        self.components = {}
+        self.stats["pages"] += 1
+        self._publish(ESPEvent.PAGE, str(page_id))
+
+    def _publish(self, name: str, value: str) -> None:
+        event = SimEvent(self.now, str(name), value)
+        self.events.append(event)
+        if self.on_event is not None:
+            self.on_event(event)
+
+
+class _UserService:
+    __slots__ = ("key", "name")
+
+    def __init__(self, key: int, name: str) -> None:
+        self.key = key
+        self.name = name
+
+
+class _SimulatedClient:
+    def __init__(self, device: SimulatedESPHomeDevice) -> None:
+        self._device = device
+
+    async def execute_service(self, service: Any, data: dict[str, Any]) -> None:
+        self._device.async_execute(service.name, data)
+
+
+class _RuntimeData:
+    def __init__(self, device: SimulatedESPHomeDevice, actions: tuple[str, ...]) -> None:
+        self.available = True
+        self.client = _SimulatedClient(device)
+        self.services = {key: _UserService(key, name) for key, name in enumerate(actions, 1)}
+        self._device_updated: list[Callable[[], None]] = []
+
+    def async_subscribe_device_updated(self, cb: Callable[[], None]) -> Callable[[], None]:
+        self._device_updated.append(cb)
+        return lambda: self._device_updated.remove(cb)
+
+
+class SimulatedESPHomeDevice:
+    """Runs a :class:`NextionSimulator` in real time on the HA event loop.
+
+    ``entry`` looks like the device's ESPHome config entry, so an ESPHome
+    proxy resolves the simulator like a real device.  Simulator events are
+    fired on the HA bus as ``esphome.nspanel_event`` with the given
+    ``device_id``.  ``speed`` > 1 runs the simulated device faster than real
+    time.
+    """
+
+    ACTIONS = tuple(action.value for action in ESPAction) + (
+        "hub_heartbeat",
+        "hub_connection_response",
+        "hub_connection_initialized",
+        "hub_connection_closed",
+        "req_device_info",
+        "req_device_state",
+    )
+
+    def __init__(
+        self,
+        hass: Any,
+        device_name: str,
+        device_id: str | None = None,
+        sim: NextionSimulator | None = None,
+        speed: float = 1.0,
+    ) -> None:
+        self._hass = hass
+        self.device_id = device_id
+        self.sim = sim or NextionSimulator()
+        self.sim.on_event = self._fire
+        self.speed = speed
+        self.runtime_data = _RuntimeData(self, self.ACTIONS)
+        self.entry = _SimulatedEntry(device_name, self.runtime_data)
+        self._t0 = hass.loop.time()
+        self._timer: asyncio.TimerHandle | None = None
+
+    def set_available(self, available: bool) -> None:
+        """Simulate the device (dis)connecting (event loop only)."""
+        self.runtime_data.available = available
+        for cb in list(self.runtime_data._device_updated):
+            cb()
+
+    def async_execute(self, action: str, data: dict[str, Any]) -> None:
+        """Run an API action on the simulator at the current loop time."""
+        self._sync()
+        self.sim.execute(action, data)
+        self._arm()
+
+    def _sim_time(self) -> float:
+        return (self._hass.loop.time() - self._t0) * self.speed
+
+    def _sync(self) -> None:
+        self.sim.advance_to(self._sim_time())
+
+    def _arm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        due = self.sim.next_due
+        if due is not None:
+            self._timer = self._hass.loop.call_at(self._t0 + due / self.speed, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._sync()
+        self._arm()
+
+    def _fire(self, event: SimEvent) -> None:
+        data = {"name": event.name, "value": event.value}
+        if self.device_id is not None:
+            data["device_id"] = self.device_id
+        self._hass.bus.async_fire(ESP_NS_EVENT, data)
+
+
+class _SimulatedEntry:
+    domain = "esphome"
+
+    def __init__(self, device_name: str, runtime_data: _RuntimeData) -> None:
+        self.data = {"device_name": device_name}
+        self.runtime_data = runtime_data
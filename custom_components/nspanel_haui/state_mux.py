@@ -0,0 +1,158 @@
+"""Hub-wide shared entity state subscriptions.
+
+Pages of every device listen to the state of the entities they show.  With
+one ``async_track_state_change_event`` per page listener, ten panels showing
+the same lights kept ten trackers per entity, and every page transition tore
+them down and rebuilt them.
+
+:class:`StateMux` keeps one HA tracker per entity for the whole
+integration, with a reference count of the subscriptions interested in it,
+and fans each state change out to them.  When the last subscription of an
+entity goes away, its tracker lingers for :data:`LINGER` seconds, so
+flipping between panels showing the same entities reuses the tracker
+instead of churning HA's tracker tables.
+
+One multiplexer is shared by every device of every hub (see
+:func:`get_state_mux`).  All ``async_*`` methods run on the event loop.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "nspanel_haui"
+_DATA_KEY = "_state_mux"
+
+# Seconds an unused entity tracker is kept before it is removed
+LINGER = 5.0
+
+
+class StateSubscription:
+    """State changes of a set of entities delivered to one callback.
+
+    Created on any thread; added to the multiplexer on the event loop.
+    """
+
+    __slots__ = ("callback", "entity_ids")
+
+    def __init__(self, entity_ids: Iterable[str], callback: Callable[[Any], None]) -> None:
+        self.entity_ids = set(entity_ids)
+        self.callback = callback
+
+
+class _EntityTracker:
+    __slots__ = ("linger", "remove", "subscriptions")
+
+    def __init__(self) -> None:
+        self.subscriptions: tuple[StateSubscription, ...] = ()
+        self.remove: Callable[[], None] | None = None
+        self.linger: Any = None
+
+
+class StateMux:
+    """One HA state tracker per entity, shared by reference count (event loop only)."""
+
+    def __init__(self, hass: Any, linger: float = LINGER) -> None:
+        self._hass = hass
+        self._linger = linger
+        self._trackers: dict[str, _EntityTracker] = {}
+        # HA trackers created / removed (diagnostics)
+        self.tracked = 0
+        self.released = 0
+
+    def async_add(self, subscription: StateSubscription) -> None:
+        """Start delivering the state changes of the subscription's entities."""
+        for entity_id in subscription.entity_ids:
+            tracker = self._trackers.get(entity_id)
+            if tracker is None:
+                tracker = self._trackers[entity_id] = _EntityTracker()
+                tracker.remove = self._track(entity_id, tracker)
+            elif tracker.linger is not None:
+                tracker.linger.cancel()
+                tracker.linger = None
+            tracker.subscriptions += (subscription,)
+
+    def async_discard(self, subscription: StateSubscription, entity_id: str) -> None:
+        """Stop delivering the state changes of *entity_id* to *subscription*."""
+        if entity_id not in subscription.entity_ids:
+            return
+        subscription.entity_ids.discard(entity_id)
+        tracker = self._trackers.get(entity_id)
+        if tracker is None:
+            return
+        tracker.subscriptions = tuple(s for s in tracker.subscriptions if s is not subscription)
+        if not tracker.subscriptions and tracker.linger is None:
+            if self._linger > 0:
+                tracker.linger = self._hass.loop.call_later(
+                    self._linger, self._async_release, entity_id
+                )
+            else:
+                self._async_release(entity_id)
+
+    def async_remove(self, subscription: StateSubscription) -> None:
+        """Stop delivering every entity of *subscription*."""
+        for entity_id in list(subscription.entity_ids):
+            self.async_discard(subscription, entity_id)
+
+    def async_close(self) -> None:
+        """Remove every HA tracker right away (integration unload)."""
+        for entity_id in list(self._trackers):
+            self._async_release(entity_id, force=True)
+
+    def refcount(self, entity_id: str) -> int:
+        """Number of subscriptions of *entity_id* (0 while lingering or untracked)."""
+        tracker = self._trackers.get(entity_id)
+        return len(tracker.subscriptions) if tracker is not None else 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "entities": len(self._trackers),
+            "lingering": sum(1 for t in self._trackers.values() if not t.subscriptions),
+            "subscriptions": sum(len(t.subscriptions) for t in self._trackers.values()),
+            "tracked": self.tracked,
+            "released": self.released,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _track(self, entity_id: str, tracker: _EntityTracker) -> Callable[[], None]:
+        from homeassistant.core import callback as ha_callback  # noqa: PLC0415
+        from homeassistant.helpers.event import async_track_state_change_event  # noqa: PLC0415
+
+        @ha_callback
+        def _fan_out(event: Any) -> None:
+            for subscription in tracker.subscriptions:
+                try:
+                    subscription.callback(event)
+                except Exception:  # noqa: BLE001
+                    _LOGGER.exception("State subscription callback for %s failed", entity_id)
+
+        self.tracked += 1
+        return async_track_state_change_event(self._hass, entity_id, _fan_out)
+
+    def _async_release(self, entity_id: str, force: bool = False) -> None:
+        tracker = self._trackers.get(entity_id)
+        if tracker is None or (tracker.subscriptions and not force):
+            return
+        if tracker.linger is not None:
+            tracker.linger.cancel()
+            tracker.linger = None
+        del self._trackers[entity_id]
+        if tracker.remove is not None:
+            tracker.remove()
+        self.released += 1
+
+
+def get_state_mux(hass: Any) -> StateMux:
+    """Return the state subscription multiplexer shared by all devices of *hass*."""
+    data = hass.data.setdefault(DOMAIN, {})
+    mux = data.get(_DATA_KEY)
+    if mux is None:
+        mux = data[_DATA_KEY] = StateMux(hass)
+    return mux
@@ -0,0 +1,114 @@
+"""Hub-wide timers on the HA event loop.
+
+Debounced refreshes and the notification blinker used to start a
+``threading.Timer`` - a new OS thread - for every delayed call.  A grid page
+debounces every state change of its tiles, and the blinker ticks every
+second while notifications are unread, so busy panels started thousands of
+short-lived threads an hour.
+
+:class:`TimerService` schedules these calls with ``loop.call_at`` on the
+HA event loop instead and runs the callbacks as executor jobs, the thread
+the page code expects.  Timer callbacks are background work: their display
+commands go to the ``BACKGROUND`` lane (see ``haui/utils/command.py``).
+
+One service is shared by every device of every hub (see
+:func:`get_timer_service`).  :meth:`TimerService.call_later` and
+:meth:`TimerHandle.cancel` can be called from any thread.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from .haui.utils.command import CommandPriority, command_priority
+from .haui.utils.loop_batch import call_soon
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "nspanel_haui"
+_DATA_KEY = "_timer_service"
+
+
+class TimerHandle:
+    """A scheduled call; :meth:`cancel` works from any thread."""
+
+    __slots__ = ("callback", "cancelled", "timer")
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        self.callback = callback
+        self.cancelled = False
+        self.timer: Any = None  # loop timer, once scheduled
+
+    def cancel(self) -> None:
+        # Checked on the loop when the timer fires and again on the executor
+        # before the callback runs, so no loop hop is needed to cancel
+        self.cancelled = True
+
+
+class TimerService:
+    """Delayed executor jobs scheduled on the HA event loop."""
+
+    def __init__(self, hass: Any) -> None:
+        self._hass = hass
+        self._loop = hass.loop
+        # Handles waiting on the loop (event loop only)
+        self._pending: set[TimerHandle] = set()
+        # Timers scheduled / callbacks run (diagnostics)
+        self.scheduled = 0
+        self.fired = 0
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run *callback* on an executor thread after *delay* seconds."""
+        handle = TimerHandle(callback)
+        # Deadline taken now: batching may delay the registration a little
+        call_soon(self._loop, self._async_schedule, handle, self._loop.time() + delay)
+        return handle
+
+    def async_close(self) -> None:
+        """Cancel every pending timer right away (integration unload)."""
+        for handle in self._pending:
+            handle.cancel()
+            handle.timer.cancel()
+        self._pending.clear()
+
+    def as_dict(self) -> dict[str, int]:
+        return {"scheduled": self.scheduled, "fired": self.fired}
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _async_schedule(self, handle: TimerHandle, when: float) -> None:
+        if handle.cancelled:
+            return
+        self.scheduled += 1
+        handle.timer = self._loop.call_at(when, self._async_fire, handle)
+        self._pending.add(handle)
+
+    def _async_fire(self, handle: TimerHandle) -> None:
+        self._pending.discard(handle)
+        if handle.cancelled:
+            return
+        self.fired += 1
+        self._hass.async_add_executor_job(_run, handle)
+
+
+def _run(handle: TimerHandle) -> None:
+    if handle.cancelled:
+        return
+    try:
+        with command_priority(CommandPriority.BACKGROUND):
+            handle.callback()
+    except Exception:  # noqa: BLE001
+        _LOGGER.exception("Timer callback %s failed", handle.callback)
+
+
+def get_timer_service(hass: Any) -> TimerService:
+    """Return the timer service shared by all devices of *hass*."""
+    data = hass.data.setdefault(DOMAIN, {})
+    service = data.get(_DATA_KEY)
+    if service is None:
+        service = data[_DATA_KEY] = TimerService(hass)
+    return service
@@ -0,0 +1,102 @@
+"""Tests for adaptive send_commands chunking and pacing."""
+
+from __future__ import annotations
+
+import nspanel_haui.haui.utils.adaptive_chunker as chunker_module
+from nspanel_haui.haui.abstract.display_interface import DisplayInterface
+from nspanel_haui.haui.utils.adaptive_chunker import (
+    DEFAULT_CHUNK_LEN,
+    GROW_AFTER,
+    MAX_CHUNK_LEN,
+    MIN_CHUNK_LEN,
+    MIN_PACE,
+    AdaptiveChunker,
+    drain_time,
+    split_commands,
+)
+
+
+class RecordingTransport:
+    def __init__(self) -> None:
+        self.sent: list = []
+
+    def send(self, command, value) -> None:
+        self.sent.append((command, value))
+
+
+def test_split_commands_respects_length_and_count() -> None:
+    cmds = ["a" * 10] * 10
+    assert [len(c) for c in split_commands(cmds, 25)] == [2, 2, 2, 2, 2]
+    assert [len(c) for c in split_commands(cmds, 1000, max_cmds=4)] == [4, 4, 2]
+    # An oversized command still goes out on its own
+    assert split_commands(["x" * 50], 10) == [["x" * 50]]
+
+
+def test_overflow_halves_chunk_size_and_raises_pace() -> None:
+    chunker = AdaptiveChunker()
+    chunker.record_overflow()
+    assert chunker.max_len == DEFAULT_CHUNK_LEN // 2
+    assert chunker.pace > MIN_PACE
+    for _ in range(10):
+        chunker._last_overflow = None  # outside the burst holdoff
+        chunker.record_overflow()
+    assert chunker.max_len == MIN_CHUNK_LEN
+
+
+def test_overflow_burst_shrinks_once() -> None:
+    chunker = AdaptiveChunker()
+    chunker.record_overflow()
+    chunker.record_overflow()
+    assert chunker.max_len == DEFAULT_CHUNK_LEN // 2
+    assert chunker.overflows == 2
+
+
+def test_healthy_deliveries_grow_chunk_size() -> None:
+    chunker = AdaptiveChunker()
+    for _ in range(GROW_AFTER * 100):
+        chunker.record_delivery(["a.txt=1"], 0.01)
+    assert chunker.max_len == MAX_CHUNK_LEN
+    assert chunker.pace == MIN_PACE
+
+
+def test_no_growth_shortly_after_overflow_or_when_slow() -> None:
+    chunker = AdaptiveChunker()
+    chunker.record_overflow()
+    for _ in range(GROW_AFTER * 2):
+        chunker.record_delivery(["a.txt=1"], 0.01)
+    assert chunker.max_len == DEFAULT_CHUNK_LEN // 2
+
+    chunker = AdaptiveChunker()
+    for _ in range(GROW_AFTER * 2):
+        chunker.record_delivery(["a.txt=1"], chunker_module.SLOW_RTT + 0.1)
+    assert chunker.max_len == DEFAULT_CHUNK_LEN
+
+
+def test_pause_covers_uart_drain_minus_rtt() -> None:
+    chunker = AdaptiveChunker()
+    cmds = ["x" * 97] * 20
+    expected = drain_time(97 * 20, 20) * chunker.pace - 0.01
+    assert abs(chunker.record_delivery(cmds, 0.01) - expected) < 1e-9
+    # A slow round trip already gave the display enough time
+    assert chunker.record_delivery(cmds, 5.0) == 0.0
+
+
+def test_status_dict() -> None:
+    chunker = AdaptiveChunker()
+    chunker.record_delivery(["a"], 0.02)
+    status = chunker.as_dict()
+    assert status["max_len"] == DEFAULT_CHUNK_LEN
+    assert status["rtt_ms"] == 20.0
+    assert status["deliveries"] == 1
+    assert status["last_overflow_ago"] is None
+
+
+def test_display_interface_uses_chunker_size() -> None:
+    transport = RecordingTransport()
+    chunker = AdaptiveChunker()
+    chunker.max_len = 20
+    display = DisplayInterface(transport, chunker=chunker)
+    display.send_cmds(["a" * 10] * 4)
+    assert [len(value) for _cmd, value in transport.sent] == [2, 2]
+    display.report_overflow()
+    assert chunker.overflows == 1
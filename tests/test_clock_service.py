@@ -0,0 +1,108 @@
+"""Tests for the hub-wide clock ticks and the per-minute formatting memo."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import zoneinfo
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from nspanel_haui import clock_service
+from nspanel_haui.clock_service import ClockService, get_clock_service
+from nspanel_haui.haui.utils import datetime as haui_datetime
+from nspanel_haui.haui.utils.command import CommandPriority, current_priority
+
+
+def _make_hass(loop: asyncio.AbstractEventLoop) -> Any:
+    return SimpleNamespace(
+        loop=loop,
+        data={},
+        async_add_executor_job=lambda fn, *args: loop.run_in_executor(None, fn, *args),
+    )
+
+
+def test_one_timer_serves_subscribers_of_all_devices(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(clock_service.CADENCES, "minute", 0.05)
+
+    async def run() -> None:
+        service = get_clock_service(_make_hass(asyncio.get_running_loop()))
+        assert get_clock_service(service._hass) is service
+        calls: list = []
+
+        def device_a(cb_args: dict) -> None:
+            calls.append(("a", current_priority()))
+
+        def device_b(cb_args: dict) -> None:
+            calls.append(("b", current_priority()))
+
+        service.subscribe("minute", device_a)
+        service.subscribe("minute", device_b)
+        await asyncio.sleep(0.01)
+        assert len(service._timers) == 1
+        await asyncio.sleep(0.12)
+        assert ("a", CommandPriority.BACKGROUND) in calls
+        assert ("b", CommandPriority.BACKGROUND) in calls
+        assert service.ticks == 1
+
+        service.unsubscribe("minute", device_a)
+        service.unsubscribe("minute", device_b)
+        await asyncio.sleep(0.01)
+        assert service._timers == {}
+        assert service.as_dict()["subscribers"] == {"minute": 0, "hour": 0}
+
+    asyncio.run(run())
+
+
+def test_unknown_cadence_is_rejected() -> None:
+    service = ClockService(SimpleNamespace(loop=None, data={}))
+    with pytest.raises(ValueError):
+        service.subscribe("second", lambda cb_args: None)
+
+
+def test_time_and_date_strings_are_formatted_once_per_minute(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(haui_datetime, "_minute_memo", haui_datetime._MinuteMemo())
+    formatted: list = []
+    real_get_now = haui_datetime.get_now
+
+    def counting_get_now(timezone: str | None = None, now: float | None = None) -> Any:
+        formatted.append(timezone)
+        return real_get_now(timezone, now)
+
+    monkeypatch.setattr(haui_datetime, "get_now", counting_get_now)
+    for _ in range(3):
+        haui_datetime.get_time_localized("%H:%M", "Europe/Berlin")
+        haui_datetime.get_date_localized("%d.%m.%Y", None, "de", "Europe/Berlin")
+    assert len(formatted) == 2
+
+    # Formats showing seconds change within the minute and are not memoized
+    haui_datetime.get_time_localized("%H:%M:%S", "Europe/Berlin")
+    haui_datetime.get_time_localized("%H:%M:%S", "Europe/Berlin")
+    assert len(formatted) == 4
+
+
+def test_hour_tick_follows_local_hour_in_half_hour_offset_zone(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # 23:59:30 in India (UTC+5:30) is 18:29:30 UTC: the local date changes in
+    # 30 seconds, half an hour before the next UTC hour
+    now = datetime.datetime(2026, 1, 1, 23, 59, 30, tzinfo=zoneinfo.ZoneInfo("Asia/Kolkata"))
+    assert clock_service.seconds_to_boundary(now, 3600) == 30
+    assert clock_service.seconds_to_boundary(now, 60) == 30
+
+    zones: list = []
+
+    def fixed_now(timezone: str | None = None, ts: float | None = None) -> datetime.datetime:
+        zones.append(timezone)
+        return now
+
+    delays: list = []
+    loop = SimpleNamespace(call_later=lambda delay, *args: delays.append(delay))
+    hass = SimpleNamespace(loop=loop, data={}, config=SimpleNamespace(time_zone="Asia/Kolkata"))
+    monkeypatch.setattr(clock_service, "get_now", fixed_now)
+    ClockService(hass)._async_schedule("hour")
+    assert zones == ["Asia/Kolkata"]
+    assert delays == [pytest.approx(30 + clock_service._MARGIN)]
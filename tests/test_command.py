@@ -0,0 +1,42 @@
+"""Tests for the shared Nextion command helpers."""
+
+from __future__ import annotations
+
+import threading
+
+from nspanel_haui.haui.abstract.haui_base import HAUIBase
+from nspanel_haui.haui.utils.command import (
+    CommandPriority,
+    command_key,
+    command_priority,
+    current_priority,
+    dedup_commands,
+)
+
+
+def test_command_key() -> None:
+    assert command_key('tTitle.txt="a=b"') == "tTitle.txt"
+    assert command_key("vis bIcon,1") == "vis bIcon"
+    assert command_key("ref 0") is None
+    assert command_key("cls") is None
+
+
+def test_dedup_commands_last_write_wins_and_keeps_order() -> None:
+    cmds = ["a.txt=1", "vis b,0", "ref 0", "a.txt=2", "vis b,1", "ref 0"]
+    assert dedup_commands(cmds) == ["ref 0", "a.txt=2", "vis b,1", "ref 0"]
+    assert HAUIBase._dedup_commands(cmds) == dedup_commands(cmds)
+
+
+def test_command_priority_is_thread_local_and_keeps_most_urgent() -> None:
+    assert current_priority() == CommandPriority.NORMAL
+    with command_priority(CommandPriority.BACKGROUND):
+        assert current_priority() == CommandPriority.BACKGROUND
+    with command_priority(CommandPriority.INTERACTIVE):
+        with command_priority(CommandPriority.BACKGROUND):
+            assert current_priority() == CommandPriority.INTERACTIVE
+        seen: list[CommandPriority] = []
+        t = threading.Thread(target=lambda: seen.append(current_priority()))
+        t.start()
+        t.join()
+        assert seen == [CommandPriority.NORMAL]
+    assert current_priority() == CommandPriority.NORMAL
@@ -45,6 +45,8 @@ def test_device_config_has_all_required_keys() -> None:
         "show_sleep_button",
         "show_notifications_button",
         "page_settle_delay",
+        "frame_window",
+        "event_trace",
         "log_items",
         "debug_level",
         "reset_interaction_on_button",
@@ -0,0 +1,115 @@
+"""Tests for DisplayInterface and the per-device display shadow."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from nspanel_haui.haui.abstract.display_interface import DisplayInterface, DisplayShadow
+from nspanel_haui.haui.mapping.const import ESPCommand
+
+
+class RecordingTransport:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, Any]] = []
+
+    def send(self, command: str, value: str | list[str]) -> None:
+        self.sent.append((command, value))
+
+
+def _sent_cmds(transport: RecordingTransport) -> list[str]:
+    cmds: list[str] = []
+    for command, value in transport.sent:
+        if command == ESPCommand.SEND_COMMANDS:
+            cmds.extend(value)
+        else:
+            cmds.append(value)
+    return cmds
+
+
+# ── DisplayShadow ────────────────────────────────────────────────────────
+
+
+def test_shadow_drops_unchanged_writes_across_batches() -> None:
+    shadow = DisplayShadow()
+    batch = ['tTitle.txt="Hello"', "tTitle.pco=65535", "vis bIcon,1"]
+    assert shadow.filter(batch) == batch
+    assert shadow.filter(batch) == []
+    assert shadow.filter(['tTitle.txt="World"', "tTitle.pco=65535"]) == ['tTitle.txt="World"']
+    assert shadow.suppressed == 4
+
+
+def test_shadow_tracks_vis_per_component() -> None:
+    shadow = DisplayShadow()
+    shadow.filter(["vis bIcon,1"])
+    assert shadow.filter(["vis bIcon,0"]) == ["vis bIcon,0"]
+    assert shadow.filter(["vis bIcon,0"]) == []
+
+
+def test_shadow_never_tracks_val_globals_or_plain_commands() -> None:
+    shadow = DisplayShadow()
+    batch = ["hSlider.val=50", "system.resVal.val=1", "dim=50", "ref 0", "click b0,1"]
+    shadow.filter(batch)
+    assert shadow.filter(batch) == batch
+
+
+@pytest.mark.parametrize("reset", ["cls", "page 3", "rest"])
+def test_shadow_cleared_by_page_reset_commands(reset: str) -> None:
+    shadow = DisplayShadow()
+    shadow.filter(['tTitle.txt="Hello"'])
+    assert shadow.filter([reset, 'tTitle.txt="Hello"']) == [reset, 'tTitle.txt="Hello"']
+
+
+def test_shadow_vis_all_clears_tracked_visibility() -> None:
+    shadow = DisplayShadow()
+    shadow.filter(["vis bIcon,1", 'tTitle.txt="x"'])
+    assert shadow.filter(["vis 255,0", "vis bIcon,1", 'tTitle.txt="x"']) == [
+        "vis 255,0",
+        "vis bIcon,1",
+    ]
+
+
+def test_shadow_invalidate() -> None:
+    shadow = DisplayShadow()
+    shadow.filter(['tTitle.txt="Hello"'])
+    shadow.invalidate()
+    assert len(shadow) == 0
+    assert shadow.filter(['tTitle.txt="Hello"']) == ['tTitle.txt="Hello"']
+
+
+# ── DisplayInterface ─────────────────────────────────────────────────────
+
+
+def test_interface_without_shadow_sends_everything() -> None:
+    transport = RecordingTransport()
+    display = DisplayInterface(transport)
+    display.send_cmds(['a.txt="1"'])
+    display.send_cmds(['a.txt="1"'])
+    display.invalidate_shadow()  # no-op without shadow
+    assert _sent_cmds(transport) == ['a.txt="1"', 'a.txt="1"']
+
+
+def test_interface_shared_shadow_suppresses_across_instances() -> None:
+    transport = RecordingTransport()
+    shadow = DisplayShadow()
+    page = DisplayInterface(transport, shadow=shadow)
+    controller = DisplayInterface(transport, shadow=shadow)
+    page.send_cmds(['a.txt="1"', "a.bco=0"])
+    controller.send_cmd('a.txt="1"')
+    page.send_cmds(['a.txt="1"', "a.bco=0"])
+    assert len(transport.sent) == 1
+    controller.invalidate_shadow()
+    page.send_cmd('a.txt="1"')
+    assert _sent_cmds(transport) == ['a.txt="1"', "a.bco=0", 'a.txt="1"']
+
+
+def test_interface_failed_send_invalidates_shadow() -> None:
+    class FailingTransport:
+        def send(self, command: str, value: str | list[str]) -> None:
+            raise RuntimeError("boom")
+
+    shadow = DisplayShadow()
+    display = DisplayInterface(FailingTransport(), shadow=shadow)
+    with pytest.raises(RuntimeError):
+        display.send_cmds(['a.txt="1"'])
+    assert len(shadow) == 0
@@ -0,0 +1,96 @@
+"""Tests for the shared ESPHome endpoint index."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from nspanel_haui.endpoint_index import EndpointIndex, get_endpoint_index
+
+
+class _RuntimeData:
+    def __init__(self, *names: str) -> None:
+        self.available = True
+        self.services = {i: SimpleNamespace(name=name) for i, name in enumerate(names)}
+        self.callbacks: list = []
+
+    def async_subscribe_device_updated(self, cb) -> Any:
+        self.callbacks.append(cb)
+        return lambda: self.callbacks.remove(cb)
+
+
+def _make_hass(*entries: Any) -> Any:
+    scans = [0]
+
+    def async_entries(domain: str) -> list:
+        scans[0] += 1
+        return list(entries)
+
+    config_entries = SimpleNamespace(async_entries=async_entries)
+    return SimpleNamespace(config_entries=config_entries, data={}, scans=scans)
+
+
+def _entry(device_name: str, runtime_data: Any = None) -> Any:
+    entry = SimpleNamespace(data={"device_name": device_name})
+    if runtime_data is not None:
+        entry.runtime_data = runtime_data
+    return entry
+
+
+def test_lookup_scans_entries_once() -> None:
+    runtime = _RuntimeData("send_commands", "goto_page")
+    hass = _make_hass(_entry("other", _RuntimeData()), _entry("nspanel_test", runtime))
+    index = EndpointIndex(hass)
+    for _ in range(10):
+        assert index.runtime_data("NSPanel-Test") is runtime
+        assert index.service("nspanel-test", "goto_page") is runtime.services[1]
+    assert hass.scans[0] == 1
+    assert index.runtime_data("missing") is None
+    assert index.service("", "goto_page") is None
+
+
+def test_entry_without_runtime_data() -> None:
+    index = EndpointIndex(_make_hass(_entry("nspanel-test")))
+    assert index.runtime_data("nspanel-test") is None
+    assert index.service("nspanel-test", "send_commands") is None
+
+
+def test_invalidate_rebuilds_and_unsubscribes() -> None:
+    runtime = _RuntimeData("send_commands")
+    hass = _make_hass(_entry("nspanel-test", runtime))
+    index = EndpointIndex(hass)
+    index.service("nspanel-test", "send_commands")
+    assert len(runtime.callbacks) == 1
+    index.invalidate()
+    assert runtime.callbacks == []
+    index.service("nspanel-test", "send_commands")
+    assert hass.scans[0] == 2
+    assert index.rebuilds == 2
+
+
+def test_service_map_refreshed_on_availability_change_and_miss() -> None:
+    runtime = _RuntimeData("send_commands")
+    index = EndpointIndex(_make_hass(_entry("nspanel-test", runtime)))
+    first = index.service("nspanel-test", "send_commands")
+    # Reconnect: the device shares new service objects
+    runtime.services = {0: SimpleNamespace(name="send_commands")}
+    for cb in list(runtime.callbacks):
+        cb()
+    assert index.service("nspanel-test", "send_commands") is not first
+    # A service added later is found without an availability change
+    runtime.services[1] = SimpleNamespace(name="play_sound")
+    assert index.service("nspanel-test", "play_sound") is runtime.services[1]
+
+
+def test_replaced_runtime_data_is_picked_up() -> None:
+    entry = _entry("nspanel-test", _RuntimeData("send_commands"))
+    index = EndpointIndex(_make_hass(entry))
+    index.service("nspanel-test", "send_commands")
+    entry.runtime_data = _RuntimeData("send_commands")
+    assert index.runtime_data("nspanel-test") is entry.runtime_data
+    assert index.service("nspanel-test", "send_commands") is entry.runtime_data.services[0]
+
+
+def test_index_is_shared_per_hass() -> None:
+    hass = _make_hass()
+    assert get_endpoint_index(hass) is get_endpoint_index(hass)
@@ -0,0 +1,85 @@
+"""Tests for the integration-wide device event demultiplexer."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from nspanel_haui.event_demux import EventDemux, get_event_demux
+from nspanel_haui.haui.mapping.const import ESP_NS_EVENT
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.listeners: dict[str, list] = {}
+
+    def async_listen(self, event_type: str, cb: Any) -> Any:
+        self.listeners.setdefault(event_type, []).append(cb)
+        return lambda: self.listeners[event_type].remove(cb)
+
+    def async_fire(self, event_type: str, data: dict) -> None:
+        event = SimpleNamespace(event_type=event_type, data=data)
+        for cb in list(self.listeners.get(event_type, [])):
+            cb(event)
+
+
+@pytest.fixture
+def hass(monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setattr(sys.modules["homeassistant.core"], "callback", lambda fn: fn, raising=False)
+    return SimpleNamespace(bus=_Bus(), data={})
+
+
+def _fire(hass: Any, device_id: str | None, name: str = "esphome.touch") -> None:
+    data = {"name": name, "value": "1"}
+    if device_id is not None:
+        data["device_id"] = device_id
+    hass.bus.async_fire(ESP_NS_EVENT, data)
+
+
+def test_one_bus_listener_routes_by_device_id(hass: Any) -> None:
+    demux = EventDemux(hass)
+    received: dict[str, list] = {"a": [], "b": []}
+    demux.async_subscribe(ESP_NS_EVENT, "dev-a", received["a"].append)
+    demux.async_subscribe(ESP_NS_EVENT, "dev-b", received["b"].append)
+    assert len(hass.bus.listeners[ESP_NS_EVENT]) == 1
+
+    _fire(hass, "dev-a")
+    _fire(hass, "dev-a")
+    _fire(hass, "dev-b")
+    _fire(hass, "dev-other")
+    assert len(received["a"]) == 2
+    assert len(received["b"]) == 1
+    assert demux.routed == 3
+    assert demux.unrouted == 1
+
+
+def test_unresolved_subscriber_receives_every_event(hass: Any) -> None:
+    demux = EventDemux(hass)
+    received: list = []
+    resolved: list = []
+    subscription = demux.async_subscribe(ESP_NS_EVENT, None, received.append)
+    demux.async_subscribe(ESP_NS_EVENT, "dev-b", resolved.append)
+    _fire(hass, "dev-a")
+    _fire(hass, "dev-b")
+    assert len(received) == 2
+    assert len(resolved) == 1
+
+    demux.async_set_device_id(subscription, "dev-a")
+    _fire(hass, "dev-a")
+    _fire(hass, "dev-b")
+    assert len(received) == 3
+    assert demux.device_ids(ESP_NS_EVENT) == ["dev-a", "dev-b"]
+
+
+def test_last_unsubscribe_removes_bus_listener(hass: Any) -> None:
+    demux = get_event_demux(hass)
+    assert get_event_demux(hass) is demux
+    first = demux.async_subscribe(ESP_NS_EVENT, "dev-a", lambda event: None)
+    second = demux.async_subscribe(ESP_NS_EVENT, "dev-a", lambda event: None)
+    demux.async_unsubscribe(first)
+    assert len(hass.bus.listeners[ESP_NS_EVENT]) == 1
+    demux.async_unsubscribe(second)
+    assert hass.bus.listeners[ESP_NS_EVENT] == []
+    assert demux.device_ids(ESP_NS_EVENT) == []
@@ -0,0 +1,203 @@
+"""Tests for the per-device ordered event pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from nspanel_haui.event_pipeline import EventPipeline, device_event_key
+from nspanel_haui.haui.mapping.const import ESPEvent, ESPResponse, ServerRequest
+
+
+def _make_hass(loop: asyncio.AbstractEventLoop) -> Any:
+    return SimpleNamespace(
+        async_add_executor_job=lambda fn, *args: loop.run_in_executor(None, fn, *args)
+    )
+
+
+async def _drain(pipeline: EventPipeline) -> None:
+    for _ in range(200):
+        await asyncio.sleep(0.005)
+        if not pipeline._running:
+            return
+
+
+def test_burst_handled_in_order_by_one_job() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        handled: list[int] = []
+        threads: set[int] = set()
+
+        def handler(item: int) -> None:
+            threads.add(threading.get_ident())
+            time.sleep(0.001)
+            handled.append(item)
+
+        pipeline = EventPipeline(_make_hass(loop), handler, label="dev")
+        for i in range(50):
+            pipeline.async_put(i)
+        await _drain(pipeline)
+        assert handled == list(range(50))
+        assert pipeline.bursts == 1
+        assert pipeline.handled == 50
+        assert len(threads) == 1
+
+    asyncio.run(run())
+
+
+def test_items_never_run_concurrently() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        active = [0, 0]
+        handled: list[int] = []
+
+        def handler(item: int) -> None:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            time.sleep(0.002)
+            handled.append(item)
+            active[0] -= 1
+
+        pipeline = EventPipeline(_make_hass(loop), handler)
+        for i in range(20):
+            pipeline.async_put(i)
+            await asyncio.sleep(0.001)
+        await _drain(pipeline)
+        assert handled == list(range(20))
+        assert active[1] == 1
+
+    asyncio.run(run())
+
+
+def test_failing_handler_does_not_stop_pipeline() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        handled: list[int] = []
+
+        def handler(item: int) -> None:
+            if item == 1:
+                raise RuntimeError("boom")
+            handled.append(item)
+
+        pipeline = EventPipeline(_make_hass(loop), handler)
+        for i in range(3):
+            pipeline.async_put(i)
+        await _drain(pipeline)
+        assert handled == [0, 2]
+        # The next burst starts a new job
+        bursts = pipeline.bursts
+        pipeline.async_put(3)
+        await _drain(pipeline)
+        assert handled == [0, 2, 3]
+        assert pipeline.bursts == bursts + 1
+
+    asyncio.run(run())
+
+
+def test_clear_drops_pending_items() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        release = threading.Event()
+        handled: list[int] = []
+
+        def handler(item: int) -> None:
+            release.wait(1.0)
+            handled.append(item)
+
+        pipeline = EventPipeline(_make_hass(loop), handler)
+        for i in range(5):
+            pipeline.async_put(i)
+        await asyncio.sleep(0.01)
+        pipeline.clear()
+        release.set()
+        await _drain(pipeline)
+        assert handled == [0]
+
+    asyncio.run(run())
+
+
+def test_device_event_keys() -> None:
+    heartbeat = device_event_key(ServerRequest.HEARTBEAT, "")
+    assert heartbeat == device_event_key("esphome.heartbeat", "x")
+    press = device_event_key(ESPEvent.COMPONENT, "1,5,1")
+    assert press == device_event_key(ESPEvent.COMPONENT, "1,5,1")
+    # A press is never merged with its release
+    assert press != device_event_key(ESPEvent.COMPONENT, "1,5,0")
+    for name in (ESPEvent.PAGE, ESPEvent.TOUCH_END, ESPEvent.GESTURE, ESPResponse.READ_RESPONSE):
+        assert device_event_key(name, "1") is None
+
+
+def test_superseded_events_coalesced_while_busy() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        release = threading.Event()
+        handled: list[tuple[str, str]] = []
+
+        def handler(item: tuple[str, str]) -> None:
+            release.wait(1.0)
+            handled.append(item)
+
+        pipeline = EventPipeline(
+            _make_hass(loop), handler, coalesce_key=lambda item: device_event_key(*item)
+        )
+        events = [
+            (ESPEvent.TOUCH_START, "1"),  # picked up by the consumer right away
+            (ServerRequest.HEARTBEAT, "a"),
+            (ServerRequest.HEARTBEAT, "b"),
+            (ESPEvent.COMPONENT, "1,5,1"),
+            (ESPEvent.COMPONENT, "1,5,1"),
+            (ESPEvent.COMPONENT, "1,5,0"),
+            (ESPResponse.READ_RESPONSE, "{}"),
+            (ESPResponse.READ_RESPONSE, "{}"),
+        ]
+        results = []
+        for i, event in enumerate(events):
+            results.append(pipeline.async_put(event))
+            if i == 0:
+                await asyncio.sleep(0.01)
+        release.set()
+        await _drain(pipeline)
+        assert results == [True, True, False, True, False, True, True, True]
+        assert handled == [
+            (ESPEvent.TOUCH_START, "1"),
+            (ServerRequest.HEARTBEAT, "b"),
+            (ESPEvent.COMPONENT, "1,5,1"),
+            (ESPEvent.COMPONENT, "1,5,0"),
+            (ESPResponse.READ_RESPONSE, "{}"),
+            (ESPResponse.READ_RESPONSE, "{}"),
+        ]
+        assert pipeline.coalesced == 2
+
+    asyncio.run(run())
+
+
+def test_no_coalescing_outside_window() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        release = threading.Event()
+        handled: list[tuple[str, str]] = []
+
+        def handler(item: tuple[str, str]) -> None:
+            release.wait(1.0)
+            handled.append(item)
+
+        pipeline = EventPipeline(
+            _make_hass(loop),
+            handler,
+            coalesce_key=lambda item: device_event_key(*item),
+            window=0.01,
+        )
+        pipeline.async_put((ESPEvent.PAGE, "1"))
+        await asyncio.sleep(0.005)
+        pipeline.async_put((ServerRequest.HEARTBEAT, "a"))
+        await asyncio.sleep(0.03)
+        pipeline.async_put((ServerRequest.HEARTBEAT, "b"))
+        release.set()
+        await _drain(pipeline)
+        assert [value for _name, value in handled] == ["1", "a", "b"]
+        assert pipeline.coalesced == 0
+
+    asyncio.run(run())
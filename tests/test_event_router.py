@@ -0,0 +1,81 @@
+"""Tests for the subscription-based event router."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from nspanel_haui.haui.mapping.const import ESPEvent
+from nspanel_haui.haui.utils.event_router import EventRouter
+
+
+def _event(name: str) -> SimpleNamespace:
+    return SimpleNamespace(name=name, value="")
+
+
+def test_dispatch_only_reaches_subscribers() -> None:
+    router = EventRouter()
+    calls: list[tuple[str, str]] = []
+    router.subscribe("gesture", lambda e: calls.append(("gesture", e.name)), {ESPEvent.GESTURE})
+    router.subscribe("page", lambda e: calls.append(("page", e.name)), {ESPEvent.PAGE})
+
+    assert router.dispatch(_event(ESPEvent.GESTURE)) == 1
+    assert router.dispatch(_event(ESPEvent.TOUCH)) == 0
+    assert calls == [("gesture", ESPEvent.GESTURE)]
+
+
+def test_wildcard_keeps_subscription_order() -> None:
+    router = EventRouter()
+    calls: list[str] = []
+    router.subscribe("nav", lambda e: calls.append("nav"), {ESPEvent.PAGE})
+    router.subscribe("device", lambda e: calls.append("device"))
+
+    router.dispatch(_event(ESPEvent.PAGE))
+    router.dispatch(_event("esphome.unknown"))
+    assert calls == ["nav", "device", "device"]
+
+
+def test_resubscribe_changes_names() -> None:
+    router = EventRouter()
+    calls: list[str] = []
+    route = router.subscribe("conn", lambda e: calls.append(e.name), None)
+    router.dispatch(_event(ESPEvent.TOUCH))
+    router.resubscribe(route, {ESPEvent.CONNECTED})
+    router.dispatch(_event(ESPEvent.TOUCH))
+    router.dispatch(_event(ESPEvent.CONNECTED))
+    assert calls == [ESPEvent.TOUCH, ESPEvent.CONNECTED]
+
+    router.unsubscribe(route)
+    assert router.dispatch(_event(ESPEvent.CONNECTED)) == 0
+
+
+def test_failing_handler_reported_and_others_run() -> None:
+    errors: list[tuple[str, str]] = []
+    router = EventRouter(
+        on_error=lambda route, event, trace: errors.append((route.owner, event.name))
+    )
+    calls: list[str] = []
+
+    def boom(_event: SimpleNamespace) -> None:
+        raise RuntimeError("boom")
+
+    router.subscribe("bad", boom)
+    router.subscribe("good", lambda e: calls.append(e.name))
+    router.dispatch(_event(ESPEvent.SLEEP))
+    assert errors == [("bad", ESPEvent.SLEEP)]
+    assert calls == [ESPEvent.SLEEP]
+
+
+def test_handler_statistics() -> None:
+    router = EventRouter()
+    router.subscribe("nav", lambda e: None, {ESPEvent.PAGE})
+    for _ in range(3):
+        router.dispatch(_event(ESPEvent.PAGE))
+    (stats,) = router.as_dict()
+    assert stats["owner"] == "nav"
+    assert stats["events"] == [ESPEvent.PAGE]
+    assert stats["calls"] == 3
+    assert stats["errors"] == 0
+    assert stats["avg_ms"] is not None
+
+    router.reset_stats()
+    assert router.as_dict()[0]["calls"] == 0
@@ -0,0 +1,95 @@
+"""Tests for the per-device event trace."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+from nspanel_haui.diagnostics import async_get_config_entry_diagnostics
+from nspanel_haui.haui.mapping.const import ESPAction, ESPEvent
+from nspanel_haui.haui.utils.event_trace import EventTrace, current_trace, tracing
+from nspanel_haui.outbound_queue import OutboundQueue
+
+
+def test_ring_buffer_keeps_latest_records() -> None:
+    trace = EventTrace(3)
+    for i in range(5):
+        trace.new(ESPEvent.TOUCH, str(i))
+    records = trace.as_list()
+    assert [r["seq"] for r in records] == [3, 4, 5]
+    assert records[0]["name"] == "esphome.touch"
+    trace.clear()
+    assert trace.as_list() == []
+
+
+def test_stages_recorded() -> None:
+    trace = EventTrace(10)
+    record = trace.new(ESPEvent.COMPONENT, "1,2,0")
+    record.mark("queued")
+    record.add("dispatch", 0.002)
+    record.add("dispatch", 0.001)
+    record.commands += 4
+    (data,) = trace.as_list()
+    assert data["queued_ms"] >= 0
+    assert data["dispatch_ms"] == 3.0
+    assert data["commands"] == 4
+
+
+def test_tracing_is_thread_local_and_nested() -> None:
+    trace = EventTrace(10)
+    outer, inner = trace.new("a", ""), trace.new("b", "")
+    seen: list[Any] = []
+    with tracing(outer):
+        with tracing(inner):
+            assert current_trace() is inner
+            thread = threading.Thread(target=lambda: seen.append(current_trace()))
+            thread.start()
+            thread.join()
+        assert current_trace() is outer
+    assert current_trace() is None
+    assert seen == [None]
+
+
+def test_publish_completion_marked_on_merged_frame() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        sent: list = []
+
+        async def send(name: str, value: Any) -> bool:
+            sent.append((name, value))
+            return True
+
+        queue = OutboundQueue(loop, send)
+        queue.frame_window = 0.02
+        trace = EventTrace(10)
+        first, second = trace.new("a", ""), trace.new("b", "")
+        queue.put(ESPAction.SEND_COMMANDS, ["t0.txt=\"a\""], trace=first)
+        queue.put(ESPAction.SEND_COMMANDS, ["t1.txt=\"b\""], trace=second)
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if sent and not queue.busy:
+                break
+        assert len(sent) == 1
+        assert "published" in first.stages
+        assert "published" in second.stages
+
+    asyncio.run(run())
+
+
+def test_diagnostics_include_trace() -> None:
+    trace = EventTrace(5)
+    trace.new(ESPEvent.PAGE, "3")
+    app = SimpleNamespace(
+        event_trace=trace,
+        device=SimpleNamespace(connected=True),
+        telemetry=SimpleNamespace(as_dict=lambda: {"commands": 0}),
+        event_router=SimpleNamespace(as_dict=lambda: []),
+    )
+    hass = SimpleNamespace(loop=None, data={"nspanel_haui": {"entry1": {"panel": app}}})
+    entry = SimpleNamespace(entry_id="entry1")
+    result = asyncio.run(async_get_config_entry_diagnostics(hass, entry))
+    device = result["devices"]["panel"]
+    assert device["connected"] is True
+    assert [r["name"] for r in device["event_trace"]] == ["esphome.page"]
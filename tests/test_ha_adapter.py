@@ -0,0 +1,264 @@
+"""Tests for the HA adapter's state listeners and timers."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from nspanel_haui.ha_adapter import HAAdapter
+from nspanel_haui.haui.utils.loop_batch import loop_batch
+from nspanel_haui.haui.utils.telemetry import TransportTelemetry
+from nspanel_haui.state_mux import StateMux
+
+
+class _Tracker:
+    """Fake async_track_state_change_event recording registrations."""
+
+    def __init__(self) -> None:
+        self.registrations: list[tuple[str, Any]] = []
+        self.removed = 0
+
+    def __call__(self, hass: Any, entity_id: str, action: Any) -> Any:
+        self.registrations.append((entity_id, action))
+
+        def remove() -> None:
+            self.removed += 1
+
+        return remove
+
+
+@pytest.fixture
+def tracker(monkeypatch: pytest.MonkeyPatch) -> _Tracker:
+    tracker = _Tracker()
+    event_module = types.ModuleType("homeassistant.helpers.event")
+    event_module.async_track_state_change_event = tracker  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "homeassistant.helpers.event", event_module)
+    monkeypatch.setattr(sys.modules["homeassistant.core"], "callback", lambda fn: fn, raising=False)
+    return tracker
+
+
+def _state_event(
+    entity_id: str,
+    old: str,
+    new: str,
+    old_attrs: dict | None = None,
+    new_attrs: dict | None = None,
+) -> Any:
+    return SimpleNamespace(
+        data={
+            "entity_id": entity_id,
+            "old_state": SimpleNamespace(state=old, attributes=old_attrs or {}),
+            "new_state": SimpleNamespace(state=new, attributes=new_attrs or {}),
+        }
+    )
+
+
+def _make_adapter(loop: asyncio.AbstractEventLoop, jobs: list, linger: float = 0.0) -> HAAdapter:
+    hass = SimpleNamespace(loop=loop, data={}, async_add_executor_job=lambda fn, *a: jobs.append(a))
+    hass.data["nspanel_haui"] = {"_state_mux": StateMux(hass, linger=linger)}
+    return HAAdapter(hass, "panel")
+
+
+def test_listen_states_registers_in_one_hop_and_cancels_in_bulk(tracker: _Tracker) -> None:
+    async def run() -> None:
+        jobs: list[tuple] = []
+        adapter = _make_adapter(asyncio.get_running_loop(), jobs)
+        cb = lambda *args: None  # noqa: E731
+
+        handles = adapter.listen_states(cb, ["light.a", "light.b", "light.a", "switch.c"])
+        assert len(handles) == 3
+        # Returned before the registration ran
+        assert tracker.registrations == []
+        await asyncio.sleep(0)
+        assert sorted(entity for entity, _action in tracker.registrations) == [
+            "light.a",
+            "light.b",
+            "switch.c",
+        ]
+        actions = dict(tracker.registrations)
+
+        actions["light.b"](_state_event("light.b", "off", "on"))
+        assert jobs == [("light.b", "state", "off", "on", {})]
+
+        adapter.cancel_listen_state(handles[1])
+        await asyncio.sleep(0)
+        actions["light.b"](_state_event("light.b", "on", "off"))
+        assert len(jobs) == 1
+        assert tracker.removed == 1
+
+        adapter.cancel_listen_states([handles[0], handles[2]])
+        await asyncio.sleep(0)
+        assert tracker.removed == 3
+
+    asyncio.run(run())
+
+
+def test_handles_cancelled_right_away(tracker: _Tracker) -> None:
+    async def run() -> None:
+        adapter = _make_adapter(asyncio.get_running_loop(), [])
+        handles = adapter.listen_states(lambda *args: None, ["light.a", "light.b"])
+        adapter.cancel_listen_states(handles)
+        await asyncio.sleep(0)
+        # The cancellation is queued behind the registration
+        assert len(tracker.registrations) == 2
+        assert tracker.removed == 2
+        assert adapter.listen_states(lambda *args: None, []) == []
+
+    asyncio.run(run())
+
+
+def test_changes_outside_fields_skip_the_executor(tracker: _Tracker) -> None:
+    async def run() -> None:
+        jobs: list[tuple] = []
+        adapter = _make_adapter(asyncio.get_running_loop(), jobs)
+        adapter.telemetry = TransportTelemetry()
+        adapter.listen_states(
+            lambda *args: None,
+            ["media_player.a"],
+            attribute="all",
+            fields={"state", "media_title"},
+        )
+        await asyncio.sleep(0)
+        action = tracker.registrations[0][1]
+
+        entity = "media_player.a"
+        playing = {"media_title": "Song", "media_position": 1}
+        position_tick = {**playing, "media_position": 2}
+        action(_state_event(entity, "playing", "playing", playing, position_tick))
+        assert jobs == []
+        assert adapter.telemetry.as_dict()["total"]["state_filtered"] == 1
+
+        action(_state_event(entity, "playing", "playing", playing, {"media_title": "Next"}))
+        action(_state_event(entity, "playing", "paused", playing, playing))
+        assert len(jobs) == 2
+
+    asyncio.run(run())
+
+
+class _Timers:
+    """Fake async_call_later / async_track_time_interval."""
+
+    def __init__(self) -> None:
+        self.later: list[tuple[float, Any]] = []
+        self.intervals: list[Any] = []
+        self.removed = 0
+
+    def remove(self) -> None:
+        self.removed += 1
+
+    def call_later(self, hass: Any, delay: float, action: Any) -> Any:
+        self.later.append((delay, action))
+        return self.remove
+
+    def track_interval(self, hass: Any, action: Any, interval: Any) -> Any:
+        self.intervals.append(interval.total_seconds())
+        return self.remove
+
+
+@pytest.fixture
+def timers(monkeypatch: pytest.MonkeyPatch) -> _Timers:
+    timers = _Timers()
+    event_module = types.ModuleType("homeassistant.helpers.event")
+    event_module.async_call_later = timers.call_later  # type: ignore[attr-defined]
+    event_module.async_track_time_interval = timers.track_interval  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "homeassistant.helpers.event", event_module)
+    monkeypatch.setattr(sys.modules["homeassistant.core"], "callback", lambda fn: fn, raising=False)
+    return timers
+
+
+def test_timers_register_without_blocking(timers: _Timers) -> None:
+    async def run() -> None:
+        jobs: list[tuple] = []
+        adapter = _make_adapter(asyncio.get_running_loop(), jobs)
+        cb = lambda kwargs: None  # noqa: E731
+
+        once = adapter.run_in(cb, 5)
+        every = adapter.run_every(cb, "now+2", 10)
+        assert once != every
+        assert timers.later == []
+        await asyncio.sleep(0)
+        assert [delay for delay, _action in timers.later] == [5, 2]
+
+        # First call of run_every, then the interval takes over
+        timers.later[1][1](None)
+        assert timers.intervals == [10]
+        timers.later[0][1](None)
+        assert len(jobs) == 2
+        assert list(adapter._timer_meta) == [every]
+
+        adapter.cancel_timer(every)
+        await asyncio.sleep(0)
+        assert timers.removed == 1
+        assert adapter._timer_meta == {}
+
+    asyncio.run(run())
+
+
+def test_timer_cancelled_before_registration(timers: _Timers) -> None:
+    async def run() -> None:
+        adapter = _make_adapter(asyncio.get_running_loop(), [])
+        handle = adapter.run_in(lambda kwargs: None, 5)
+        adapter.cancel_timer(handle)
+        adapter.cancel_timer(handle)
+        await asyncio.sleep(0)
+        assert timers.later == []
+
+    asyncio.run(run())
+
+
+def test_panel_transition_timers_share_one_loop_hop(timers: _Timers) -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        adapter = _make_adapter(loop, [])
+        hops: list = []
+        original = loop.call_soon_threadsafe
+
+        def counting(fn: Any, *args: Any) -> Any:
+            hops.append(fn)
+            return original(fn, *args)
+
+        loop.call_soon_threadsafe = counting  # type: ignore[method-assign]
+        page = adapter.run_in(lambda kwargs: None, 10)
+        with loop_batch():
+            adapter.cancel_timer(page)
+            adapter.run_in(lambda kwargs: None, 10)
+            adapter.run_in(lambda kwargs: None, 300)
+            adapter.run_every(lambda kwargs: None, None, 1)
+        assert len(hops) == 2
+        await asyncio.sleep(0)
+        assert [delay for delay, _action in timers.later] == [10, 300]
+        assert timers.intervals == [1]
+
+    asyncio.run(run())
+
+
+def test_sleep_aware_timers_suspend_and_catch_up_once(timers: _Timers) -> None:
+    async def run() -> None:
+        jobs: list[tuple] = []
+        adapter = _make_adapter(asyncio.get_running_loop(), jobs)
+        page_tick = lambda kwargs: None  # noqa: E731
+        heartbeat = lambda kwargs: None  # noqa: E731
+        clock = lambda kwargs: None  # noqa: E731
+
+        adapter.run_every(page_tick, None, 1, sleep_aware=True)
+        adapter.run_every(heartbeat, None, 5)
+        await asyncio.sleep(0)
+        assert timers.intervals == [1, 5]
+
+        adapter.suspend_timers()
+        adapter.suspend_timers()
+        await asyncio.sleep(0)
+        # Only the page timer is removed
+        assert timers.removed == 1
+
+        adapter.resume_timers(catch_up=[clock])
+        adapter.resume_timers(catch_up=[clock])
+        await asyncio.sleep(0)
+        assert jobs == [((page_tick, clock),)]
+        assert timers.intervals == [1, 5, 1]
+
+    asyncio.run(run())
@@ -0,0 +1,40 @@
+"""Tests for HAUIEvent payload decoding."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from nspanel_haui.haui.abstract.haui_event import HAUIEvent
+from nspanel_haui.haui.mapping.const import RECV_BY_NAME, ESPEvent, ESPResponse
+
+
+def test_json_payload_parsed_once() -> None:
+    event = HAUIEvent(ESPResponse.RES_DEVICE_STATE, '{"tft_version": "1.2"}')
+    with patch("nspanel_haui.haui.abstract.haui_event.json.loads", wraps=json.loads) as loads:
+        first = event.as_json()
+        second = event.as_json()
+    assert first == {"tft_version": "1.2"}
+    assert second is first
+    assert loads.call_count == 1
+
+
+def test_invalid_payloads_fall_back() -> None:
+    assert HAUIEvent(ESPResponse.RES_DEVICE_STATE, "{broken").as_json() == {}
+    assert HAUIEvent(ESPResponse.RES_DEVICE_STATE, "").as_json() == {}
+    event = HAUIEvent(ESPEvent.PAGE, "x")
+    assert event.as_int() == 0
+    assert event.as_int(default=-1) == -1
+    assert HAUIEvent(ESPEvent.PAGE, "7").as_int() == 7
+
+
+def test_event_is_slotted() -> None:
+    event = HAUIEvent(ESPEvent.TOUCH, "1")
+    with pytest.raises(AttributeError):
+        event.extra = 1  # type: ignore[attr-defined]
+
+
+def test_recv_names_map_to_enum_members() -> None:
+    assert RECV_BY_NAME["esphome.page"] is ESPEvent.PAGE
+    assert RECV_BY_NAME[str(ESPResponse.READ_RESPONSE)] is ESPResponse.READ_RESPONSE
@@ -300,3 +300,29 @@ def test_extract_component_name_handles_component_and_string():
     page = _bare_page()
     assert page._extract_component_name(Component(42, "mycomp")) == "mycomp"
     assert page._extract_component_name("plain_string") == "plain_string"
+
+
+# --- pooled reuse ------------------------------------------------------------
+
+
+class _PreparedPage(HAUIPage):
+    def prepare(self):
+        self.items = []
+
+
+def test_reset_restores_a_new_page_but_keeps_its_plumbing():
+    page = _PreparedPage(FakePageApp(), {"page_id": 3})
+    display, debouncer, page_uuid = page.display, page.debouncer, page.id
+    page.items.append("light.a")
+    page._callback_map[1] = ("component", print, False)
+    page.state["scroll"] = 2
+
+    page.reset({"page_id": 5})
+
+    assert page.page_id == 5
+    assert page.items == []
+    assert page._callback_map == {}
+    assert page.state == {}
+    assert page.display is display
+    assert page.debouncer is debouncer
+    assert page.id == page_uuid
@@ -0,0 +1,121 @@
+"""Tests for the item display helpers: rendered fields and cached values."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from nspanel_haui.haui.utils import item as item_utils
+from nspanel_haui.haui.utils.item import (
+    DisplayCache,
+    get_item_color,
+    get_item_fields,
+    get_item_name,
+)
+
+
+class _Item:
+    def __init__(self, item_type: str, **config: Any) -> None:
+        self._item_type = item_type
+        self._config = config
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._config.get(key, default)
+
+    def get_item_type(self) -> str:
+        return self._item_type
+
+
+def test_fields_per_item_type() -> None:
+    assert get_item_fields(_Item("switch")) == {"state", "friendly_name", "device_class"}
+    light = get_item_fields(_Item("light"))
+    assert light is not None
+    assert {"brightness", "rgb_color"} <= light
+    media = get_item_fields(_Item("media_player"))
+    assert media is not None
+    assert "media_position" not in media
+
+
+def test_state_attribute_and_templates() -> None:
+    fields = get_item_fields(_Item("sensor", state="battery_level"))
+    assert fields is not None
+    assert "battery_level" in fields
+    assert get_item_fields(_Item("sensor", name="Kitchen", icon={"on": "lamp"})) is not None
+    assert get_item_fields(_Item("sensor", value="{{ state_attr('sensor.x', 'power') }}")) is None
+    assert get_item_fields(_Item("sensor", color={"on": "{{ 'red' }}"})) is None
+    assert get_item_fields(_Item("sensor", state='["forecast", 0, "temperature"]')) is None
+
+
+class _EntityItem:
+    """Item backed by a fake entity with a state version."""
+
+    def __init__(self, entity_id: str, state: str, attributes: dict, version: int) -> None:
+        self.entity = SimpleNamespace(state=state, attributes=attributes, last_updated=version)
+        self.entity_id = entity_id
+        self.locale = "en"
+
+    def get_item(self) -> Any:
+        return self.entity
+
+    def has_item(self) -> bool:
+        return True
+
+    def get_item_id(self) -> str:
+        return self.entity_id
+
+    def get_item_type(self) -> str:
+        return self.entity_id.split(".")[0]
+
+    def get_item_state(self) -> str:
+        return self.entity.state
+
+    def get_config_key(self) -> str:
+        return "{}"
+
+    def get_locale(self) -> str:
+        return self.locale
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> DisplayCache:
+    cache = DisplayCache(size=2)
+    monkeypatch.setattr(item_utils, "display_cache", cache)
+    return cache
+
+
+def test_values_cached_per_state_version(cache: DisplayCache) -> None:
+    lamp = _EntityItem("light.lamp", "on", {"friendly_name": "Lamp"}, version=1)
+    assert get_item_name(lamp, "") == "Lamp"
+    lamp.entity.attributes = {"friendly_name": "Renamed"}
+    # Same state version: served from the cache
+    assert get_item_name(lamp, "") == "Lamp"
+    # Another device showing the same entity shares the entry
+    other = _EntityItem("light.lamp", "on", {"friendly_name": "Lamp"}, version=1)
+    assert get_item_name(other, "") == "Lamp"
+    assert cache.as_dict() == {"entries": 1, "hits": 2, "misses": 1}
+
+    lamp.entity.last_updated = 2
+    assert get_item_name(lamp, "") == "Renamed"
+    lamp.locale = "de"
+    get_item_name(lamp, "")
+    # LRU: the oldest entry was evicted
+    assert cache.as_dict()["entries"] == 2
+    assert cache.misses == 3
+
+
+def test_color_keyed_by_theme_colors(cache: DisplayCache) -> None:
+    lamp = _EntityItem("light.lamp", "on", {}, version=1)
+    theme_a = {"entity_on": 1, "entity_off": 2, "entity_unavailable": 3}
+    theme_b = {"entity_on": 4, "entity_off": 2, "entity_unavailable": 3}
+    assert get_item_color(lamp, 0, color_getter=theme_a.__getitem__) == 1
+    assert get_item_color(lamp, 0, color_getter=dict(theme_a).__getitem__) == 1
+    assert get_item_color(lamp, 0, color_getter=theme_b.__getitem__) == 4
+    assert cache.hits == 1
+
+
+def test_items_without_entity_are_not_cached(cache: DisplayCache) -> None:
+    lamp = _EntityItem("light.lamp", "on", {"friendly_name": "Lamp"}, version=1)
+    lamp.entity.last_updated = None
+    get_item_name(lamp, "")
+    assert cache.as_dict() == {"entries": 0, "hits": 0, "misses": 0}
@@ -0,0 +1,60 @@
+"""Tests for grouping event loop calls into one hop per batch."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from nspanel_haui.haui.utils.loop_batch import call_soon, loop_batch
+
+
+class _Loop:
+    """Fake loop recording every wake-up."""
+
+    def __init__(self) -> None:
+        self.hops: list[tuple[Any, tuple]] = []
+
+    def call_soon_threadsafe(self, fn: Any, *args: Any) -> None:
+        self.hops.append((fn, args))
+
+    def run(self) -> None:
+        hops, self.hops = self.hops, []
+        for fn, args in hops:
+            fn(*args)
+
+
+def test_calls_outside_a_batch_hop_right_away() -> None:
+    loop = _Loop()
+    calls: list = []
+    call_soon(loop, calls.append, 1)  # type: ignore[arg-type]
+    call_soon(loop, calls.append, 2)  # type: ignore[arg-type]
+    assert len(loop.hops) == 2
+    loop.run()
+    assert calls == [1, 2]
+
+
+def test_nested_batches_submit_once_in_order() -> None:
+    loop = _Loop()
+    calls: list = []
+    with loop_batch():
+        call_soon(loop, calls.append, "register")  # type: ignore[arg-type]
+        with loop_batch():
+            call_soon(loop, calls.append, "cancel")  # type: ignore[arg-type]
+        assert loop.hops == []
+        call_soon(loop, calls.append, "register again")  # type: ignore[arg-type]
+    assert len(loop.hops) == 1
+    loop.run()
+    assert calls == ["register", "cancel", "register again"]
+
+
+def test_failing_call_does_not_stop_the_batch() -> None:
+    loop = _Loop()
+    calls: list = []
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    with loop_batch():
+        call_soon(loop, fail)  # type: ignore[arg-type]
+        call_soon(loop, calls.append, "after")  # type: ignore[arg-type]
+    loop.run()
+    assert calls == ["after"]
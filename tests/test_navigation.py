@@ -7,6 +7,7 @@ high-level navigation methods rather than exercising the full display stack.
 
 import time
 
+from nspanel_haui.haui.abstract.display_interface import DisplayShadow
 from nspanel_haui.haui.abstract.haui_event import HAUIEvent
 from nspanel_haui.haui.controller.navigation import HAUINavigationController
 from nspanel_haui.haui.mapping.const import ESPEvent
@@ -22,6 +23,8 @@ class DummyPanel:
 
 
 class FakePage:
+    EVENTS = None
+
     def __init__(self, page_id, started=False):
         self.page_id = page_id
         self.page_id_recv = None
@@ -290,6 +293,17 @@ def test_event_forwarded_to_active_page():
     assert event in page.events
 
 
+def test_event_not_forwarded_when_page_does_not_handle_it():
+    nav = _make_nav()
+    page = FakePage(page_id=1, started=True)
+    page.EVENTS = frozenset({ESPEvent.COMPONENT})
+    nav.page = page
+    nav.process_event(HAUIEvent(ESPEvent.TIMEOUT, "1"))
+    component = HAUIEvent(ESPEvent.COMPONENT, "1,2,1")
+    nav.process_event(component)
+    assert page.events == [component]
+
+
 # --- _open_panel_impl: same-page vs different-page rendering ---------------
 
 
@@ -434,6 +448,20 @@ def test_buffer_overflow_schedules_re_render():
     assert nav._buffer_overflow_timer is not None  # run_in returns "handle"
 
 
+def test_buffer_overflow_and_page_events_invalidate_display_shadow():
+    """Lost commands and page loads make the display shadow stale."""
+    nav = _make_nav()
+    nav.panel = DummyPanel("p1")
+    nav.page = FakePage(page_id=3, started=True)
+    nav.display.shadow = DisplayShadow()
+    nav.display.shadow.filter(['tTitle.txt="x"'])
+    nav.process_event(HAUIEvent(ESPEvent.BUFFER_OVERFLOW, "1"))
+    assert len(nav.display.shadow) == 0
+    nav.display.shadow.filter(['tTitle.txt="x"'])
+    nav.process_event(HAUIEvent(ESPEvent.PAGE, "3"))
+    assert len(nav.display.shadow) == 0
+
+
 def test_buffer_overflow_recover_refreshes_panel():
     """_buffer_overflow_recover refreshes the panel (no full set_panel batch)."""
     nav = _make_nav()
@@ -504,3 +532,34 @@ def test_buffer_overflow_backoff_resets_after_quiet_period():
     nav._last_overflow_ts = time.monotonic() - nav_module.OVERFLOW_RECOVERY_RESET - 1
     nav.process_event(HAUIEvent(ESPEvent.BUFFER_OVERFLOW, "1"))
     assert nav.app.run_in_delays == [nav_module.OVERFLOW_RECOVERY_DELAY]
+
+
+class PooledPage(OpenPage):
+    """OpenPage that records pool resets."""
+
+    def __init__(self, app, config):
+        super().__init__(app, config)
+        self.resets = []
+
+    def reset(self, config):
+        self.page_id = config.get("page_id")
+        self.resets.append(config)
+
+
+def test_open_panel_reuses_pooled_page_instance():
+    panel = OpenPanel("p1", panel_type="grid")
+    nav = _make_nav_for_open(panel, page_id=3)
+
+    with (
+        patch.object(nav_module, "get_page_id_for_panel", return_value=3),
+        patch.object(nav_module, "get_page_class_for_panel", return_value=PooledPage),
+    ):
+        nav._open_panel_impl("p1")
+        first = nav.page
+        nav._open_panel_impl("p1")
+
+    assert nav.page is first
+    assert first.resets == [{"page_id": 3}]
+
+    nav.stop_part()
+    assert nav._page_pool == {}
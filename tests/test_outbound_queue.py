@@ -0,0 +1,361 @@
+"""Tests for the per-device outbound command queue."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+from nspanel_haui.ha_adapter import ESPHomeProxy
+from nspanel_haui.haui.utils.command import CommandPriority, command_priority
+from nspanel_haui.outbound_queue import OutboundItem, OutboundQueue
+
+# ── Helpers ──────────────────────────────────────────────────────────────
+
+
+class _RecordingClient:
+    """Fake APIClient recording execute_service calls and their overlap."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: list[tuple[str, dict]] = []
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def execute_service(self, service: Any, data: dict) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.calls.append((service.name, data))
+        self.in_flight -= 1
+
+
+def _make_hass(loop: asyncio.AbstractEventLoop, client: _RecordingClient) -> Any:
+    services = {
+        1: SimpleNamespace(name="send_commands"),
+        2: SimpleNamespace(name="send_command"),
+        3: SimpleNamespace(name="goto_page"),
+    }
+    runtime_data = SimpleNamespace(available=True, client=client, services=services)
+    entry = SimpleNamespace(data={"device_name": "nspanel-test"}, runtime_data=runtime_data)
+    config_entries = SimpleNamespace(async_entries=lambda domain: [entry])
+    return SimpleNamespace(loop=loop, config_entries=config_entries, data={})
+
+
+async def _drain(queue: OutboundQueue) -> None:
+    # Let call_soon_threadsafe callbacks run, then wait for the writer.
+    for _ in range(100):
+        await asyncio.sleep(0)
+        if not queue.busy and len(queue) == 0:
+            return
+        await asyncio.sleep(0.01)
+
+
+# ── OutboundQueue ────────────────────────────────────────────────────────
+
+
+def test_items_delivered_in_order_one_at_a_time() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        sent: list[str] = []
+        in_flight = [0, 0]
+
+        async def send(name: str, value: Any) -> None:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.001)
+            sent.append(value)
+            in_flight[0] -= 1
+
+        queue = OutboundQueue(loop, send, label="dev")
+        for i in range(5):
+            queue.async_put(OutboundItem("play_sound", str(i)))
+        await _drain(queue)
+        assert sent == ["0", "1", "2", "3", "4"]
+        assert in_flight[1] == 1
+
+    asyncio.run(run())
+
+
+def test_put_from_thread_does_not_block() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        release = asyncio.Event()
+        sent: list[str] = []
+
+        async def send(name: str, value: Any) -> None:
+            await release.wait()
+            sent.append(value)
+
+        queue = OutboundQueue(loop, send, label="dev")
+        t = threading.Thread(target=lambda: [queue.put("play_sound", v) for v in "abc"])
+        t.start()
+        # The producer returns although nothing has been delivered yet
+        await loop.run_in_executor(None, t.join, 1.0)
+        assert not t.is_alive()
+        assert sent == []
+        release.set()
+        await _drain(queue)
+        assert sent == ["a", "b", "c"]
+
+    asyncio.run(run())
+
+
+def test_failed_and_timed_out_items_do_not_stop_writer() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        sent: list[str] = []
+
+        async def send(name: str, value: Any) -> None:
+            if value == "boom":
+                raise RuntimeError("boom")
+            if value == "slow":
+                await asyncio.sleep(1)
+            sent.append(value)
+
+        queue = OutboundQueue(loop, send, label="dev", timeout=0.01)
+        for value in ("a", "boom", "slow", "b"):
+            queue.async_put(OutboundItem("play_sound", value))
+        await _drain(queue)
+        assert sent == ["a", "b"]
+
+    asyncio.run(run())
+
+
+def test_full_queue_drops_oldest() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        sent: list[str] = []
+
+        async def send(name: str, value: Any) -> None:
+            sent.append(value)
+
+        queue = OutboundQueue(loop, send, label="dev", max_pending=2)
+        for value in ("a", "b", "c"):
+            queue.async_put(OutboundItem("play_sound", value))
+        await _drain(queue)
+        assert sent == ["b", "c"]
+
+    asyncio.run(run())
+
+
+def test_close_drops_pending_and_ignores_new_items() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        sent: list[str] = []
+
+        async def send(name: str, value: Any) -> None:
+            sent.append(value)
+
+        queue = OutboundQueue(loop, send, label="dev")
+        queue.async_put(OutboundItem("send_command", "a"))
+        queue.async_close()
+        queue.async_put(OutboundItem("send_command", "b"))
+        await _drain(queue)
+        assert sent == []
+        assert len(queue) == 0
+
+    asyncio.run(run())
+
+
+# ── ESPHomeProxy.publish ─────────────────────────────────────────────────
+
+
+def test_proxy_publish_serializes_chunks_through_client() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        client = _RecordingClient(delay=0.001)
+        proxy = ESPHomeProxy(_make_hass(loop, client), loop, device_name="nspanel-test")
+
+        def produce() -> None:
+            proxy.publish("send_commands", ["a.txt=\"1\""])
+            proxy.publish("goto_page", "3")
+            proxy.publish("send_command", "ref 0")
+
+        await loop.run_in_executor(None, produce)
+        await _drain(proxy._outbound)
+        assert client.calls == [
+            ("send_commands", {"commands": ["a.txt=\"1\""]}),
+            ("goto_page", {"page": "3"}),
+            ("send_command", {"cmd": "ref 0"}),
+        ]
+        assert client.max_in_flight == 1
+
+    asyncio.run(run())
+
+
+def test_proxy_reports_send_commands_round_trips_to_pacer() -> None:
+    class Pacer:
+        max_len = 2048
+        max_cmds = 400
+
+        def __init__(self) -> None:
+            self.recorded: list[list[str]] = []
+
+        def record_delivery(self, cmds: list[str], rtt: float) -> float:
+            self.recorded.append(cmds)
+            return 0.001
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        client = _RecordingClient()
+        proxy = ESPHomeProxy(_make_hass(loop, client), loop, device_name="nspanel-test")
+        proxy.pacer = Pacer()
+        proxy.publish("send_commands", ["a.txt=\"1\""])
+        proxy.publish("goto_page", "3")
+        await _drain(proxy._outbound)
+        assert proxy.pacer.recorded == [["a.txt=\"1\""]]
+        assert len(client.calls) == 2
+
+    asyncio.run(run())
+
+
+# ── Priority lanes ───────────────────────────────────────────────────────
+
+
+def _collecting_queue(loop: asyncio.AbstractEventLoop) -> tuple[OutboundQueue, list]:
+    sent: list[tuple[str, Any]] = []
+
+    async def send(name: str, value: Any) -> None:
+        sent.append((name, value))
+
+    return OutboundQueue(loop, send, label="dev"), sent
+
+
+def test_interactive_batches_overtake_background() -> None:
+    async def run() -> None:
+        queue, sent = _collecting_queue(asyncio.get_running_loop())
+        queue.async_put(OutboundItem("send_commands", ["clock.txt=1"], CommandPriority.BACKGROUND))
+        queue.async_put(OutboundItem("send_commands", ["grid.txt=1"], CommandPriority.NORMAL))
+        queue.async_put(OutboundItem("send_commands", ["btn.pco=1"], CommandPriority.INTERACTIVE))
+        await _drain(queue)
+        assert [value for _name, value in sent] == [["btn.pco=1"], ["grid.txt=1"], ["clock.txt=1"]]
+
+    asyncio.run(run())
+
+
+def test_newer_batch_supersedes_lower_priority_writes() -> None:
+    async def run() -> None:
+        queue, sent = _collecting_queue(asyncio.get_running_loop())
+        queue.async_put(
+            OutboundItem(
+                "send_commands", ["btn.pco=1", "tTime.txt=1"], CommandPriority.BACKGROUND
+            )
+        )
+        queue.async_put(OutboundItem("send_commands", ["btn.pco=2"], CommandPriority.BACKGROUND))
+        queue.async_put(OutboundItem("send_command", "btn.pco=3", CommandPriority.INTERACTIVE))
+        await _drain(queue)
+        # The stale pco writes never reach the display after the newer one
+        assert sent == [("send_command", "btn.pco=3"), ("send_commands", ["tTime.txt=1"])]
+        assert queue.superseded == 2
+
+    asyncio.run(run())
+
+
+def test_barrier_is_not_overtaken_and_goto_page_drops_background() -> None:
+    async def run() -> None:
+        queue, sent = _collecting_queue(asyncio.get_running_loop())
+        queue.async_put(OutboundItem("send_commands", ["old.txt=1"], CommandPriority.BACKGROUND))
+        queue.async_put(OutboundItem("send_commands", ["old.bco=1"], CommandPriority.NORMAL))
+        queue.async_put(OutboundItem("goto_page", "5"))
+        queue.async_put(OutboundItem("send_commands", ["new.txt=1"], CommandPriority.INTERACTIVE))
+        await _drain(queue)
+        assert sent == [
+            ("send_commands", ["old.bco=1"]),
+            ("goto_page", "5"),
+            ("send_commands", ["new.txt=1"]),
+        ]
+        assert len(queue) == 0
+
+    asyncio.run(run())
+
+
+def test_proxy_publish_uses_thread_priority() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        client = _RecordingClient()
+        proxy = ESPHomeProxy(_make_hass(loop, client), loop, device_name="nspanel-test")
+        release = asyncio.Event()
+        original = proxy._outbound._send
+
+        async def gated(name: str, value: Any) -> None:
+            await release.wait()
+            await original(name, value)
+
+        proxy._outbound._send = gated
+
+        # occupies the writer
+        await loop.run_in_executor(None, proxy.publish, "send_command", "first.txt=1")
+        while not proxy._outbound.busy:
+            await asyncio.sleep(0)
+
+        def produce() -> None:
+            with command_priority(CommandPriority.BACKGROUND):
+                proxy.publish("send_command", "clock.txt=1")
+            with command_priority(CommandPriority.INTERACTIVE):
+                proxy.publish("send_command", "btn.pco=1")
+
+        await loop.run_in_executor(None, produce)
+        release.set()
+        await _drain(proxy._outbound)
+        assert [data["cmd"] for _name, data in client.calls] == [
+            "first.txt=1",
+            "btn.pco=1",
+            "clock.txt=1",
+        ]
+
+    asyncio.run(run())
+
+
+# ── Frames ───────────────────────────────────────────────────────────────
+
+
+def test_frame_merges_batches_with_last_write_wins() -> None:
+    async def run() -> None:
+        queue, sent = _collecting_queue(asyncio.get_running_loop())
+        queue.frame_window = 0.02
+        queue.async_put(OutboundItem("send_commands", ["a.txt=1", "b.txt=1"]))
+        queue.async_put(OutboundItem("send_command", "badge.txt=3"))
+        queue.async_put(OutboundItem("send_commands", ["a.txt=2"]))
+        await _drain(queue)
+        assert sent == [("send_commands", ["b.txt=1", "badge.txt=3", "a.txt=2"])]
+        assert queue.coalesced == 2
+
+    asyncio.run(run())
+
+
+def test_frame_does_not_delay_interactive_items() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        queue, sent = _collecting_queue(loop)
+        queue.frame_window = 10.0
+        queue.async_put(OutboundItem("send_commands", ["grid.txt=1"]))
+        await asyncio.sleep(0.01)
+        queue.async_put(OutboundItem("send_commands", ["btn.pco=1"], CommandPriority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+        assert sent == [("send_commands", ["btn.pco=1"])]
+        # A barrier closes the frame of the batches queued before it
+        queue.async_put(OutboundItem("goto_page", "2"))
+        await _drain(queue)
+        assert sent[1:] == [("send_commands", ["grid.txt=1"]), ("goto_page", "2")]
+
+    asyncio.run(run())
+
+
+def test_frame_merge_respects_chunk_limits() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        sent: list[Any] = []
+
+        async def send(name: str, value: Any) -> None:
+            sent.append(value)
+
+        queue = OutboundQueue(loop, send, label="dev", limits=lambda: (1000, 3))
+        queue.frame_window = 0.01
+        for i in range(5):
+            queue.async_put(OutboundItem("send_commands", [f"c{i}.txt=1", f"c{i}.pco=1"]))
+        await _drain(queue)
+        assert [len(value) for value in sent] == [2, 2, 2, 2, 2]
+
+    asyncio.run(run())
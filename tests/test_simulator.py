@@ -0,0 +1,95 @@
+"""Tests for the simulated NSPanel device."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from nspanel_haui.ha_adapter import ESPHomeProxy
+from nspanel_haui.haui.mapping.const import ESP_NS_EVENT, ESPEvent
+from nspanel_haui.haui.utils.adaptive_chunker import UART_BAUD
+from nspanel_haui.simulator import (
+    CMD_EXEC_TIME,
+    PAGE_LOAD_TIME,
+    NextionSimulator,
+    SimulatedESPHomeDevice,
+)
+
+
+def test_drain_time_follows_uart_rate() -> None:
+    sim = NextionSimulator()
+    sim.execute("send_commands", {"commands": ["t0.txt=1"] * 10})
+    # 8 characters + 3 terminator bytes, 10 bits each
+    expected = 10 * 11 * 10 / UART_BAUD + CMD_EXEC_TIME
+    assert abs(sim.idle_at - expected) < 1e-9
+    sim.run_until_idle()
+    assert sim.components == {"t0.txt": "1"}
+    assert sim.stats["commands"] == 10
+
+
+def test_goto_page_is_acknowledged_after_page_load() -> None:
+    sim = NextionSimulator()
+    sim.execute("goto_page", {"page": "3"})
+    assert sim.advance(0.01) == []
+    events = sim.run_until_idle()
+    assert [(e.name, e.value) for e in events] == [(ESPEvent.PAGE, "3")]
+    assert events[0].t > PAGE_LOAD_TIME
+    assert sim.page == 3
+
+
+def test_page_load_overflows_nextion_buffer() -> None:
+    received: list = []
+    # A slow page load: the UART keeps delivering while the Nextion is busy
+    sim = NextionSimulator(page_time=0.2, on_event=received.append)
+    sim.command("page 1")
+    for i in range(100):
+        sim.command(f"t{i}.txt=\"{'x' * 40}\"")
+    sim.run_until_idle()
+    assert sim.stats["overflows"] > 0
+    assert any(e.name == ESPEvent.BUFFER_OVERFLOW for e in received)
+    # Writes that did fit were executed on the new page
+    assert sim.page == 1
+    assert "t0.txt" in sim.components
+    assert len(sim.components) == 100 - sim.stats["overflows"]
+
+
+def test_full_esp_queue_drops_commands() -> None:
+    sim = NextionSimulator(queue_size=5)
+    accepted = [sim.command("n0.val=1") for _ in range(8)]
+    assert accepted.count(False) == 3
+    assert sim.stats["queue_dropped"] == 3
+    sim.run_until_idle()
+    # The queue drained, new commands are accepted again
+    assert sim.command("n0.val=2")
+
+
+def test_simulated_device_behind_esphome_proxy() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        fired: list[tuple[str, dict]] = []
+        bus = SimpleNamespace(async_fire=lambda event_type, data: fired.append((event_type, data)))
+        entries: list = []
+        hass: Any = SimpleNamespace(
+            loop=loop,
+            bus=bus,
+            data={},
+            config_entries=SimpleNamespace(async_entries=lambda domain: entries),
+        )
+        device = SimulatedESPHomeDevice(hass, "nspanel-sim", device_id="dev1", speed=10.0)
+        entries.append(device.entry)
+
+        proxy = ESPHomeProxy(hass, loop, device_name="nspanel-sim")
+        proxy.publish("goto_page", "2")
+        proxy.publish("send_commands", ["t0.txt=\"a\"", "vis b0,1"])
+        for _ in range(100):
+            await asyncio.sleep(0.005)
+            if fired:
+                break
+        page_event = {"name": "esphome.page", "value": "2", "device_id": "dev1"}
+        assert fired == [(ESP_NS_EVENT, page_event)]
+        await asyncio.sleep(0.01)
+        assert device.sim.components == {"t0.txt": "\"a\"", "vis b0": "1"}
+        proxy.close()
+
+    asyncio.run(run())
@@ -0,0 +1,139 @@
+"""Tests for the hub-wide shared entity state subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from nspanel_haui.state_mux import StateMux, StateSubscription, get_state_mux
+
+
+@pytest.fixture
+def trackers(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    trackers: dict[str, Any] = {}
+
+    def track(hass: Any, entity_id: str, action: Any) -> Any:
+        assert entity_id not in trackers
+        trackers[entity_id] = action
+        return lambda: trackers.pop(entity_id)
+
+    event_module = types.ModuleType("homeassistant.helpers.event")
+    event_module.async_track_state_change_event = track  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "homeassistant.helpers.event", event_module)
+    monkeypatch.setattr(sys.modules["homeassistant.core"], "callback", lambda fn: fn, raising=False)
+    return trackers
+
+
+def test_one_tracker_per_entity_fans_out(trackers: dict[str, Any]) -> None:
+    async def run() -> None:
+        hass = SimpleNamespace(loop=asyncio.get_running_loop(), data={})
+        mux = get_state_mux(hass)
+        assert get_state_mux(hass) is mux
+        first: list = []
+        second: list = []
+        a = StateSubscription(["light.a", "light.b"], first.append)
+        b = StateSubscription(["light.a"], second.append)
+        mux.async_add(a)
+        mux.async_add(b)
+        assert sorted(trackers) == ["light.a", "light.b"]
+        assert mux.refcount("light.a") == 2
+
+        trackers["light.a"]("event")
+        assert first == ["event"]
+        assert second == ["event"]
+
+        mux.async_discard(a, "light.a")
+        trackers["light.a"]("event2")
+        assert first == ["event"]
+        assert second == ["event", "event2"]
+        assert mux.tracked == 2
+
+    asyncio.run(run())
+
+
+def test_unused_tracker_lingers_and_is_reused(trackers: dict[str, Any]) -> None:
+    async def run() -> None:
+        hass = SimpleNamespace(loop=asyncio.get_running_loop(), data={})
+        mux = StateMux(hass, linger=0.05)
+        page = StateSubscription(["light.a"], lambda event: None)
+        mux.async_add(page)
+        mux.async_remove(page)
+        assert "light.a" in trackers
+        assert mux.as_dict()["lingering"] == 1
+
+        # A quick panel flip back reuses the tracker
+        await asyncio.sleep(0.01)
+        again = StateSubscription(["light.a"], lambda event: None)
+        mux.async_add(again)
+        await asyncio.sleep(0.08)
+        assert "light.a" in trackers
+        assert mux.tracked == 1
+
+        mux.async_remove(again)
+        await asyncio.sleep(0.08)
+        assert trackers == {}
+        assert mux.released == 1
+
+    asyncio.run(run())
+
+
+def test_close_removes_every_tracker(trackers: dict[str, Any]) -> None:
+    async def run() -> None:
+        hass = SimpleNamespace(loop=asyncio.get_running_loop(), data={})
+        mux = StateMux(hass)
+        mux.async_add(StateSubscription(["light.a", "switch.b"], lambda event: None))
+        mux.async_close()
+        assert trackers == {}
+        assert mux.as_dict()["entities"] == 0
+
+    asyncio.run(run())
+
+
+def test_last_hub_unload_closes_shared_services(trackers: dict[str, Any]) -> None:
+    from nspanel_haui import async_unload_entry
+    from nspanel_haui.clock_service import get_clock_service
+    from nspanel_haui.endpoint_index import get_endpoint_index
+    from nspanel_haui.event_demux import get_event_demux
+    from nspanel_haui.timer_service import get_timer_service
+
+    async def run() -> None:
+        listeners: list = []
+
+        def listen(event_type: str, action: Any) -> Any:
+            listeners.append(event_type)
+            return lambda: listeners.remove(event_type)
+
+        async def unload_platforms(entry: Any, platforms: Any) -> bool:
+            return True
+
+        hass = SimpleNamespace(
+            loop=asyncio.get_running_loop(),
+            data={"nspanel_haui": {"hub_a": {}, "hub_b": {}}},
+            bus=SimpleNamespace(async_listen=listen),
+            config_entries=SimpleNamespace(async_unload_platforms=unload_platforms),
+        )
+        get_state_mux(hass).async_add(StateSubscription(["light.a"], lambda event: None))
+        get_event_demux(hass).async_subscribe("esphome.event", "dev1", lambda event: None)
+        timer = get_timer_service(hass).call_later(60, lambda: None)
+        get_clock_service(hass).subscribe("minute", lambda cb_args: None)
+        get_endpoint_index(hass)
+        await asyncio.sleep(0)
+
+        assert await async_unload_entry(hass, SimpleNamespace(entry_id="hub_a"))
+        # Another hub still uses the shared services
+        assert trackers and listeners
+        assert get_clock_service(hass)._timers
+
+        clock = get_clock_service(hass)
+        assert await async_unload_entry(hass, SimpleNamespace(entry_id="hub_b"))
+        assert trackers == {}
+        assert listeners == []
+        assert timer.cancelled
+        assert clock._timers == {}
+        assert set(hass.data["nspanel_haui"]) == set()
+
+    asyncio.run(run())
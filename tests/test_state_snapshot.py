@@ -0,0 +1,74 @@
+"""Tests for render-scoped entity state snapshots."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from nspanel_haui.ha_adapter import ItemProxy
+from nspanel_haui.haui.utils.state_snapshot import begin_snapshot, current_snapshot, end_snapshot
+
+
+class _States:
+    def __init__(self) -> None:
+        self.states: dict[str, Any] = {}
+        self.reads = 0
+
+    def get(self, entity_id: str) -> Any:
+        self.reads += 1
+        return self.states.get(entity_id)
+
+
+def _proxy(states: _States, entity_id: str) -> ItemProxy:
+    return ItemProxy(SimpleNamespace(states=states), None, entity_id)  # type: ignore[arg-type]
+
+
+def test_snapshots_nest_per_render_pass() -> None:
+    assert current_snapshot() is None
+    begin_snapshot()
+    outer = current_snapshot()
+    begin_snapshot()
+    assert current_snapshot() is outer
+    end_snapshot()
+    assert current_snapshot() is outer
+    end_snapshot()
+    assert current_snapshot() is None
+    # Unbalanced exits are harmless
+    end_snapshot()
+    assert current_snapshot() is None
+
+
+def test_reads_share_one_state_per_render_pass() -> None:
+    states = _States()
+    attrs = {"friendly_name": "Lamp", "brightness": 128}
+    states.states["light.a"] = SimpleNamespace(state="on", attributes=attrs)
+    proxy = _proxy(states, "light.a")
+
+    begin_snapshot()
+    try:
+        assert proxy.state == "on"
+        assert proxy.attributes["brightness"] == 128
+        assert _proxy(states, "light.a").attributes["friendly_name"] == "Lamp"
+        # A newer state is not seen until the next pass
+        states.states["light.a"] = SimpleNamespace(state="off", attributes={})
+        assert proxy.state == "on"
+        assert _proxy(states, "light.missing").state is None
+        assert _proxy(states, "light.missing").attributes == {}
+        assert states.reads == 2
+    finally:
+        end_snapshot()
+
+    assert proxy.state == "off"
+    assert states.reads == 3
+
+
+def test_attributes_are_a_read_only_view() -> None:
+    states = _States()
+    attrs = {"brightness": 128}
+    states.states["light.a"] = SimpleNamespace(state="on", attributes=attrs)
+    view = _proxy(states, "light.a").attributes
+    with pytest.raises(TypeError):
+        view["brightness"] = 1  # type: ignore[index]
+    attrs["brightness"] = 255
+    assert view["brightness"] == 255
@@ -0,0 +1,113 @@
+"""Tests for per-device transport telemetry."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from nspanel_haui.haui.abstract.display_interface import DisplayInterface, DisplayShadow
+from nspanel_haui.haui.utils.command import CommandPriority
+from nspanel_haui.haui.utils.telemetry import NO_PAGE, TransportTelemetry
+from nspanel_haui.outbound_queue import OutboundItem, OutboundQueue
+
+
+class RecordingTransport:
+    def __init__(self, telemetry: TransportTelemetry) -> None:
+        self.telemetry = telemetry
+        self.sent: list = []
+
+    def send(self, command, value) -> None:
+        self.sent.append((command, value))
+        self.telemetry.record_send(value if isinstance(value, list) else [value])
+
+
+async def _drain(queue: OutboundQueue) -> None:
+    for _ in range(100):
+        await asyncio.sleep(0)
+        if not queue.busy and len(queue) == 0:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_counts_are_kept_per_page_type() -> None:
+    telemetry = TransportTelemetry()
+    telemetry.record_send(["t0.txt=\"a\"", "vis b0,1"])
+    telemetry.set_page_type("grid")
+    telemetry.record_send(["t0.txt=\"ä\""])
+    telemetry.count("dedup_drops", 3)
+    telemetry.count("timeouts", 0)
+
+    status = telemetry.as_dict()
+    assert status["page_type"] == "grid"
+    assert status["total"]["commands"] == 3
+    assert status["total"]["chunks"] == 2
+    assert status["total"]["bytes"] == 10 + 8 + 11
+    assert status["pages"][NO_PAGE]["commands"] == 2
+    assert status["pages"]["grid"]["dedup_drops"] == 3
+    assert status["total"]["timeouts"] == 0
+
+
+def test_latency_percentiles_and_reset() -> None:
+    telemetry = TransportTelemetry(samples=100)
+    for ms in range(1, 101):
+        telemetry.record_publish(ms / 1000)
+    latency = telemetry.as_dict()["total"]["latency_ms"]
+    assert latency["count"] == 100
+    assert latency["p50"] == 51.0
+    assert latency["p99"] == 100.0
+    assert latency["max"] == 100.0
+    histogram = telemetry.as_dict()["total"]["latency_histogram"]
+    assert histogram["<=5"] == 5
+    assert histogram["<=100"] == 50
+    assert sum(histogram.values()) == 100
+
+    telemetry.reset()
+    status = telemetry.as_dict()
+    assert status["total"]["publishes"] == 0
+    assert status["total"]["latency_ms"]["p50"] is None
+    assert status["pages"] == {}
+
+
+def test_display_interface_counts_shadow_drops() -> None:
+    telemetry = TransportTelemetry()
+    transport = RecordingTransport(telemetry)
+    display = DisplayInterface(transport, shadow=DisplayShadow(), telemetry=telemetry)
+    display.send_cmds(["t0.txt=\"a\"", "t1.txt=\"b\""])
+    display.send_cmds(["t0.txt=\"a\"", "t1.txt=\"c\""])
+    display.send_cmd("t0.txt=\"a\"")
+    total = telemetry.as_dict()["total"]
+    assert total["shadow_drops"] == 2
+    assert total["commands"] == 3
+    assert total["chunks"] == 2
+
+
+def test_outbound_queue_records_publishes_and_losses() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        telemetry = TransportTelemetry()
+
+        async def send(name: str, value: Any) -> bool | None:
+            if value == "fail":
+                raise RuntimeError("boom")
+            if value == "slow":
+                await asyncio.sleep(1)
+            return value != "offline"
+
+        queue = OutboundQueue(loop, send, label="dev", timeout=0.05)
+        queue.telemetry = telemetry
+        for value in ("ok", "fail", "slow", "offline"):
+            queue.async_put(OutboundItem("play_sound", value))
+        await _drain(queue)
+        # Superseded background writes are counted as well
+        queue.async_put(OutboundItem("send_commands", ["t0.txt=1"], CommandPriority.BACKGROUND))
+        queue.async_put(OutboundItem("send_commands", ["t0.txt=2"], CommandPriority.INTERACTIVE))
+        await _drain(queue)
+
+        total = telemetry.as_dict()["total"]
+        assert total["publishes"] == 2
+        assert total["latency_ms"]["count"] == 2
+        assert total["errors"] == 1
+        assert total["timeouts"] == 1
+        assert total["superseded"] == 1
+
+    asyncio.run(run())
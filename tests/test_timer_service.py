@@ -0,0 +1,77 @@
+"""Tests for the hub-wide event loop timers and their users."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from nspanel_haui.haui.utils.command import CommandPriority, current_priority
+from nspanel_haui.haui.utils.debounce import Debouncer
+from nspanel_haui.haui.utils.notification_blinker import NotificationBlinker
+from nspanel_haui.timer_service import TimerService, get_timer_service
+
+
+def _make_hass(loop: asyncio.AbstractEventLoop) -> Any:
+    return SimpleNamespace(
+        loop=loop,
+        data={},
+        async_add_executor_job=lambda fn, *args: loop.run_in_executor(None, fn, *args),
+    )
+
+
+def test_call_later_runs_on_executor_in_background_lane() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        service = get_timer_service(_make_hass(loop))
+        assert get_timer_service(service._hass) is service
+        calls: list = []
+        service.call_later(0.01, lambda: calls.append(current_priority()))
+        cancelled = service.call_later(0.01, lambda: calls.append("cancelled"))
+        cancelled.cancel()
+        await asyncio.sleep(0.05)
+        assert calls == [CommandPriority.BACKGROUND]
+        assert service.as_dict() == {"scheduled": 1, "fired": 1}
+
+    asyncio.run(run())
+
+
+def test_debouncer_uses_timer_service_without_threads() -> None:
+    async def run() -> None:
+        service = TimerService(_make_hass(asyncio.get_running_loop()))
+        debouncer = Debouncer(delay=0.01, timers=service)
+        calls: list = []
+        for i in range(5):
+            debouncer.call("refresh", lambda i=i: calls.append(i))
+        debouncer.call("other", lambda: calls.append("other"))
+        debouncer.cancel("other")
+        await asyncio.sleep(0.05)
+        assert calls == [4]
+        assert service.fired == 1
+
+    asyncio.run(run())
+
+
+class _Timers:
+    def __init__(self) -> None:
+        self.scheduled: list = []
+
+    def call_later(self, delay: float, func: Any) -> Any:
+        handle = SimpleNamespace(func=func, cancelled=False)
+        handle.cancel = lambda: setattr(handle, "cancelled", True)
+        self.scheduled.append(handle)
+        return handle
+
+
+def test_blinker_ticks_through_timer_service() -> None:
+    timers = _Timers()
+    refreshes: list = []
+    blinker = NotificationBlinker(lambda: refreshes.append(1), timers=timers)
+    blinker.handle_event("NOTIF_ADD")
+    assert len(refreshes) == 1
+    assert len(timers.scheduled) == 1
+    timers.scheduled[-1].func()
+    assert len(refreshes) == 2
+    assert len(timers.scheduled) == 2
+    blinker.stop()
+    assert timers.scheduled[-1].cancelled
@@ -0,0 +1,87 @@
+"""Tests for the recording, replay and null display transports."""
+
+from __future__ import annotations
+
+import io
+
+from nspanel_haui.haui.abstract.display_interface import DisplayInterface, DisplayTransport
+from nspanel_haui.haui.mapping.const import ESPCommand
+from nspanel_haui.haui.utils.transports import (
+    CapturedSend,
+    NullTransport,
+    RecordingTransport,
+    ReplayTransport,
+    iter_capture,
+    load_capture,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_null_transport_counts() -> None:
+    null = NullTransport()
+    assert isinstance(null, DisplayTransport)
+    display = DisplayInterface(null)
+    display.send_cmds(["t0.txt=\"a\"", "vis b0,1"])
+    display.send_cmd("page 1")
+    assert null.sends == 2
+    assert null.commands == 3
+    assert null.chars == len("t0.txt=\"a\"") + len("vis b0,1") + len("page 1")
+    assert null.by_command == {ESPCommand.SEND_COMMANDS: 1, ESPCommand.SEND_COMMAND: 1}
+    null.reset()
+    assert null.commands == 0
+
+
+def test_recording_transport_writes_capture_and_forwards() -> None:
+    clock = FakeClock()
+    inner = NullTransport()
+    fp = io.StringIO()
+    recorder = RecordingTransport(fp, inner=inner, clock=clock)
+    recorder.send(ESPCommand.SEND_COMMAND, "page 1")
+    clock.now += 0.25
+    recorder.send("send_commands", ["t0.txt=\"ä\"", "ref 0"])
+    assert inner.sends == 2
+    records = list(iter_capture(fp.getvalue().splitlines()))
+    assert records == [
+        CapturedSend(0.0, "esphome.send_command", "page 1"),
+        CapturedSend(0.25, "send_commands", ["t0.txt=\"ä\"", "ref 0"]),
+    ]
+
+
+def test_recording_to_path_and_replay_roundtrip(tmp_path) -> None:
+    path = tmp_path / "capture.jsonl"
+    clock = FakeClock()
+    with RecordingTransport(path, clock=clock) as recorder:
+        for i in range(3):
+            recorder.send("send_command", f"n0.val={i}")
+            clock.now += 1.0
+    capture = load_capture(path)
+    assert [r.t for r in capture] == [0.0, 1.0, 2.0]
+
+    target = NullTransport()
+    replay_clock = FakeClock()
+    replay = ReplayTransport(target, speed=4.0, sleep=replay_clock.sleep, clock=replay_clock)
+    assert replay.replay(path) == 3
+    assert target.commands == 3
+    # Two one-second gaps replayed four times faster
+    assert abs(replay_clock.now - 100.5) < 1e-9
+
+
+def test_replay_without_pacing() -> None:
+    slept: list[float] = []
+    target = NullTransport()
+    replay = ReplayTransport(target, speed=0, sleep=slept.append)
+    capture = [CapturedSend(t, "send_command", "ref 0") for t in (0.0, 5.0, 10.0)]
+    assert replay.replay(capture) == 3
+    assert slept == []
+    replay.send("send_command", "cls 0")
+    assert target.sends == 4